@@ -0,0 +1,249 @@
+"""
+Simulation Monte Carlo pour calculer Pi - FRONT-END ASYNCIO
+
+Appeler monte_carlo_pi_multi ou monte_carlo_pi_multiprocessing depuis une
+coroutine bloque la boucle d'événements. Ce module expose une coroutine
+estimate_pi qui :
+- Découpe le calcul en blocs confiés à un exécuteur partagé (threads par
+  défaut, les noyaux NumPy libèrent le GIL)
+- Laisse la boucle libre : de nombreuses requêtes peuvent s'exécuter en
+  même temps sur le même exécuteur
+- Limite le nombre de blocs en vol par requête : une annulation retire
+  immédiatement les blocs en attente, seuls les blocs déjà démarrés
+  terminent (au plus un bloc par worker)
+- Reste reproductible : le bloc k utilise toujours le k-ième flux dérivé
+  de la graine, quel que soit l'ordre d'exécution
+"""
+
+import os
+import time
+import asyncio
+import argparse
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from monte_carlo_core import (
+    DEFAULT_BATCH_SIZE, DEFAULT_CHUNK_SIZE, KERNELS, count_inside, iter_batch_sizes, make_rng
+)
+
+
+# Nombre de blocs en vol par requête et par worker de l'exécuteur
+IN_FLIGHT_PER_WORKER = 2
+
+# Exécuteur partagé par toutes les requêtes (créé à la demande)
+_executor = None
+
+
+def get_executor(max_workers=None):
+    """
+    Retourne l'exécuteur de threads partagé, en le créant au besoin.
+
+    Args:
+        max_workers: Nombre de threads à la création (défaut: nombre de cœurs)
+
+    Returns:
+        ThreadPoolExecutor partagé par toutes les requêtes
+    """
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=max_workers or os.cpu_count() or 1,
+                                       thread_name_prefix='monte-carlo')
+    return _executor
+
+
+def shutdown_executor():
+    """Arrête l'exécuteur partagé (les blocs en attente sont abandonnés)."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=True, cancel_futures=True)
+        _executor = None
+
+
+def executor_workers(executor):
+    """
+    Retourne le nombre de workers d'un exécuteur.
+
+    ThreadPoolExecutor et ProcessPoolExecutor exposent ce nombre dans
+    _max_workers ; pour un autre exécuteur, le nombre de cœurs.
+
+    Args:
+        executor: Exécuteur concurrent.futures
+
+    Returns:
+        Nombre de workers
+    """
+    return getattr(executor, '_max_workers', None) or os.cpu_count() or 1
+
+
+def count_chunk(kernel, iterations, seed_sequence, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Compte les points dans le cercle pour un bloc indépendant.
+
+    Fonction de module (sérialisable) : utilisable aussi bien avec un
+    ThreadPoolExecutor qu'avec un ProcessPoolExecutor.
+
+    Args:
+        kernel: Noyau de calcul (voir KERNELS)
+        iterations: Nombre de points du bloc
+        seed_sequence: SeedSequence propre à ce bloc
+        chunk_size: Taille des blocs pour les noyaux vectorisés
+
+    Returns:
+        Nombre de points dans le cercle
+    """
+    return count_inside(kernel, iterations, make_rng(kernel, seed_sequence), chunk_size)
+
+
+async def estimate_pi(iterations, kernel='numpy', seed=None, block_size=DEFAULT_BATCH_SIZE,
+                      chunk_size=DEFAULT_CHUNK_SIZE, executor=None, max_in_flight=None,
+                      stats=None):
+    """
+    Calcule Pi sans bloquer la boucle d'événements.
+
+    L'annulation de la tâche (task.cancel(), asyncio.wait_for, ...) annule
+    les blocs pas encore démarrés ; le CPU est libéré dès la fin des blocs
+    en cours.
+
+    Args:
+        iterations: Nombre total de points
+        kernel: Noyau de calcul (défaut: numpy, qui libère le GIL)
+        seed: Graine pour un run reproductible (défaut: aléatoire)
+        block_size: Nombre de points par bloc soumis à l'exécuteur
+        chunk_size: Taille des blocs pour les noyaux vectorisés
+        executor: Exécuteur à utiliser (défaut: exécuteur de threads partagé)
+        max_in_flight: Nombre maximal de blocs soumis à la fois
+            (défaut: IN_FLIGHT_PER_WORKER par worker de l'exécuteur utilisé)
+        stats: Dict optionnel, rempli avec 'inside' et 'iterations'
+
+    Returns:
+        Estimation de Pi
+    """
+    loop = asyncio.get_running_loop()
+    if executor is None:
+        executor = get_executor()
+    if max_in_flight is None:
+        max_in_flight = IN_FLIGHT_PER_WORKER * executor_workers(executor)
+
+    # spawn(1) successifs : le k-ième bloc reçoit toujours le k-ième flux,
+    # sans matérialiser la liste de tous les flux (mémoire constante)
+    root = np.random.SeedSequence(seed)
+    inside = 0
+    pending = set()
+    try:
+        for n in iter_batch_sizes(block_size, iterations):
+            if len(pending) >= max_in_flight:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                inside += sum(f.result() for f in done)
+            pending.add(loop.run_in_executor(
+                executor, count_chunk, kernel, n, root.spawn(1)[0], chunk_size
+            ))
+        if pending:
+            done, pending = await asyncio.wait(pending)
+            inside += sum(f.result() for f in done)
+    finally:
+        # Annulation ou erreur : les blocs pas encore démarrés sont retirés
+        # de la file de l'exécuteur
+        for future in pending:
+            future.cancel()
+
+    if stats is not None:
+        stats['inside'] = inside
+        stats['iterations'] = iterations
+
+    return 4 * inside / iterations
+
+
+async def run_demo(num_requests, iterations, kernel, seed, cancel_after):
+    """
+    Lance plusieurs requêtes concurrentes, dont une annulée en cours de route.
+
+    Args:
+        num_requests: Nombre de requêtes simultanées
+        iterations: Nombre de points par requête
+        kernel: Noyau de calcul
+        seed: Graine de base (la requête i utilise seed + i)
+        cancel_after: Délai avant l'annulation d'une requête supplémentaire (secondes)
+
+    Returns:
+        Tuple (liste des dicts de résultats par requête, durée de
+        l'annulation en secondes)
+    """
+    async def timed(request_id):
+        start = time.perf_counter()
+        request_seed = None if seed is None else seed + request_id
+        pi_estimate = await estimate_pi(iterations, kernel, request_seed)
+        return {'request': request_id, 'pi_estimate': pi_estimate,
+                'execution_time': time.perf_counter() - start}
+
+    tasks = [asyncio.create_task(timed(i)) for i in range(num_requests)]
+
+    # Requête volontairement annulée : elle doit s'arrêter sans attendre
+    # la fin de ses itérations
+    victim = asyncio.create_task(estimate_pi(iterations * 100, kernel, seed))
+    await asyncio.sleep(cancel_after)
+    cancel_start = time.perf_counter()
+    victim.cancel()
+    try:
+        await victim
+    except asyncio.CancelledError:
+        pass
+    cancel_time = time.perf_counter() - cancel_start
+
+    results = await asyncio.gather(*tasks)
+    return results, cancel_time
+
+
+def main():
+    """Fonction principale de la démonstration asyncio."""
+    parser = argparse.ArgumentParser(description='Simulation Monte Carlo - Front-end asyncio')
+    parser.add_argument('--requests', type=int, default=4,
+                        help='Nombre de requêtes concurrentes (défaut: 4)')
+    parser.add_argument('--iterations', type=int, default=10_000_000,
+                        help='Nombre d\'itérations par requête (défaut: 10,000,000)')
+    parser.add_argument('--kernel', choices=KERNELS, default='numpy',
+                        help='Noyau de calcul (défaut: numpy)')
+    parser.add_argument('--seed', type=int, default=None,
+                        help='Graine pour un run reproductible (défaut: aléatoire)')
+    parser.add_argument('--cancel-after', type=float, default=0.1,
+                        help='Délai avant annulation de la requête témoin (défaut: 0.1 s)')
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("SIMULATION MONTE CARLO - FRONT-END ASYNCIO")
+    print("=" * 60)
+    print(f"Requêtes concurrentes : {args.requests}")
+    print(f"Itérations/requête    : {args.iterations:,}")
+    print(f"Noyau                 : {args.kernel}")
+    print("Démarrage du calcul...")
+    print()
+
+    start_time = time.perf_counter()
+    try:
+        results, cancel_time = asyncio.run(run_demo(
+            args.requests, args.iterations, args.kernel, args.seed, args.cancel_after
+        ))
+    finally:
+        shutdown_executor()
+    execution_time = time.perf_counter() - start_time
+
+    print("=" * 60)
+    print("RÉSULTATS")
+    print("=" * 60)
+    for result in results:
+        print(f"Requête {result['request']:<3}: Pi ≈ {result['pi_estimate']:.8f} "
+              f"({result['execution_time']:.4f} s)")
+    print(f"Annulation effective   : {cancel_time:.4f} secondes")
+    print(f"Temps total            : {execution_time:.4f} secondes")
+    print(f"Itérations/seconde     : {args.requests * args.iterations / execution_time:,.0f}")
+    print("=" * 60)
+
+    return {
+        'requests': results,
+        'cancel_time': cancel_time,
+        'execution_time': execution_time,
+        'kernel': args.kernel,
+        'seed': args.seed
+    }
+
+
+if __name__ == "__main__":
+    main()
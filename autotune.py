@@ -0,0 +1,218 @@
+"""
+Calibration automatique des moteurs pour la machine courante.
+
+Au lieu de supposer os.cpu_count() workers, cette commande mesure pour
+chaque moteur :
+- Le débit pour 1, 2, 4, ... workers, le nombre de cœurs physiques, le
+  nombre de cœurs logiques (effet du SMT / hyper-threading) et le double
+  (sur-souscription)
+- Puis, au meilleur nombre de workers, plusieurs tailles de bloc
+
+La meilleure configuration de chaque moteur est enregistrée dans le profil
+de la machine (host_profile.py) ; estimate_pi et le mode 'auto' l'utilisent
+ensuite comme configuration par défaut.
+"""
+
+import os
+import time
+import argparse
+import statistics
+import multiprocessing as mp
+from datetime import datetime, timezone
+from monte_carlo_core import DEFAULT_CHUNK_SIZE, KERNELS
+from backends import BACKENDS, available_backends, estimate_pi, shutdown_pool
+from host_profile import host_fingerprint, host_info, physical_cpu_count, profile_path, save_profile
+
+
+# Moteurs calibrés par défaut (les autres peuvent être demandés explicitement)
+DEFAULT_TUNED_BACKENDS = ('numpy', 'thread', 'process')
+
+# Tailles de bloc essayées pour les noyaux vectorisés
+CHUNK_SIZE_CANDIDATES = (16_384, 65_536, 262_144, 1_048_576)
+
+# Points par mesure et nombre de répétitions (médiane)
+DEFAULT_CALIBRATION_ITERATIONS = 4_000_000
+DEFAULT_CALIBRATION_REPEATS = 3
+
+
+def worker_candidates(logical=None, physical=None):
+    """
+    Liste les nombres de workers à essayer.
+
+    Args:
+        logical: Nombre de cœurs logiques (défaut: os.cpu_count())
+        physical: Nombre de cœurs physiques (défaut: détecté)
+
+    Returns:
+        Liste triée : puissances de 2, cœurs physiques, cœurs logiques
+        et sur-souscription (2 × cœurs logiques)
+    """
+    logical = logical or os.cpu_count() or 1
+    physical = physical or physical_cpu_count()
+    candidates = {physical, logical, 2 * logical}
+    n = 1
+    while n < logical:
+        candidates.add(n)
+        n *= 2
+    return sorted(candidates)
+
+
+def measure_throughput(backend, iterations, workers, kernel, chunk_size, repeats):
+    """
+    Mesure le débit d'une configuration (médiane de plusieurs runs).
+
+    Args:
+        backend: Nom du moteur
+        iterations: Points par run
+        workers: Nombre de workers (None pour un moteur séquentiel)
+        kernel: Noyau de calcul
+        chunk_size: Taille des blocs
+        repeats: Nombre de runs mesurés
+
+    Returns:
+        Débit médian en points par seconde
+    """
+    # Run non mesuré : démarre les ressources persistantes du moteur
+    estimate_pi(min(iterations, 100_000), backend, workers, kernel, chunk_size=chunk_size)
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        estimate_pi(iterations, backend, workers, kernel, chunk_size=chunk_size)
+        times.append(time.perf_counter() - start)
+    return iterations / statistics.median(times)
+
+
+def calibrate_backend(backend, kernel='numpy', iterations=DEFAULT_CALIBRATION_ITERATIONS,
+                      repeats=DEFAULT_CALIBRATION_REPEATS):
+    """
+    Cherche la meilleure configuration d'un moteur.
+
+    Recherche par coordonnées : d'abord le nombre de workers (taille de
+    bloc par défaut), puis la taille de bloc au meilleur nombre de workers.
+
+    Args:
+        backend: Nom du moteur
+        kernel: Noyau de calcul
+        iterations: Points par mesure
+        repeats: Runs mesurés par configuration
+
+    Returns:
+        Dict {'workers', 'chunk_size', 'throughput', 'measurements'}
+    """
+    measurements = []
+
+    def measure(workers, chunk_size):
+        throughput = measure_throughput(backend, iterations, workers, kernel, chunk_size, repeats)
+        measurements.append({'workers': workers, 'chunk_size': chunk_size,
+                             'throughput': throughput})
+        print(f"  workers={str(workers or 1):>3}  chunk={chunk_size:>9,}  "
+              f"{throughput:>15,.0f} pts/s")
+        return throughput
+
+    try:
+        counts = worker_candidates() if BACKENDS[backend].parallel else [None]
+        best_workers = max(counts, key=lambda w: measure(w, DEFAULT_CHUNK_SIZE))
+
+        best_chunk = DEFAULT_CHUNK_SIZE
+        if kernel != 'python':
+            for chunk_size in CHUNK_SIZE_CANDIDATES:
+                if chunk_size != DEFAULT_CHUNK_SIZE:
+                    measure(best_workers, chunk_size)
+            best_chunk = max((m for m in measurements if m['workers'] == best_workers),
+                             key=lambda m: m['throughput'])['chunk_size']
+    finally:
+        shutdown_pool()
+
+    best = max((m for m in measurements
+                if m['workers'] == best_workers and m['chunk_size'] == best_chunk),
+               key=lambda m: m['throughput'])
+    return {
+        'workers': best_workers,
+        'chunk_size': best_chunk,
+        'throughput': best['throughput'],
+        'measurements': measurements
+    }
+
+
+def calibrate(backends=DEFAULT_TUNED_BACKENDS, kernel='numpy',
+              iterations=DEFAULT_CALIBRATION_ITERATIONS, repeats=DEFAULT_CALIBRATION_REPEATS):
+    """
+    Calibre plusieurs moteurs et construit le profil de la machine.
+
+    Args:
+        backends: Noms des moteurs à calibrer
+        kernel: Noyau de calcul
+        iterations: Points par mesure
+        repeats: Runs mesurés par configuration
+
+    Returns:
+        Dict du profil (à enregistrer avec host_profile.save_profile)
+    """
+    info = host_info()
+    print("=" * 60)
+    print("CALIBRATION DES MOTEURS")
+    print("=" * 60)
+    print(f"Empreinte de l'hôte  : {host_fingerprint(info)}")
+    print(f"Cœurs logiques       : {info['logical_cpus']}")
+    print(f"Cœurs physiques      : {info['physical_cpus']}"
+          f"{' (SMT actif)' if info['logical_cpus'] > info['physical_cpus'] else ''}")
+    print(f"Noyau                : {kernel}")
+    print(f"Points par mesure    : {iterations:,} (médiane de {repeats} runs)")
+
+    tuned = {}
+    for backend in backends:
+        print(f"\n🔄 Moteur {backend}...")
+        tuned[f"{backend}:{kernel}"] = calibrate_backend(backend, kernel, iterations, repeats)
+
+    return {
+        'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'host': info,
+        'iterations': iterations,
+        'repeats': repeats,
+        'backends': tuned
+    }
+
+
+def main():
+    """Calibre les moteurs et enregistre le profil de la machine."""
+    parser = argparse.ArgumentParser(description='Calibration des moteurs pour cette machine')
+    parser.add_argument('--backends', nargs='+', choices=available_backends(),
+                        default=list(DEFAULT_TUNED_BACKENDS),
+                        help=f'Moteurs à calibrer (défaut: {" ".join(DEFAULT_TUNED_BACKENDS)})')
+    parser.add_argument('--kernel', choices=KERNELS, default='numpy',
+                        help='Noyau de calcul (défaut: numpy)')
+    parser.add_argument('--iterations', type=int, default=DEFAULT_CALIBRATION_ITERATIONS,
+                        help=f'Points par mesure (défaut: {DEFAULT_CALIBRATION_ITERATIONS:,})')
+    parser.add_argument('--repeats', type=int, default=DEFAULT_CALIBRATION_REPEATS,
+                        help=f'Runs mesurés par configuration (défaut: {DEFAULT_CALIBRATION_REPEATS})')
+    parser.add_argument('--profile', default=None,
+                        help='Fichier des profils (défaut: MONTE_CARLO_PROFILE ou ~/.cache) ; '
+                             'un autre fichier n\'est lu que via MONTE_CARLO_PROFILE')
+    args = parser.parse_args()
+
+    profile = calibrate(args.backends, args.kernel, args.iterations, args.repeats)
+    path = save_profile(profile, args.profile)
+
+    print("\n" + "=" * 60)
+    print("PROFIL RETENU")
+    print("=" * 60)
+    print(f"{'Moteur':<22} {'Workers':<9} {'Bloc':<11} {'Débit (pts/s)':>15}")
+    print("-" * 60)
+    for key, config in profile['backends'].items():
+        print(f"{key:<22} {str(config['workers'] or 1):<9} {config['chunk_size']:<11,} "
+              f"{config['throughput']:>15,.0f}")
+    print("=" * 60)
+    print(f"\n✅ Profil enregistré dans : {path}")
+    # estimate_pi ne lit que MONTE_CARLO_PROFILE ou le fichier par défaut
+    active_path = profile_path()
+    if active_path is None or os.path.abspath(path) != os.path.abspath(active_path):
+        print("⚠️  Ce fichier n'est pas celui lu par estimate_pi ; pour l'utiliser :")
+        print(f"    export MONTE_CARLO_PROFILE={os.path.abspath(path)}")
+
+    return profile
+
+
+if __name__ == "__main__":
+    # Nécessaire pour Windows
+    mp.freeze_support()
+    main()
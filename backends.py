@@ -0,0 +1,323 @@
+"""
+Registre des moteurs de calcul et point d'entrée unique estimate_pi.
+
+Chaque version du projet (mono-thread, multi-thread, multiprocessing, ...)
+est enregistrée ici sous un nom de moteur. Tous les moteurs s'appellent de
+la même façon :
+
+    estimate_pi(iterations, backend='thread', workers=4, kernel='numpy')
+
+Le mode 'auto' choisit le moteur et le nombre de workers à partir du
+nombre d'itérations et du profil de la machine (autotune.py), ou à défaut
+du nombre de cœurs. Les scripts de
+benchmark (comparison.py, cpu_monitor.py) parcourent le registre au lieu de
+connaître chaque version.
+"""
+
+import os
+import atexit
+import argparse
+import time
+import multiprocessing as mp
+from collections import namedtuple
+from monte_carlo_core import DEFAULT_CHUNK_SIZE, KERNELS
+from mono_thread import monte_carlo_pi_mono
+from multi_thread import monte_carlo_pi_multi
+from multiprocessing_version import MonteCarloPool
+from distributed import monte_carlo_pi_distributed_local
+from subinterpreters import count_inside_subinterpreters, engine_for
+from jit_kernel import jit_available, monte_carlo_pi_jit
+from host_profile import best_tuned_backend, tuned_config
+
+
+# Description d'un moteur enregistré
+Backend = namedtuple('Backend', ['name', 'func', 'description', 'parallel', 'default_kernel'])
+
+# Registre nom -> Backend (ordre d'enregistrement conservé)
+BACKENDS = {}
+
+# En dessous de ce nombre de points par worker, paralléliser ne paie pas
+AUTO_MIN_ITERATIONS_PER_WORKER = 2_000_000
+
+# Pool de processus réutilisé d'un appel à l'autre (créé à la demande)
+_pool = None
+
+
+def register_backend(name, func, description, parallel=True, default_kernel='python'):
+    """
+    Enregistre un moteur de calcul.
+
+    La fonction reçoit (iterations, workers, seed, kernel, chunk_size) et
+    retourne l'estimation de Pi ; `workers` vaut None pour un moteur
+    séquentiel.
+
+    Args:
+        name: Nom du moteur (utilisé par estimate_pi et les CLI)
+        func: Fonction de calcul
+        description: Description courte affichée par les CLI
+        parallel: Le moteur utilise-t-il plusieurs workers
+        default_kernel: Noyau utilisé quand aucun n'est demandé
+
+    Returns:
+        Le Backend enregistré
+    """
+    backend = Backend(name, func, description, parallel, default_kernel)
+    BACKENDS[name] = backend
+    return backend
+
+
+def available_backends():
+    """
+    Retourne les noms des moteurs enregistrés.
+
+    Returns:
+        Liste des noms, dans l'ordre d'enregistrement
+    """
+    return list(BACKENDS)
+
+
+def get_pool(workers, kernel, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Retourne un pool de processus persistant, recréé si la configuration change.
+
+    Les appels répétés (benchmarks, service) ne paient le démarrage des
+    processus qu'une fois.
+
+    Args:
+        workers: Nombre de processus
+        kernel: Noyau de calcul des workers
+        chunk_size: Taille des blocs pour les noyaux vectorisés
+
+    Returns:
+        MonteCarloPool démarré
+    """
+    global _pool
+    if _pool is not None and (_pool.num_processes, _pool.kernel, _pool.chunk_size) != \
+            (workers, kernel, chunk_size):
+        shutdown_pool()
+    if _pool is None:
+        _pool = MonteCarloPool(workers, kernel, chunk_size).start()
+    return _pool
+
+
+def shutdown_pool():
+    """Arrête le pool de processus persistant, s'il existe."""
+    global _pool
+    if _pool is not None:
+        _pool.close()
+        _pool = None
+
+
+atexit.register(shutdown_pool)
+
+
+def _run_mono(iterations, workers, seed, kernel, chunk_size):
+    """Moteur séquentiel (mono_thread.py)."""
+    return monte_carlo_pi_mono(iterations, kernel, chunk_size, seed)
+
+
+def _run_thread(iterations, workers, seed, kernel, chunk_size):
+    """Moteur multi-thread (multi_thread.py)."""
+    return monte_carlo_pi_multi(iterations, workers, seed, kernel, chunk_size)
+
+
+def _run_process(iterations, workers, seed, kernel, chunk_size):
+    """Moteur multiprocessing sur le pool persistant."""
+    return get_pool(workers, kernel, chunk_size).estimate(iterations, seed)
+
+
+def _run_distributed(iterations, workers, seed, kernel, chunk_size):
+    """Moteur distribué : coordinateur et workers TCP locaux."""
+    return monte_carlo_pi_distributed_local(iterations, workers, seed, kernel=kernel)
+
+
+def _run_subinterp(iterations, workers, seed, kernel, chunk_size):
+    """Moteur sous-interpréteurs (subinterpreters.py), repli thread ou processus."""
+    engine = engine_for(kernel)
+    if engine == 'thread':
+        return _run_thread(iterations, workers, seed, kernel, chunk_size)
+    if engine == 'process':
+        return _run_process(iterations, workers, seed, kernel, chunk_size)
+    return 4 * count_inside_subinterpreters(iterations, workers, seed) / iterations
+
+
+def _run_jit(iterations, workers, seed, kernel, chunk_size):
+    """Noyau compilé parallèle (prange) ; sans Numba, moteur multi-thread."""
+    if kernel != 'jit' or not jit_available():
+        return _run_thread(iterations, workers, seed, kernel, chunk_size)
+    return monte_carlo_pi_jit(iterations, workers, seed, chunk_size)
+
+
+register_backend('mono', _run_mono, 'Boucle séquentielle (mono_thread.py)', parallel=False)
+register_backend('numpy', _run_mono, 'Noyau NumPy vectorisé sur un cœur', parallel=False,
+                 default_kernel='numpy')
+register_backend('thread', _run_thread, 'Threads (multi_thread.py)')
+register_backend('process', _run_process, 'Pool de processus persistant (multiprocessing_version.py)')
+register_backend('distributed', _run_distributed, 'Coordinateur + workers TCP locaux (distributed.py)')
+register_backend('subinterp', _run_subinterp,
+                 'Sous-interpréteurs, un GIL par worker (subinterpreters.py, expérimental)')
+register_backend('jit', _run_jit, 'Boucle compilée Numba, nogil + prange (jit_kernel.py, optionnel)',
+                 default_kernel='jit')
+
+
+def choose_backend(iterations, cpu_count=None):
+    """
+    Choisit un moteur et un nombre de workers pour le mode 'auto'.
+
+    Les petits calculs restent sur un seul cœur avec le noyau NumPy. Au-delà,
+    la taille du calcul borne le nombre de workers (AUTO_MIN_ITERATIONS_PER_WORKER
+    points chacun au moins) et la configuration la plus rapide du profil de
+    la machine sous cette borne est retenue s'il existe ; sinon, des threads
+    NumPy : le noyau est 20 à 50 fois plus rapide que la boucle Python et
+    libère le GIL, sans le coût de démarrage des processus.
+
+    Args:
+        iterations: Nombre de points à générer
+        cpu_count: Nombre de cœurs (défaut: os.cpu_count())
+
+    Returns:
+        Tuple (nom du moteur, nombre de workers ou None, noyau)
+    """
+    cpu_count = cpu_count or os.cpu_count() or 1
+    workers = min(cpu_count, iterations // AUTO_MIN_ITERATIONS_PER_WORKER)
+    if workers <= 1:
+        return 'numpy', None, 'numpy'
+    
+    best = best_tuned_backend(max_workers=workers)
+    if best is not None and best[0] in BACKENDS:
+        backend, kernel, config = best
+        return backend, config['workers'], kernel
+    return 'thread', workers, 'numpy'
+
+
+def resolve_backend(iterations, backend='auto', workers=None, kernel=None):
+    """
+    Résout 'auto' et les valeurs par défaut d'un appel à estimate_pi.
+
+    Args:
+        iterations: Nombre total de points à générer
+        backend: Nom d'un moteur enregistré, ou 'auto'
+        workers: Nombre de threads / processus (défaut: profil de la
+            machine, sinon nombre de CPU)
+        kernel: Noyau de calcul (défaut: le noyau calibré pour ce moteur
+            dans le profil, sinon celui du moteur)
+
+    Returns:
+        Tuple (nom du moteur, nombre de workers ou None, noyau)
+    """
+    if backend == 'auto':
+        backend, auto_workers, auto_kernel = choose_backend(iterations)
+        workers = workers or auto_workers
+        kernel = kernel or auto_kernel
+    if backend not in BACKENDS:
+        raise ValueError(f"Moteur inconnu : {backend!r} (choix : auto, {', '.join(BACKENDS)})")
+
+    entry = BACKENDS[backend]
+    if kernel is None:
+        # Le profil n'a de configuration que pour le noyau calibré (numpy par défaut)
+        tuned = best_tuned_backend(backend=backend)
+        kernel = tuned[1] if tuned is not None else entry.default_kernel
+    if kernel not in KERNELS:
+        raise ValueError(f"Noyau inconnu : {kernel!r} (choix : {', '.join(KERNELS)})")
+    if entry.parallel:
+        if workers is None:
+            config = tuned_config(backend, kernel)
+            workers = config['workers'] if config else os.cpu_count() or 4
+    else:
+        workers = None
+    return backend, workers, kernel
+
+
+def estimate_pi(iterations, backend='auto', workers=None, kernel=None, seed=None,
+                chunk_size=None):
+    """
+    Calcule Pi avec le moteur demandé.
+
+    Args:
+        iterations: Nombre total de points à générer
+        backend: Nom d'un moteur enregistré, ou 'auto'
+        workers: Nombre de threads / processus (défaut: profil de la
+            machine, sinon nombre de CPU)
+        kernel: Noyau de calcul (défaut: le noyau calibré pour ce moteur
+            dans le profil, sinon celui du moteur)
+        seed: Graine pour un run reproductible (défaut: aléatoire)
+        chunk_size: Taille des blocs pour les noyaux vectorisés (défaut:
+            profil de la machine, sinon DEFAULT_CHUNK_SIZE)
+
+    Returns:
+        Estimation de Pi
+    """
+    backend, workers, kernel = resolve_backend(iterations, backend, workers, kernel)
+    if chunk_size is None:
+        config = tuned_config(backend, kernel)
+        chunk_size = config['chunk_size'] if config else DEFAULT_CHUNK_SIZE
+    return BACKENDS[backend].func(iterations, workers, seed, kernel, chunk_size)
+
+
+def main():
+    """Calcule Pi avec un moteur choisi par son nom."""
+    parser = argparse.ArgumentParser(description='Simulation Monte Carlo - Moteur au choix')
+    parser.add_argument('--iterations', type=int, default=10_000_000,
+                        help='Nombre d\'itérations (défaut: 10,000,000)')
+    parser.add_argument('--backend', choices=['auto'] + available_backends(), default='auto',
+                        help='Moteur de calcul (défaut: auto)')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Nombre de threads / processus (défaut: selon le moteur)')
+    parser.add_argument('--kernel', choices=KERNELS, default=None,
+                        help='Noyau de calcul (défaut: noyau calibré du profil, sinon '
+                             'celui du moteur)')
+    parser.add_argument('--seed', type=int, default=None,
+                        help='Graine pour un run reproductible (défaut: aléatoire)')
+    parser.add_argument('--list', action='store_true',
+                        help='Affiche les moteurs enregistrés et quitte')
+    args = parser.parse_args()
+
+    if args.list:
+        for backend in BACKENDS.values():
+            kind = 'parallèle' if backend.parallel else 'séquentiel'
+            print(f"{backend.name:<12} {kind:<11} {backend.description}")
+        return None
+
+    backend, workers, kernel = resolve_backend(args.iterations, args.backend, args.workers,
+                                               args.kernel)
+
+    print("=" * 60)
+    print("SIMULATION MONTE CARLO - MOTEUR AU CHOIX")
+    print("=" * 60)
+    print(f"Nombre d'itérations  : {args.iterations:,}")
+    print(f"Moteur               : {backend}{' (auto)' if args.backend == 'auto' else ''}")
+    print(f"Workers              : {workers or 1}")
+    print(f"Noyau                : {kernel}")
+    print("Démarrage du calcul...")
+    print()
+
+    start_time = time.perf_counter()
+    pi_estimate = estimate_pi(args.iterations, backend, workers, kernel, args.seed)
+    execution_time = time.perf_counter() - start_time
+
+    print("=" * 60)
+    print("RÉSULTATS")
+    print("=" * 60)
+    print(f"Estimation de Pi     : {pi_estimate:.8f}")
+    print(f"Valeur réelle de Pi  : {3.14159265:.8f}")
+    print(f"Erreur               : {abs(pi_estimate - 3.14159265):.8f}")
+    print(f"Temps d'exécution    : {execution_time:.4f} secondes")
+    print(f"Itérations/seconde   : {args.iterations / execution_time:,.0f}")
+    print("=" * 60)
+
+    return {
+        'pi_estimate': pi_estimate,
+        'execution_time': execution_time,
+        'iterations': args.iterations,
+        'backend': backend,
+        'workers': workers,
+        'kernel': kernel,
+        'seed': args.seed,
+        'iterations_per_second': args.iterations / execution_time
+    }
+
+
+if __name__ == "__main__":
+    # Nécessaire pour Windows
+    mp.freeze_support()
+    main()
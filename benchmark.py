@@ -0,0 +1,372 @@
+"""
+Harnais de mesure des benchmarks.
+
+Un run isolé chronométré avec time.time() ne dit pas grand-chose : le
+premier run paie les caches froids, la fréquence CPU varie, un autre
+processus peut voler du temps. Ce module mesure proprement :
+- Runs de chauffe configurables, exécutés mais non retenus
+- Temps mural avec time.perf_counter_ns (horloge monotone, résolution ns)
+- Temps CPU du processus et de ses enfants (workers multiprocessing) à côté
+  du temps mural : leur rapport donne le nombre de cœurs réellement occupés
+- Détection des valeurs aberrantes (barrières de Tukey sur l'IQR)
+- Médiane, écart interquartile et intervalle de confiance bootstrap de la
+  médiane, robustes aux quelques runs perturbés
+- Test de Mann-Whitney pour comparer deux séries de runs sans supposer
+  de loi normale
+"""
+
+import os
+import math
+import time
+import statistics
+import numpy as np
+
+
+# Runs de chauffe par défaut avant les runs mesurés
+DEFAULT_WARMUP_RUNS = 1
+
+# Rééchantillonnages bootstrap et niveau de confiance par défaut
+DEFAULT_BOOTSTRAP_RESAMPLES = 2000
+DEFAULT_CONFIDENCE = 0.95
+
+# Coefficient des barrières de Tukey : aberrant hors de [Q1 - k·IQR, Q3 + k·IQR]
+OUTLIER_FENCE = 1.5
+
+# Au-delà de ce nombre de couples (n1 · n2), ou avec des ex aequo, le test
+# de Mann-Whitney utilise l'approximation normale au lieu de la loi exacte
+MANN_WHITNEY_EXACT_MAX_PAIRS = 2500
+
+
+def cpu_snapshot():
+    """
+    Relève le temps CPU consommé jusqu'ici.
+
+    Les enfants terminés sont comptés par os.times ; les enfants encore
+    vivants (pool de processus persistant) par psutil, s'il est installé.
+    Un enfant vivant au premier relevé et terminé au second est compté une
+    seule fois : son temps passe simplement de psutil à os.times.
+
+    Returns:
+        Tuple (CPU du processus, CPU des enfants) en secondes
+    """
+    times = os.times()
+    children = times.children_user + times.children_system
+    try:
+        import psutil
+        for child in psutil.Process().children(recursive=True):
+            try:
+                child_times = child.cpu_times()
+                children += child_times.user + child_times.system
+            except psutil.Error:
+                pass
+    except ImportError:
+        pass
+    return times.user + times.system, children
+
+
+def time_call(func):
+    """
+    Exécute une fonction et mesure temps mural et temps CPU.
+
+    Args:
+        func: Fonction sans argument à mesurer
+
+    Returns:
+        Tuple (valeur retournée, dict {'wall_time', 'cpu_time',
+        'children_cpu_time'} en secondes)
+    """
+    cpu_start, children_start = cpu_snapshot()
+    start = time.perf_counter_ns()
+    result = func()
+    wall_ns = time.perf_counter_ns() - start
+    cpu_end, children_end = cpu_snapshot()
+    return result, {
+        'wall_time': wall_ns / 1e9,
+        'cpu_time': cpu_end - cpu_start,
+        'children_cpu_time': max(0.0, children_end - children_start)
+    }
+
+
+def quartiles(values):
+    """
+    Calcule le premier quartile, la médiane et le troisième quartile.
+
+    Args:
+        values: Valeurs mesurées
+
+    Returns:
+        Tuple (Q1, médiane, Q3)
+    """
+    if len(values) < 2:
+        value = values[0]
+        return value, value, value
+    q1, median, q3 = statistics.quantiles(values, n=4, method='inclusive')
+    return q1, median, q3
+
+
+def find_outliers(values, fence=OUTLIER_FENCE):
+    """
+    Repère les valeurs aberrantes avec les barrières de Tukey.
+
+    Args:
+        values: Valeurs mesurées
+        fence: Coefficient k des barrières (1.5 : classique, 3 : extrême)
+
+    Returns:
+        Indices des valeurs hors de [Q1 - k·IQR, Q3 + k·IQR]
+    """
+    q1, _, q3 = quartiles(values)
+    low = q1 - fence * (q3 - q1)
+    high = q3 + fence * (q3 - q1)
+    return [i for i, value in enumerate(values) if value < low or value > high]
+
+
+def bootstrap_ci(values, statistic=np.median, confidence=DEFAULT_CONFIDENCE,
+                 resamples=DEFAULT_BOOTSTRAP_RESAMPLES, seed=0):
+    """
+    Intervalle de confiance bootstrap (méthode des percentiles).
+
+    Args:
+        values: Valeurs mesurées
+        statistic: Statistique à encadrer, appliquée selon axis=1
+        confidence: Niveau de confiance (ex: 0.95)
+        resamples: Nombre de rééchantillonnages
+        seed: Graine du rééchantillonnage (intervalle reproductible)
+
+    Returns:
+        Tuple (borne basse, borne haute)
+    """
+    values = np.asarray(values, dtype=float)
+    if len(values) < 2:
+        return float(values[0]), float(values[0])
+    rng = np.random.default_rng(seed)
+    samples = rng.choice(values, size=(resamples, len(values)), replace=True)
+    estimates = statistic(samples, axis=1)
+    alpha = (1 - confidence) / 2
+    low, high = np.quantile(estimates, [alpha, 1 - alpha])
+    return float(low), float(high)
+
+
+def speedup_ci(reference_times, times, confidence=DEFAULT_CONFIDENCE,
+               resamples=DEFAULT_BOOTSTRAP_RESAMPLES, seed=0):
+    """
+    Speedup médian et son intervalle de confiance bootstrap.
+
+    Les deux séries sont rééchantillonnées indépendamment ; le speedup de
+    chaque tirage est le rapport des médianes.
+
+    Args:
+        reference_times: Temps de la configuration de référence
+        times: Temps de la configuration comparée
+        confidence: Niveau de confiance
+        resamples: Nombre de rééchantillonnages
+        seed: Graine du rééchantillonnage
+
+    Returns:
+        Tuple (speedup, borne basse, borne haute)
+    """
+    speedup = statistics.median(reference_times) / statistics.median(times)
+    rng = np.random.default_rng(seed)
+    reference = rng.choice(np.asarray(reference_times, dtype=float),
+                           size=(resamples, len(reference_times)))
+    measured = rng.choice(np.asarray(times, dtype=float), size=(resamples, len(times)))
+    ratios = np.median(reference, axis=1) / np.median(measured, axis=1)
+    alpha = (1 - confidence) / 2
+    low, high = np.quantile(ratios, [alpha, 1 - alpha])
+    return speedup, float(low), float(high)
+
+
+def _mann_whitney_exact_cdf(u, n1, n2):
+    """P(U ≤ u) sous l'hypothèse nulle, par dénombrement (sans ex aequo)."""
+    # counts[j][k] : nombre d'arrangements de i valeurs de la 1re série et
+    # j de la 2e donnant U = k, construit ligne par ligne (i = 0 .. n1)
+    counts = [[1] for _ in range(n2 + 1)]
+    for i in range(1, n1 + 1):
+        row = [[1]]
+        for j in range(1, n2 + 1):
+            # La plus grande valeur vient de la 1re série (+j couples) ou de la 2e
+            from_first = [0] * j + counts[j]
+            from_second = row[j - 1]
+            size = max(len(from_first), len(from_second))
+            row.append([(from_first[k] if k < len(from_first) else 0) +
+                        (from_second[k] if k < len(from_second) else 0) for k in range(size)])
+        counts = row
+    distribution = counts[n2]
+    return sum(distribution[:math.floor(u) + 1]) / sum(distribution)
+
+
+def mann_whitney_u(sample, reference):
+    """
+    Test unilatéral de Mann-Whitney : `sample` est-il stochastiquement plus petit ?
+
+    Test non paramétrique sur les rangs : aucune hypothèse de normalité,
+    insensible à quelques runs aberrants. Loi exacte pour les petites
+    séries sans ex aequo, approximation normale (correction des ex aequo
+    et de continuité) sinon.
+
+    Args:
+        sample: Valeurs de la série testée
+        reference: Valeurs de la série de référence
+
+    Returns:
+        Tuple (U de `sample`, p-valeur unilatérale)
+    """
+    n1, n2 = len(sample), len(reference)
+    pooled = sorted([(value, 0) for value in sample] + [(value, 1) for value in reference])
+
+    # Rangs moyens des ex aequo
+    ranks = [0.0] * len(pooled)
+    tie_term = 0
+    i = 0
+    while i < len(pooled):
+        j = i
+        while j + 1 < len(pooled) and pooled[j + 1][0] == pooled[i][0]:
+            j += 1
+        for k in range(i, j + 1):
+            ranks[k] = (i + j) / 2 + 1
+        tie_term += (j - i + 1) ** 3 - (j - i + 1)
+        i = j + 1
+
+    rank_sum = sum(rank for rank, (_, group) in zip(ranks, pooled) if group == 0)
+    u = rank_sum - n1 * (n1 + 1) / 2
+
+    if tie_term == 0 and n1 * n2 <= MANN_WHITNEY_EXACT_MAX_PAIRS:
+        return u, _mann_whitney_exact_cdf(u, n1, n2)
+
+    n = n1 + n2
+    variance = n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1)))
+    if variance <= 0:
+        return u, 1.0
+    z = (u - n1 * n2 / 2 + 0.5) / math.sqrt(variance)
+    return u, 0.5 * math.erfc(-z / math.sqrt(2))
+
+
+def mann_whitney_min_p(n1, n2):
+    """
+    Plus petite p-valeur que peut donner mann_whitney_u pour ces tailles.
+
+    Atteinte quand toutes les valeurs de la série testée sont sous celles
+    de la référence : 1 / C(n1 + n2, n1) pour la loi exacte. Si elle n'est
+    pas sous le seuil de significativité, le test ne peut rien conclure.
+
+    Args:
+        n1: Nombre de valeurs de la série testée
+        n2: Nombre de valeurs de la série de référence
+
+    Returns:
+        p-valeur minimale atteignable
+    """
+    if n1 == 0 or n2 == 0:
+        return 1.0
+    return mann_whitney_u(list(range(n1)), list(range(n1, n1 + n2)))[1]
+
+
+def mann_whitney_min_runs(significance):
+    """
+    Nombre minimal de runs par série (tailles égales) pour que le test puisse conclure.
+
+    Args:
+        significance: Seuil de la p-valeur
+
+    Returns:
+        Plus petit n tel que mann_whitney_min_p(n, n) < significance
+    """
+    if not 0 < significance < 1:
+        raise ValueError(f"Seuil invalide : {significance} (attendu dans ]0, 1[)")
+    n = 1
+    while mann_whitney_min_p(n, n) >= significance:
+        n += 1
+    return n
+
+
+def summarize_times(times, confidence=DEFAULT_CONFIDENCE):
+    """
+    Résume une série de temps mesurés.
+
+    Les clés avg_time / std_time / min_time / max_time des anciens
+    résultats sont conservées ; les comparaisons utilisent median_time.
+
+    Args:
+        times: Temps des runs mesurés, en secondes
+        confidence: Niveau de l'intervalle de confiance de la médiane
+
+    Returns:
+        Dict des statistiques
+    """
+    q1, median, q3 = quartiles(times)
+    ci_low, ci_high = bootstrap_ci(times, confidence=confidence)
+    return {
+        'median_time': median,
+        'q1_time': q1,
+        'q3_time': q3,
+        'iqr_time': q3 - q1,
+        'ci_low': ci_low,
+        'ci_high': ci_high,
+        'confidence': confidence,
+        'outliers': find_outliers(times),
+        'avg_time': statistics.mean(times),
+        'std_time': statistics.stdev(times) if len(times) > 1 else 0,
+        'min_time': min(times),
+        'max_time': max(times)
+    }
+
+
+def run_benchmark(func, num_runs=10, warmup_runs=DEFAULT_WARMUP_RUNS,
+                  confidence=DEFAULT_CONFIDENCE):
+    """
+    Mesure une fonction : chauffe, runs mesurés, statistiques robustes.
+
+    Args:
+        func: Fonction sans argument à mesurer
+        num_runs: Nombre de runs mesurés
+        warmup_runs: Nombre de runs de chauffe non retenus
+        confidence: Niveau de l'intervalle de confiance de la médiane
+
+    Returns:
+        Dict avec les temps par run ('times', 'cpu_times',
+        'children_cpu_times'), l'utilisation CPU et les statistiques
+        de summarize_times
+    """
+    for _ in range(warmup_runs):
+        func()
+
+    times = []
+    cpu_times = []
+    children_cpu_times = []
+    for run in range(num_runs):
+        _, sample = time_call(func)
+        times.append(sample['wall_time'])
+        cpu_times.append(sample['cpu_time'])
+        children_cpu_times.append(sample['children_cpu_time'])
+        total_cpu = sample['cpu_time'] + sample['children_cpu_time']
+        print(f"  Run {run + 1}/{num_runs}: {sample['wall_time']:.4f}s (CPU {total_cpu:.4f}s)")
+
+    summary = summarize_times(times, confidence)
+    utilization = [(cpu + children) / wall if wall > 0 else 0.0
+                   for cpu, children, wall in zip(cpu_times, children_cpu_times, times)]
+    result = {
+        'num_runs': num_runs,
+        'warmup_runs': warmup_runs,
+        'times': times,
+        'cpu_times': cpu_times,
+        'children_cpu_times': children_cpu_times,
+        'cpu_utilization': statistics.median(utilization),
+        **summary
+    }
+    print_summary(result)
+    return result
+
+
+def print_summary(result):
+    """
+    Affiche le résumé d'un benchmark.
+
+    Args:
+        result: Dict retourné par run_benchmark
+    """
+    outliers = len(result['outliers'])
+    print(f"  ✅ Médiane: {result['median_time']:.4f}s "
+          f"(IQR {result['iqr_time']:.4f}s, IC{result['confidence'] * 100:.0f}% "
+          f"[{result['ci_low']:.4f}, {result['ci_high']:.4f}], "
+          f"CPU ×{result['cpu_utilization']:.2f}"
+          f"{f', {outliers} aberrant(s)' if outliers else ''})")
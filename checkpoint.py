@@ -0,0 +1,177 @@
+"""
+Points de reprise (checkpoints) pour les très longs runs Monte Carlo.
+
+Un run à reprendre est découpé en un nombre fixe de blocs ; le bloc k
+utilise toujours le k-ième flux enfant de la graine racine. Le fichier de
+reprise enregistre :
+- Les paramètres du run (itérations, noyau, nombre de blocs, entropie de
+  la graine, même tirée au hasard)
+- Pour chaque bloc terminé : sa position dans le flux (spawn_key), le
+  nombre de points tirés et le nombre de points dans le cercle
+
+Un bloc non terminé est simplement recalculé depuis le début de son flux :
+le résultat final est identique à celui d'un run ininterrompu.
+"""
+
+import os
+import json
+import time
+
+
+# Version du format du fichier de reprise
+CHECKPOINT_VERSION = 1
+
+# Intervalle minimal entre deux écritures du fichier (secondes)
+DEFAULT_CHECKPOINT_INTERVAL = 5.0
+
+
+class Checkpoint:
+    """
+    État d'avancement d'un run découpé en blocs, persisté sur disque.
+
+    Exemple :
+        ckpt = Checkpoint.open('run.ckpt', 10**11, seed, 'numpy', 800, resume=True)
+        for index in ckpt.pending():
+            ...
+            ckpt.record(index, inside, iterations)
+        ckpt.save()
+    """
+
+    def __init__(self, path, total_iterations, entropy, kernel, num_chunks,
+                 interval=DEFAULT_CHECKPOINT_INTERVAL):
+        """
+        Initialise un état vide (aucun bloc terminé).
+
+        Args:
+            path: Chemin du fichier de reprise
+            total_iterations: Nombre total de points du run
+            entropy: Entropie de la SeedSequence racine
+            kernel: Noyau de calcul
+            num_chunks: Nombre de blocs du run
+            interval: Intervalle minimal entre deux écritures (secondes)
+        """
+        self.path = path
+        self.total_iterations = total_iterations
+        self.entropy = entropy
+        self.kernel = kernel
+        self.num_chunks = num_chunks
+        self.interval = interval
+        self.completed = {}
+        self._last_save = time.monotonic()
+
+    @classmethod
+    def open(cls, path, total_iterations, entropy, kernel, num_chunks, resume=False,
+             interval=DEFAULT_CHECKPOINT_INTERVAL):
+        """
+        Crée un nouvel état ou recharge celui du fichier existant.
+
+        En reprise, l'entropie et le nombre de blocs enregistrés remplacent
+        ceux passés en argument s'ils ne sont pas fixés (None) : la reprise
+        ne dépend pas du nombre de workers.
+
+        Args:
+            path: Chemin du fichier de reprise
+            total_iterations: Nombre total de points du run
+            entropy: Entropie de la graine racine (None = celle du fichier en reprise)
+            kernel: Noyau de calcul
+            num_chunks: Nombre de blocs du run (None = celui du fichier en reprise)
+            resume: Recharger le fichier existant au lieu de repartir de zéro
+            interval: Intervalle minimal entre deux écritures (secondes)
+
+        Returns:
+            Instance de Checkpoint
+
+        Raises:
+            FileNotFoundError: Reprise demandée sans fichier existant
+            ValueError: Paramètres incompatibles avec ceux du fichier
+        """
+        if not resume:
+            if entropy is None or num_chunks is None:
+                raise ValueError("Une entropie et un nombre de blocs sont nécessaires "
+                                 "pour démarrer un nouveau run")
+            return cls(path, total_iterations, entropy, kernel, num_chunks, interval)
+
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+        if data.get('version') != CHECKPOINT_VERSION:
+            raise ValueError(f"Version de checkpoint non supportée : {data.get('version')!r}")
+        expected = {
+            'total_iterations': total_iterations,
+            'kernel': kernel,
+        }
+        if num_chunks is not None:
+            expected['num_chunks'] = num_chunks
+        if entropy is not None:
+            expected['entropy'] = entropy
+        for key, value in expected.items():
+            if data[key] != value:
+                raise ValueError(f"Checkpoint incompatible : {key} = {data[key]!r} "
+                                 f"dans le fichier, {value!r} demandé")
+
+        ckpt = cls(path, total_iterations, data['entropy'], kernel, data['num_chunks'], interval)
+        ckpt.completed = {int(index): chunk for index, chunk in data['completed'].items()}
+        return ckpt
+
+    def pending(self):
+        """
+        Retourne les indices des blocs restant à calculer.
+
+        Returns:
+            Liste triée des indices de blocs non terminés
+        """
+        return [k for k in range(self.num_chunks) if k not in self.completed]
+
+    def record(self, index, inside, iterations, variance_sum=None):
+        """
+        Enregistre un bloc terminé et écrit le fichier si l'intervalle est écoulé.
+
+        Args:
+            index: Indice du bloc (= position du flux enfant)
+            inside: Nombre de points dans le cercle
+            iterations: Nombre de points tirés
+            variance_sum: Contribution du bloc à la variance (noyaux stratifiés)
+        """
+        chunk = {'spawn_key': [index], 'inside': inside, 'iterations': iterations}
+        if variance_sum is not None:
+            chunk['variance_sum'] = variance_sum
+        self.completed[index] = chunk
+        if time.monotonic() - self._last_save >= self.interval:
+            self.save()
+
+    def totals(self):
+        """
+        Additionne les blocs terminés.
+
+        Returns:
+            Tuple (points dans le cercle, points tirés, contribution à la variance)
+        """
+        inside = sum(chunk['inside'] for chunk in self.completed.values())
+        iterations = sum(chunk['iterations'] for chunk in self.completed.values())
+        variance_sum = sum(chunk.get('variance_sum', 0.0) for chunk in self.completed.values())
+        return inside, iterations, variance_sum
+
+    def is_complete(self):
+        """Indique si tous les blocs du run sont terminés."""
+        return len(self.completed) == self.num_chunks
+
+    def save(self):
+        """Écrit le fichier de reprise de façon atomique (fichier temporaire + rename)."""
+        data = {
+            'version': CHECKPOINT_VERSION,
+            'total_iterations': self.total_iterations,
+            'entropy': self.entropy,
+            'kernel': self.kernel,
+            'num_chunks': self.num_chunks,
+            'completed': {str(index): chunk for index, chunk in sorted(self.completed.items())},
+        }
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+        self._last_save = time.monotonic()
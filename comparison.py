@@ -4,106 +4,670 @@ Script de comparaison et benchmark entre mono-thread et multi-thread.
 Ce script :
 1. Exécute les deux versions avec différentes configurations
 2. Mesure les temps d'exécution (plusieurs runs)
-3. Calcule moyenne, écart-type, speedup
+3. Calcule médiane, IQR, intervalles de confiance bootstrap, speedup
+   (chauffe, perf_counter_ns et temps CPU : voir benchmark.py)
 4. Sauvegarde les résultats en JSON
 5. Génère automatiquement les graphiques
+
+Chaque noyau de calcul (python, numpy, halton) peut être benchmarké côte à
+côte. Le mode --error-vs-n compare la convergence de l'erreur en fonction du
+nombre de points (pseudo-aléatoire vs quasi-Monte Carlo). Le mode
+--backends parcourt les moteurs du registre (backends.py) de façon générique.
 """
 
-import time
 import json
+import math
 import os
 import statistics
 import argparse
+from datetime import datetime, timezone
+import numpy as np
+from monte_carlo_core import KERNELS, python_build_info
 from mono_thread import monte_carlo_pi_mono
 from multi_thread import monte_carlo_pi_multi
+from multiprocessing_version import MonteCarloPool
+from backends import BACKENDS, available_backends, estimate_pi, resolve_backend, shutdown_pool
+from subinterpreters import engine_for
+from jit_kernel import compile_kernels, print_compile_report
+from benchmark import DEFAULT_WARMUP_RUNS, run_benchmark, speedup_ci
+from autotune import worker_candidates
+from host_profile import host_fingerprint, host_info
+from history import DEFAULT_HISTORY_PATH, append_results
+from scaling import (DEFAULT_TARGET_EFFICIENCY, amdahl_speedup, fit_amdahl, fit_gustafson,
+                     gustafson_speedup, useful_workers)
+
+
+# Format des résultats du balayage (incrémenté à chaque changement incompatible)
+SWEEP_SCHEMA = 'monte_carlo_pi.sweep'
+SWEEP_SCHEMA_VERSION = 1
+
+# Balayage par défaut : séquentiel, threads et processus sur deux tailles
+DEFAULT_SWEEP_BACKENDS = ('mono', 'thread', 'process')
+DEFAULT_SWEEP_SIZES = (1_000_000, 10_000_000)
+
+# Format des résultats de l'étude de passage à l'échelle
+SCALING_SCHEMA = 'monte_carlo_pi.scaling'
+SCALING_SCHEMA_VERSION = 1
+
+# Étude de passage à l'échelle par défaut : moteurs parallèles
+DEFAULT_SCALING_BACKENDS = ('thread', 'process')
+
+# Points par worker en scaling faible
+DEFAULT_ITERATIONS_PER_WORKER = 2_000_000
 
 
-def benchmark_mono(iterations, num_runs=10):
+def compile_jit(kernel):
     """
-    Benchmark de la version mono-thread.
+    Compile le noyau JIT avant les runs mesurés.
+    
+    Le temps de compilation (ou de chargement depuis le cache disque) est
+    affiché et enregistré à part : il n'entre pas dans les temps des runs.
     
     Args:
-        iterations: Nombre d'itérations
-        num_runs: Nombre de runs pour calculer la moyenne
+        kernel: Noyau de calcul
         
     Returns:
-        Dict avec les résultats
+        Temps de compilation en secondes, ou None si le noyau n'est pas 'jit'
+    """
+    if kernel != 'jit':
+        return None
+    info = compile_kernels()
+    print_compile_report(info, indent='  ')
+    return info['compile_time']
+
+
+def save_results(results, output_file, kind, history_path=DEFAULT_HISTORY_PATH):
     """
-    print(f"\n🔄 Benchmark MONO-THREAD ({num_runs} runs)...")
-    times = []
+    Écrit les résultats du run et les ajoute à l'historique.
     
-    for run in range(num_runs):
-        start = time.time()
-        pi_estimate = monte_carlo_pi_mono(iterations)
-        end = time.time()
-        elapsed = end - start
-        times.append(elapsed)
-        print(f"  Run {run + 1}/{num_runs}: {elapsed:.4f}s")
+    Le fichier de résultats est l'instantané du dernier run (graphiques,
+    contrôle de régression) ; l'historique conserve tous les runs.
     
-    avg_time = statistics.mean(times)
-    std_time = statistics.stdev(times) if len(times) > 1 else 0
+    Args:
+        results: Dict des résultats
+        output_file: Fichier JSON du dernier run
+        kind: Type de résultats dans l'historique
+        history_path: Fichier d'historique (None : pas d'historique)
+    """
+    os.makedirs(os.path.dirname(output_file), exist_ok=True)
+    with open(output_file, 'w') as f:
+        json.dump(results, f, indent=2)
     
-    print(f"  ✅ Moyenne: {avg_time:.4f}s (±{std_time:.4f}s)")
+    print(f"\n✅ Résultats sauvegardés dans : {output_file}")
+    
+    if history_path:
+        append_results(kind, results, history_path)
+        print(f"📚 Run ajouté à l'historique : {history_path}")
+
+
+def set_speedup(result, reference):
+    """
+    Ajoute à un résultat son speedup par rapport à une référence.
+    
+    Le speedup est le rapport des temps médians ; 'speedup_ci' donne son
+    intervalle de confiance bootstrap.
+    
+    Args:
+        result: Dict retourné par un benchmark (modifié sur place)
+        reference: Dict du benchmark de référence
+    """
+    speedup, low, high = speedup_ci(reference['times'], result['times'],
+                                    confidence=result['confidence'])
+    result['speedup'] = speedup
+    result['speedup_ci'] = [low, high]
+
+
+def format_speedup(result):
+    """Formate un speedup et son intervalle de confiance."""
+    low, high = result['speedup_ci']
+    return f"{result['speedup']:.2f}x [{low:.2f}, {high:.2f}]"
+
+
+def benchmark_mono(iterations, num_runs=10, kernel='python', warmup_runs=DEFAULT_WARMUP_RUNS):
+    """
+    Benchmark de la version mono-thread.
+    
+    Args:
+        iterations: Nombre d'itérations
+        num_runs: Nombre de runs mesurés
+        kernel: Noyau de calcul (voir KERNELS)
+        warmup_runs: Nombre de runs de chauffe non retenus
+        
+    Returns:
+        Dict avec les résultats (voir benchmark.run_benchmark)
+    """
+    print(f"\n🔄 Benchmark MONO-THREAD [{kernel}] ({num_runs} runs)...")
+    compile_time = compile_jit(kernel)
+    
+    measured = run_benchmark(lambda: monte_carlo_pi_mono(iterations, kernel),
+                             num_runs, warmup_runs)
     
     return {
         'iterations': iterations,
-        'num_runs': num_runs,
-        'times': times,
-        'avg_time': avg_time,
-        'std_time': std_time,
-        'min_time': min(times),
-        'max_time': max(times)
+        'kernel': kernel,
+        'compile_time': compile_time,
+        **measured
     }
 
 
-def benchmark_multi(iterations, num_threads, num_runs=10):
+def benchmark_multi(iterations, num_threads, num_runs=10, kernel='python',
+                    warmup_runs=DEFAULT_WARMUP_RUNS):
     """
     Benchmark de la version multi-thread.
     
     Args:
         iterations: Nombre d'itérations
         num_threads: Nombre de threads
-        num_runs: Nombre de runs pour calculer la moyenne
+        num_runs: Nombre de runs mesurés
+        kernel: Noyau de calcul (voir KERNELS)
+        warmup_runs: Nombre de runs de chauffe non retenus
         
     Returns:
-        Dict avec les résultats
+        Dict avec les résultats (voir benchmark.run_benchmark)
     """
-    print(f"\n🔄 Benchmark MULTI-THREAD avec {num_threads} threads ({num_runs} runs)...")
-    times = []
+    print(f"\n🔄 Benchmark MULTI-THREAD [{kernel}] avec {num_threads} threads ({num_runs} runs)...")
+    compile_time = compile_jit(kernel)
     
-    for run in range(num_runs):
-        start = time.time()
-        pi_estimate = monte_carlo_pi_multi(iterations, num_threads)
-        end = time.time()
-        elapsed = end - start
-        times.append(elapsed)
-        print(f"  Run {run + 1}/{num_runs}: {elapsed:.4f}s")
+    measured = run_benchmark(lambda: monte_carlo_pi_multi(iterations, num_threads, kernel=kernel),
+                             num_runs, warmup_runs)
     
-    avg_time = statistics.mean(times)
-    std_time = statistics.stdev(times) if len(times) > 1 else 0
+    return {
+        'iterations': iterations,
+        'num_threads': num_threads,
+        'kernel': kernel,
+        'compile_time': compile_time,
+        **measured
+    }
+
+
+def benchmark_multiprocessing(iterations, num_processes, num_runs=10, pool=None, kernel='python',
+                              warmup_runs=DEFAULT_WARMUP_RUNS):
+    """
+    Benchmark de la version multiprocessing sur un pool persistant.
     
-    print(f"  ✅ Moyenne: {avg_time:.4f}s (±{std_time:.4f}s)")
+    Tous les runs sont soumis aux mêmes processus : le démarrage du pool
+    est mesuré une seule fois et reporté à part du temps de calcul. Le
+    temps CPU des processus du pool est compté dans 'children_cpu_times'.
+    
+    Args:
+        iterations: Nombre d'itérations
+        num_processes: Nombre de processus
+        num_runs: Nombre de runs mesurés
+        pool: MonteCarloPool déjà démarré à réutiliser (défaut: pool dédié) ;
+            son noyau est remplacé par `kernel`
+        kernel: Noyau de calcul (voir KERNELS)
+        warmup_runs: Nombre de runs de chauffe non retenus
+        
+    Returns:
+        Dict avec les résultats (voir benchmark.run_benchmark)
+    """
+    print(f"\n🔄 Benchmark MULTIPROCESSING [{kernel}] avec {num_processes} processus "
+          f"({num_runs} runs)...")
+    owns_pool = pool is None
+    if owns_pool:
+        pool = MonteCarloPool(num_processes, kernel).start()
+    pool.kernel = kernel
+    print(f"  Démarrage du pool : {pool.startup_time:.4f}s (+ warm-up {pool.warmup_time:.4f}s)")
+    
+    try:
+        measured = run_benchmark(lambda: pool.estimate(iterations), num_runs, warmup_runs)
+    finally:
+        if owns_pool:
+            pool.close()
     
     return {
         'iterations': iterations,
-        'num_threads': num_threads,
+        'num_processes': pool.num_processes,
+        'kernel': kernel,
+        'pool_startup_time': pool.startup_time,
+        'pool_warmup_time': pool.warmup_time,
+        **measured
+    }
+
+
+def benchmark_backend(backend, iterations, workers=None, num_runs=10, kernel=None,
+                      warmup_runs=DEFAULT_WARMUP_RUNS):
+    """
+    Benchmark d'un moteur quelconque du registre.
+    
+    Un premier appel non mesuré démarre les ressources persistantes du
+    moteur (pool de processus, ...), comme le warm-up de MonteCarloPool.
+    
+    Args:
+        backend: Nom du moteur (voir backends.BACKENDS)
+        iterations: Nombre d'itérations
+        workers: Nombre de threads / processus (ignoré si séquentiel)
+        num_runs: Nombre de runs mesurés
+        kernel: Noyau de calcul (défaut: celui du moteur)
+        warmup_runs: Nombre de runs de chauffe non retenus
+        
+    Returns:
+        Dict avec les résultats (voir benchmark.run_benchmark)
+    """
+    backend, workers, kernel = resolve_backend(iterations, backend, workers, kernel)
+    # Le moteur sous-interpréteurs peut se replier sur les threads ou les processus
+    engine = engine_for(kernel) if backend == 'subinterp' else backend
+    label = f"{backend} [{kernel}]" + (f" avec {workers} workers" if workers else "")
+    if engine != backend:
+        label += f" (repli : {engine})"
+    print(f"\n🔄 Benchmark {label} ({num_runs} runs)...")
+    compile_time = compile_jit(kernel)
+    
+    estimate_pi(min(iterations, 10_000), backend, workers, kernel)
+    
+    measured = run_benchmark(lambda: estimate_pi(iterations, backend, workers, kernel),
+                             num_runs, warmup_runs)
+    
+    return {
+        'backend': backend,
+        'engine': engine,
+        'iterations': iterations,
+        'workers': workers,
+        'kernel': kernel,
+        'compile_time': compile_time,
+        **measured
+    }
+
+
+def compare_backends(iterations=10_000_000, max_workers=8, num_runs=10, backends=None,
+                     kernel=None, warmup_runs=DEFAULT_WARMUP_RUNS,
+                     history_path=DEFAULT_HISTORY_PATH):
+    """
+    Compare tous les moteurs du registre.
+    
+    Les moteurs parallèles sont mesurés pour 1, 2, 4, ... max_workers
+    workers ; le speedup (rapport des médianes, avec son intervalle de
+    confiance bootstrap) est calculé par rapport au moteur 'mono' (ou au
+    premier moteur mesuré s'il est absent).
+    
+    Args:
+        iterations: Nombre d'itérations
+        max_workers: Nombre maximum de workers à tester
+        num_runs: Nombre de runs par configuration
+        backends: Noms des moteurs à comparer (défaut: tous)
+        kernel: Noyau imposé à tous les moteurs (défaut: celui de chaque moteur)
+        warmup_runs: Nombre de runs de chauffe par configuration
+        history_path: Fichier d'historique (None : pas d'historique)
+        
+    Returns:
+        Dict avec tous les résultats
+    """
+    backends = list(backends or available_backends())
+    worker_counts = [2**i for i in range(int(max_workers).bit_length()) if 2**i <= max_workers]
+    
+    print("=" * 70)
+    print("COMPARAISON DES MOTEURS")
+    print("=" * 70)
+    print(f"Itérations par test : {iterations:,}")
+    print(f"Runs par config     : {num_runs}")
+    print(f"Moteurs             : {', '.join(backends)}")
+    print(f"Workers testés      : {', '.join(map(str, worker_counts))}")
+    print("=" * 70)
+    
+    runs = []
+    try:
+        for backend in backends:
+            counts = worker_counts if BACKENDS[backend].parallel else [None]
+            for workers in counts:
+                runs.append(benchmark_backend(backend, iterations, workers, num_runs, kernel,
+                                              warmup_runs))
+    finally:
+        shutdown_pool()
+    
+    reference = next((r for r in runs if r['backend'] == 'mono'), runs[0])
+    for result in runs:
+        set_speedup(result, reference)
+    
+    # Résumé
+    print("\n" + "=" * 70)
+    print("RÉSUMÉ DES RÉSULTATS (médianes)")
+    print("=" * 70)
+    print(f"{'Moteur':<14} {'Noyau':<12} {'Workers':<9} {'Temps (s)':<12} {'Speedup':<22}")
+    print("-" * 70)
+    for result in runs:
+        workers_str = str(result['workers'] or 1)
+        print(f"{result['backend']:<14} {result['kernel']:<12} {workers_str:<9} "
+              f"{result['median_time']:<12.4f} {format_speedup(result)}")
+    print("=" * 70)
+    
+    results = {
+        'iterations': iterations,
         'num_runs': num_runs,
-        'times': times,
-        'avg_time': avg_time,
-        'std_time': std_time,
-        'min_time': min(times),
-        'max_time': max(times)
+        'warmup_runs': warmup_runs,
+        'python': python_build_info(),
+        'reference': reference['backend'],
+        'runs': runs
+    }
+    
+    save_results(results, 'results/backends_results.json', 'backends', history_path)
+    
+    return results
+
+
+def run_sweep(backends=DEFAULT_SWEEP_BACKENDS, worker_counts=None, sizes=DEFAULT_SWEEP_SIZES,
+              num_runs=10, kernel=None, warmup_runs=DEFAULT_WARMUP_RUNS,
+              history_path=DEFAULT_HISTORY_PATH):
+    """
+    Balaye la matrice moteurs × nombres de workers × nombres d'itérations.
+    
+    Les résultats sont au format long : une ligne par run mesuré ('runs')
+    et une ligne de synthèse par configuration ('summaries'), avec les
+    mêmes colonnes quel que soit le moteur. Un moteur ajouté au registre
+    est donc balayé et tracé sans modifier ce script ni visualize_results.
+    
+    Args:
+        backends: Noms des moteurs du registre
+        worker_counts: Nombres de workers des moteurs parallèles (défaut:
+            puissances de 2, cœurs physiques, cœurs logiques et 2 × cœurs
+            logiques pour la sur-souscription)
+        sizes: Nombres d'itérations
+        num_runs: Nombre de runs mesurés par configuration
+        kernel: Noyau imposé à tous les moteurs (défaut: celui de chaque moteur)
+        warmup_runs: Nombre de runs de chauffe par configuration
+        history_path: Fichier d'historique (None : pas d'historique)
+        
+    Returns:
+        Dict au format SWEEP_SCHEMA
+    """
+    worker_counts = sorted(set(worker_counts or worker_candidates()))
+    info = host_info()
+    
+    print("=" * 70)
+    print("BALAYAGE MOTEURS × WORKERS × TAILLES")
+    print("=" * 70)
+    print(f"Moteurs             : {', '.join(backends)}")
+    print(f"Workers testés      : {', '.join(map(str, worker_counts))} "
+          f"({info['logical_cpus']} cœurs logiques)")
+    print(f"Tailles             : {', '.join(f'{n:,}' for n in sizes)}")
+    print(f"Runs par config     : {num_runs} (+ {warmup_runs} de chauffe)")
+    print("=" * 70)
+    
+    runs = []
+    summaries = []
+    try:
+        for iterations in sizes:
+            size_summaries = []
+            for backend in backends:
+                counts = worker_counts if BACKENDS[backend].parallel else [None]
+                for workers in counts:
+                    result = benchmark_backend(backend, iterations, workers, num_runs, kernel,
+                                               warmup_runs)
+                    config = {
+                        'backend': result['backend'],
+                        'engine': result['engine'],
+                        'kernel': result['kernel'],
+                        'workers': result['workers'] or 1,
+                        'iterations': iterations,
+                        'oversubscribed': (result['workers'] or 1) > info['logical_cpus']
+                    }
+                    for index, wall_time in enumerate(result['times']):
+                        runs.append({**config, 'run': index, 'wall_time': wall_time,
+                                     'cpu_time': result['cpu_times'][index],
+                                     'children_cpu_time': result['children_cpu_times'][index]})
+                    size_summaries.append(({**config,
+                                            'median_time': result['median_time'],
+                                            'iqr_time': result['iqr_time'],
+                                            'ci_low': result['ci_low'],
+                                            'ci_high': result['ci_high'],
+                                            'throughput': iterations / result['median_time'],
+                                            'cpu_utilization': result['cpu_utilization'],
+                                            'num_outliers': len(result['outliers']),
+                                            'compile_time': result['compile_time']},
+                                           result))
+            
+            # Speedup par rapport au moteur 'mono' de la même taille (sinon la première ligne)
+            reference = next((r for c, r in size_summaries if c['backend'] == 'mono'),
+                             size_summaries[0][1])
+            for config, result in size_summaries:
+                set_speedup(result, reference)
+                config['speedup'] = result['speedup']
+                config['speedup_ci'] = result['speedup_ci']
+                config['efficiency'] = result['speedup'] / config['workers']
+                summaries.append(config)
+    finally:
+        shutdown_pool()
+    
+    # Résumé
+    print("\n" + "=" * 70)
+    print("RÉSUMÉ DU BALAYAGE (médianes)")
+    print("=" * 70)
+    print(f"{'Taille':<13} {'Moteur':<12} {'Workers':<9} {'Débit (pts/s)':>15}  {'Speedup':<22}")
+    print("-" * 70)
+    for row in summaries:
+        workers_str = f"{row['workers']}{'*' if row['oversubscribed'] else ''}"
+        print(f"{row['iterations']:<13,} {row['backend']:<12} {workers_str:<9} "
+              f"{row['throughput']:>15,.0f}  {format_speedup(row)}")
+    print("=" * 70)
+    print("* sur-souscription (plus de workers que de cœurs logiques)")
+    
+    results = {
+        'schema': SWEEP_SCHEMA,
+        'schema_version': SWEEP_SCHEMA_VERSION,
+        'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'host': info,
+        'host_fingerprint': host_fingerprint(info),
+        'python': python_build_info(),
+        'parameters': {
+            'backends': list(backends),
+            'worker_counts': worker_counts,
+            'sizes': list(sizes),
+            'num_runs': num_runs,
+            'warmup_runs': warmup_runs,
+            'kernel': kernel
+        },
+        'runs': runs,
+        'summaries': summaries
+    }
+    
+    save_results(results, 'results/sweep_results.json', 'sweep', history_path)
+    
+    return results
+
+
+def run_scaling_study(backends=DEFAULT_SCALING_BACKENDS, worker_counts=None,
+                      iterations=10_000_000, iterations_per_worker=DEFAULT_ITERATIONS_PER_WORKER,
+                      num_runs=10, kernel=None, warmup_runs=DEFAULT_WARMUP_RUNS,
+                      target_efficiency=DEFAULT_TARGET_EFFICIENCY,
+                      history_path=DEFAULT_HISTORY_PATH, fit_max_workers=None):
+    """
+    Étude de passage à l'échelle fort et faible, avec ajustements d'Amdahl et de Gustafson.
+    
+    Pour chaque moteur parallèle :
+    - Scaling fort : `iterations` points au total quel que soit le nombre
+      de workers ; speedup T(1) / T(p), ajusté par la loi d'Amdahl
+    - Scaling faible : `iterations_per_worker` points par worker ; speedup
+      à l'échelle p · T(1) / T(p), ajusté par la loi de Gustafson
+    
+    La fraction séquentielle d'Amdahl donne le speedup maximal (1 / s) et
+    le nombre de cœurs au-delà duquel l'efficacité passe sous la cible :
+    c'est le nombre de cœurs qu'un calcul de taille fixe peut utilement
+    occuper.
+    
+    Les ajustements n'utilisent que les mesures jusqu'à `fit_max_workers` :
+    au-delà, les workers se partagent des cœurs (hyperthreading,
+    sur-souscription) et le speedup plafonne pour une raison matérielle
+    que les deux lois ne décrivent pas. Ces mesures restent dans les
+    résultats, marquées 'fitted': False (et 'oversubscribed' au-delà des
+    cœurs logiques, comme dans le balayage).
+    
+    Args:
+        backends: Noms des moteurs parallèles du registre
+        worker_counts: Nombres de workers (1 est toujours ajouté : référence)
+        iterations: Nombre total de points en scaling fort
+        iterations_per_worker: Points par worker en scaling faible
+        num_runs: Nombre de runs mesurés par configuration
+        kernel: Noyau imposé à tous les moteurs (défaut: celui de chaque moteur)
+        warmup_runs: Nombre de runs de chauffe par configuration
+        target_efficiency: Efficacité minimale d'un cœur utile
+        history_path: Fichier d'historique (None : pas d'historique)
+        fit_max_workers: Nombre de workers maximal des mesures ajustées
+            (défaut: nombre de cœurs physiques)
+        
+    Returns:
+        Dict au format SCALING_SCHEMA
+    """
+    worker_counts = sorted(set(worker_counts or worker_candidates()) | {1})
+    sequential = [b for b in backends if not BACKENDS[b].parallel]
+    if sequential:
+        raise ValueError(f"Moteurs séquentiels, sans passage à l'échelle : {', '.join(sequential)}")
+    info = host_info()
+    fit_max_workers = fit_max_workers or info['physical_cpus'] or info['logical_cpus']
+    
+    print("=" * 70)
+    print("ÉTUDE DE PASSAGE À L'ÉCHELLE (FORT ET FAIBLE)")
+    print("=" * 70)
+    print(f"Moteurs             : {', '.join(backends)}")
+    print(f"Workers testés      : {', '.join(map(str, worker_counts))}")
+    print(f"Ajustements         : jusqu'à {fit_max_workers} workers")
+    print(f"Scaling fort        : {iterations:,} points au total")
+    print(f"Scaling faible      : {iterations_per_worker:,} points par worker")
+    print(f"Runs par config     : {num_runs} (+ {warmup_runs} de chauffe)")
+    print("=" * 70)
+    
+    def measure(backend, workers, total):
+        result = benchmark_backend(backend, total, workers, num_runs, kernel, warmup_runs)
+        return result, {
+            'workers': workers,
+            'iterations': total,
+            'fitted': workers <= fit_max_workers,
+            'oversubscribed': workers > info['logical_cpus'],
+            'median_time': result['median_time'],
+            'ci_low': result['ci_low'],
+            'ci_high': result['ci_high'],
+            'times': result['times']
+        }
+    
+    studies = []
+    try:
+        for backend in backends:
+            strong = []
+            weak = []
+            resolved_kernel = None
+            for workers in worker_counts:
+                result, row = measure(backend, workers, iterations)
+                resolved_kernel = result['kernel']
+                strong.append(row)
+                _, row = measure(backend, workers, iterations_per_worker * workers)
+                weak.append(row)
+            
+            strong_reference = strong[0]['median_time']
+            for row in strong:
+                row['speedup'] = strong_reference / row['median_time']
+                row['efficiency'] = row['speedup'] / row['workers']
+            weak_reference = weak[0]['median_time']
+            for row in weak:
+                row['scaled_speedup'] = row['workers'] * weak_reference / row['median_time']
+                row['efficiency'] = weak_reference / row['median_time']
+            
+            strong_fit = [r for r in strong if r['fitted']]
+            weak_fit = [r for r in weak if r['fitted']]
+            amdahl = fit_amdahl([r['workers'] for r in strong_fit],
+                                [r['speedup'] for r in strong_fit])
+            gustafson = fit_gustafson([r['workers'] for r in weak_fit],
+                                      [r['scaled_speedup'] for r in weak_fit])
+            if amdahl is not None:
+                amdahl['useful_workers'] = useful_workers(amdahl['serial_fraction'],
+                                                          target_efficiency)
+                amdahl['predicted_speedup_at_cpu_count'] = amdahl_speedup(
+                    amdahl['serial_fraction'], info['logical_cpus'])
+            if gustafson is not None:
+                gustafson['predicted_speedup_at_cpu_count'] = gustafson_speedup(
+                    gustafson['serial_fraction'], info['logical_cpus'])
+            
+            studies.append({
+                'backend': backend,
+                'kernel': resolved_kernel,
+                'strong': strong,
+                'weak': weak,
+                'amdahl': amdahl,
+                'gustafson': gustafson
+            })
+    finally:
+        shutdown_pool()
+    
+    # Résumé
+    print("\n" + "=" * 70)
+    print("RÉSUMÉ DU PASSAGE À L'ÉCHELLE")
+    print("=" * 70)
+    for study in studies:
+        print(f"{study['backend']} [{study['kernel']}]")
+        print(f"  {'Workers':<9} {'Speedup fort':<14} {'Eff. forte':<12} "
+              f"{'Speedup faible':<16} {'Eff. faible':<12}")
+        for strong, weak in zip(study['strong'], study['weak']):
+            workers_str = f"{strong['workers']}{'' if strong['fitted'] else '*'}"
+            print(f"  {workers_str:<9} {strong['speedup']:<14.2f} "
+                  f"{strong['efficiency']:<12.1%} {weak['scaled_speedup']:<16.2f} "
+                  f"{weak['efficiency']:<12.1%}")
+        amdahl = study['amdahl']
+        gustafson = study['gustafson']
+        if amdahl is not None:
+            max_speedup = (f"{amdahl['max_speedup']:.1f}x" if amdahl['max_speedup'] is not None
+                           else "illimité")
+            useful = amdahl['useful_workers'] if amdahl['useful_workers'] is not None else "illimité"
+            print(f"  Amdahl    : fraction séquentielle s = {amdahl['serial_fraction']:.4f}, "
+                  f"speedup max {max_speedup}")
+            print(f"              cœurs utiles (efficacité ≥ {target_efficiency:.0%}) : {useful}")
+        if gustafson is not None:
+            print(f"  Gustafson : fraction séquentielle α = {gustafson['serial_fraction']:.4f}, "
+                  f"speedup à l'échelle sur {info['logical_cpus']} cœurs : "
+                  f"{gustafson['predicted_speedup_at_cpu_count']:.2f}x")
+        if amdahl is None and gustafson is None:
+            print(f"  Ajustements impossibles : aucune mesure entre 2 et {fit_max_workers} workers")
+        print("-" * 70)
+    print(f"* hors ajustement : plus de {fit_max_workers} workers "
+          f"(cœurs partagés ; sur-souscription au-delà de {info['logical_cpus']} cœurs logiques)")
+    
+    results = {
+        'schema': SCALING_SCHEMA,
+        'schema_version': SCALING_SCHEMA_VERSION,
+        'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'host': info,
+        'host_fingerprint': host_fingerprint(info),
+        'python': python_build_info(),
+        'parameters': {
+            'backends': list(backends),
+            'worker_counts': worker_counts,
+            'iterations': iterations,
+            'iterations_per_worker': iterations_per_worker,
+            'num_runs': num_runs,
+            'warmup_runs': warmup_runs,
+            'kernel': kernel,
+            'target_efficiency': target_efficiency,
+            'fit_max_workers': fit_max_workers
+        },
+        'studies': studies
     }
+    
+    save_results(results, 'results/scaling_results.json', 'scaling', history_path)
+    
+    return results
 
 
-def compare_performance(iterations=10_000_000, max_threads=8, num_runs=10):
+def compare_performance(iterations=10_000_000, max_threads=8, num_runs=10, kernels=('python',),
+                        warmup_runs=DEFAULT_WARMUP_RUNS, history_path=DEFAULT_HISTORY_PATH,
+                        with_processes=False):
     """
     Compare les performances mono vs multi avec différentes configurations.
     
+    Le premier noyau alimente les clés 'mono_thread' / 'multi_thread'
+    (utilisées par visualize_results) ; tous les noyaux sont aussi rangés
+    sous 'by_kernel'. Le speedup (rapport des médianes, avec son
+    intervalle de confiance bootstrap) est calculé par rapport au
+    mono-thread du même noyau.
+    
+    Avec with_processes, chaque nombre de threads est aussi mesuré en
+    multiprocessing ('multiprocessing' dans 'by_kernel') : un pool
+    persistant par nombre de processus, démarré une fois et réutilisé pour
+    tous les noyaux et tous les runs.
+    
     Args:
         iterations: Nombre d'itérations
         max_threads: Nombre maximum de threads à tester
         num_runs: Nombre de runs par configuration
+        kernels: Noyaux de calcul à comparer
+        warmup_runs: Nombre de runs de chauffe par configuration
+        history_path: Fichier d'historique (None : pas d'historique)
+        with_processes: Mesurer aussi le multiprocessing (pools persistants)
         
     Returns:
         Dict avec tous les résultats
@@ -112,37 +676,74 @@ def compare_performance(iterations=10_000_000, max_threads=8, num_runs=10):
     print("COMPARAISON MONO-THREAD vs MULTI-THREAD")
     print("=" * 70)
     print(f"Itérations par test : {iterations:,}")
-    print(f"Runs par config     : {num_runs}")
+    print(f"Runs par config     : {num_runs} (+ {warmup_runs} de chauffe)")
     print(f"Threads testés      : 1, 2, 4, ..., {max_threads}")
+    print(f"Noyaux              : {', '.join(kernels)}")
+    print(f"GIL                 : {'actif' if python_build_info()['gil_enabled'] else 'désactivé (free-threaded)'}")
     print("=" * 70)
     
-    # Benchmark mono-thread
-    mono_results = benchmark_mono(iterations, num_runs)
-    
-    # Benchmark multi-thread avec différents nombres de threads
-    multi_results = []
     thread_counts = [2**i for i in range(1, int(max_threads).bit_length() + 1) if 2**i <= max_threads]
+    by_kernel = {}
+    
+    # Un pool persistant par nombre de processus, partagé par tous les noyaux
+    pools = {n: MonteCarloPool(n).start() for n in thread_counts} if with_processes else {}
     
-    for num_threads in thread_counts:
-        result = benchmark_multi(iterations, num_threads, num_runs)
-        result['speedup'] = mono_results['avg_time'] / result['avg_time']
-        result['efficiency'] = result['speedup'] / num_threads
-        multi_results.append(result)
+    try:
+        for kernel in kernels:
+            # Benchmark mono-thread
+            mono_results = benchmark_mono(iterations, num_runs, kernel, warmup_runs)
+            
+            # Benchmark multi-thread avec différents nombres de threads
+            multi_results = []
+            for num_threads in thread_counts:
+                result = benchmark_multi(iterations, num_threads, num_runs, kernel, warmup_runs)
+                set_speedup(result, mono_results)
+                result['efficiency'] = result['speedup'] / num_threads
+                multi_results.append(result)
+            
+            by_kernel[kernel] = {
+                'mono_thread': mono_results,
+                'multi_thread': multi_results
+            }
+            
+            if pools:
+                process_results = []
+                for num_processes, pool in pools.items():
+                    result = benchmark_multiprocessing(iterations, num_processes, num_runs, pool,
+                                                       kernel, warmup_runs)
+                    set_speedup(result, mono_results)
+                    result['efficiency'] = result['speedup'] / num_processes
+                    process_results.append(result)
+                by_kernel[kernel]['multiprocessing'] = process_results
+    finally:
+        for pool in pools.values():
+            pool.close()
     
     # Résumé
     print("\n" + "=" * 70)
     print("RÉSUMÉ DES RÉSULTATS")
     print("=" * 70)
-    print(f"{'Configuration':<20} {'Temps (s)':<15} {'Speedup':<12} {'Efficacité':<12}")
-    print("-" * 70)
-    print(f"{'Mono-thread':<20} {mono_results['avg_time']:<15.4f} {'1.00x':<12} {'100%':<12}")
+    print(f"{'Configuration':<16} {'Médiane (s)':<13} {'Speedup':<24} {'Efficacité':<12}")
     
-    for result in multi_results:
-        threads = result['num_threads']
-        time_str = f"{result['avg_time']:.4f}"
-        speedup_str = f"{result['speedup']:.2f}x"
-        efficiency_str = f"{result['efficiency'] * 100:.1f}%"
-        print(f"{f'{threads} threads':<20} {time_str:<15} {speedup_str:<12} {efficiency_str:<12}")
+    for kernel, kernel_results in by_kernel.items():
+        print("-" * 70)
+        print(f"Noyau : {kernel}")
+        mono_time = kernel_results['mono_thread']['median_time']
+        print(f"{'Mono-thread':<16} {mono_time:<13.4f} {'1.00x':<24} {'100%':<12}")
+        
+        for result in kernel_results['multi_thread']:
+            threads = result['num_threads']
+            time_str = f"{result['median_time']:.4f}"
+            efficiency_str = f"{result['efficiency'] * 100:.1f}%"
+            print(f"{f'{threads} threads':<16} {time_str:<13} {format_speedup(result):<24} "
+                  f"{efficiency_str:<12}")
+        
+        for result in kernel_results.get('multiprocessing', []):
+            processes = result['num_processes']
+            time_str = f"{result['median_time']:.4f}"
+            efficiency_str = f"{result['efficiency'] * 100:.1f}%"
+            print(f"{f'{processes} processus':<16} {time_str:<13} {format_speedup(result):<24} "
+                  f"{efficiency_str:<12}")
     
     print("=" * 70)
     
@@ -150,15 +751,75 @@ def compare_performance(iterations=10_000_000, max_threads=8, num_runs=10):
     results = {
         'iterations': iterations,
         'num_runs': num_runs,
-        'mono_thread': mono_results,
-        'multi_thread': multi_results
+        'warmup_runs': warmup_runs,
+        'python': python_build_info(),
+        'mono_thread': by_kernel[kernels[0]]['mono_thread'],
+        'multi_thread': by_kernel[kernels[0]]['multi_thread'],
+        'by_kernel': by_kernel
     }
     
-    # Créer le dossier results s'il n'existe pas
-    os.makedirs('results', exist_ok=True)
+    # Sauvegarder en JSON et dans l'historique
+    save_results(results, 'results/benchmark_results.json', 'benchmark', history_path)
+    
+    return results
+
+
+def compare_error_vs_n(sizes, kernels=('numpy', 'halton'), num_seeds=10):
+    """
+    Compare l'erreur d'estimation en fonction du nombre de points.
     
-    # Sauvegarder en JSON
-    output_file = 'results/benchmark_results.json'
+    Pour chaque noyau et chaque taille N, Pi est estimé avec `num_seeds`
+    graines différentes ; l'erreur quadratique moyenne (RMSE) est calculée
+    puis la pente log-log donne l'ordre de convergence observé
+    (≈ -0.5 pour le pseudo-aléatoire, plus raide pour Halton).
+    
+    Args:
+        sizes: Liste des nombres de points N à tester
+        kernels: Noyaux de calcul à comparer
+        num_seeds: Nombre de graines (répétitions) par configuration
+        
+    Returns:
+        Dict avec les RMSE par noyau et l'ordre de convergence
+    """
+    print("=" * 70)
+    print("CONVERGENCE : ERREUR EN FONCTION DE N")
+    print("=" * 70)
+    print(f"Tailles testées     : {', '.join(f'{n:,}' for n in sizes)}")
+    print(f"Graines par taille  : {num_seeds}")
+    print("=" * 70)
+    
+    by_kernel = {}
+    for kernel in kernels:
+        print(f"\n🔄 Noyau {kernel}...")
+        rmse = []
+        for n in sizes:
+            errors = [monte_carlo_pi_mono(n, kernel, seed=seed) - math.pi
+                      for seed in range(num_seeds)]
+            rmse.append(math.sqrt(statistics.mean(e * e for e in errors)))
+            print(f"  N = {n:>13,} : RMSE = {rmse[-1]:.3e}")
+        
+        # Pente de log(RMSE) en fonction de log(N)
+        order = float(np.polyfit(np.log(sizes), np.log(rmse), 1)[0]) if len(sizes) > 1 else None
+        by_kernel[kernel] = {'rmse': rmse, 'convergence_order': order}
+    
+    # Résumé
+    print("\n" + "=" * 70)
+    print(f"{'Noyau':<12} {'Ordre':<10} " + " ".join(f"{f'N={n:.0e}':<11}" for n in sizes))
+    print("-" * 70)
+    for kernel, data in by_kernel.items():
+        order = data['convergence_order']
+        order_str = f"{order:.2f}" if order is not None else "-"
+        print(f"{kernel:<12} {order_str:<10} " + " ".join(f"{e:<11.2e}" for e in data['rmse']))
+    print("=" * 70)
+    
+    results = {
+        'sizes': list(sizes),
+        'num_seeds': num_seeds,
+        'by_kernel': by_kernel
+    }
+    
+    os.makedirs('results', exist_ok=True)
+    output_file = 'results/error_vs_n.json'
     with open(output_file, 'w') as f:
         json.dump(results, f, indent=2)
     
@@ -176,13 +837,97 @@ def main():
                         help='Nombre maximum de threads à tester (défaut: 8)')
     parser.add_argument('--runs', type=int, default=10,
                         help='Nombre de runs par configuration (défaut: 10)')
+    parser.add_argument('--warmup', type=int, default=DEFAULT_WARMUP_RUNS,
+                        help=f'Runs de chauffe non mesurés par configuration '
+                             f'(défaut: {DEFAULT_WARMUP_RUNS})')
+    parser.add_argument('--kernels', nargs='+', choices=KERNELS, default=None,
+                        help='Noyaux de calcul à comparer (défaut: python, '
+                             'ou numpy et halton avec --error-vs-n)')
+    parser.add_argument('--multiprocessing', action='store_true',
+                        help='Mesure aussi le multiprocessing (un pool persistant par '
+                             'nombre de processus, réutilisé pour tous les runs)')
+    parser.add_argument('--error-vs-n', action='store_true',
+                        help='Compare la convergence de l\'erreur (N de 1,000 à --iterations)')
+    parser.add_argument('--backends', nargs='*', choices=available_backends(), default=None,
+                        help='Compare les moteurs du registre (sans nom : tous) ; '
+                             '--max-threads borne le nombre de workers')
+    parser.add_argument('--sweep', action='store_true',
+                        help='Balaye moteurs × workers × tailles (moteurs : --backends, '
+                             f'défaut: {" ".join(DEFAULT_SWEEP_BACKENDS)})')
+    parser.add_argument('--sizes', nargs='+', type=int, default=None,
+                        help='Nombres d\'itérations du balayage '
+                             f'(défaut: {" ".join(f"{n:_}" for n in DEFAULT_SWEEP_SIZES)})')
+    parser.add_argument('--workers', nargs='+', type=int, default=None,
+                        help='Nombres de workers du balayage ou de l\'étude de scaling '
+                             '(défaut: puissances de 2, cœurs physiques, cœurs logiques, '
+                             '2 × cœurs logiques)')
+    parser.add_argument('--scaling', action='store_true',
+                        help='Étude de scaling fort (--iterations au total) et faible '
+                             '(--iterations-per-worker), ajustements Amdahl et Gustafson '
+                             f'(moteurs : --backends, défaut: {" ".join(DEFAULT_SCALING_BACKENDS)})')
+    parser.add_argument('--iterations-per-worker', type=int, default=DEFAULT_ITERATIONS_PER_WORKER,
+                        help=f'Points par worker en scaling faible '
+                             f'(défaut: {DEFAULT_ITERATIONS_PER_WORKER:,})')
+    parser.add_argument('--target-efficiency', type=float, default=DEFAULT_TARGET_EFFICIENCY,
+                        help=f'Efficacité minimale d\'un cœur utile '
+                             f'(défaut: {DEFAULT_TARGET_EFFICIENCY})')
+    parser.add_argument('--history', default=DEFAULT_HISTORY_PATH,
+                        help=f'Historique où ajouter le run (défaut: {DEFAULT_HISTORY_PATH})')
+    parser.add_argument('--no-history', action='store_true',
+                        help='N\'ajoute pas le run à l\'historique')
     args = parser.parse_args()
+    history_path = None if args.no_history else args.history
+    
+    if args.scaling:
+        kernel = args.kernels[0] if args.kernels else None
+        run_scaling_study(args.backends or DEFAULT_SCALING_BACKENDS, args.workers, args.iterations,
+                          args.iterations_per_worker, args.runs, kernel, args.warmup,
+                          args.target_efficiency, history_path)
+        try:
+            import visualize_results
+            visualize_results.plot_scaling(visualize_results.load_results('results/scaling_results.json'))
+        except ImportError:
+            print("⚠️  Module matplotlib non disponible. Installez-le pour générer les graphiques.")
+        return
+    
+    if args.sweep:
+        kernel = args.kernels[0] if args.kernels else None
+        run_sweep(args.backends or DEFAULT_SWEEP_BACKENDS, args.workers,
+                  args.sizes or DEFAULT_SWEEP_SIZES, args.runs, kernel, args.warmup, history_path)
+        try:
+            import visualize_results
+            visualize_results.plot_sweep(visualize_results.load_results('results/sweep_results.json'))
+        except ImportError:
+            print("⚠️  Module matplotlib non disponible. Installez-le pour générer les graphiques.")
+        return
+    
+    if args.backends is not None:
+        kernel = args.kernels[0] if args.kernels else None
+        compare_backends(args.iterations, args.max_threads, args.runs, args.backends, kernel,
+                         args.warmup, history_path)
+        return
+    
+    if args.error_vs_n:
+        kernels = tuple(args.kernels or ('numpy', 'halton'))
+        sizes = [10 ** k for k in range(3, int(math.log10(args.iterations)) + 1)]
+        compare_error_vs_n(sizes, kernels, num_seeds=args.runs)
+        
+        try:
+            import visualize_results
+            visualize_results.plot_error_vs_n(visualize_results.load_results('results/error_vs_n.json'))
+        except ImportError:
+            print("⚠️  Module matplotlib non disponible. Installez-le pour générer les graphiques.")
+        return
     
     # Exécuter la comparaison
     results = compare_performance(
         iterations=args.iterations,
         max_threads=args.max_threads,
-        num_runs=args.runs
+        num_runs=args.runs,
+        kernels=tuple(args.kernels or ('python',)),
+        warmup_runs=args.warmup,
+        history_path=history_path,
+        with_processes=args.multiprocessing
     )
     
     # Générer les graphiques
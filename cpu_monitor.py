@@ -3,7 +3,7 @@ Monitoring CPU en temps réel pendant l'exécution.
 
 Ce script permet de :
 1. Monitorer l'utilisation CPU pendant l'exécution
-2. Comparer l'utilisation entre mono-thread et multi-thread
+2. Comparer l'utilisation entre les moteurs du registre (backends.py)
 3. Générer des graphiques d'utilisation CPU
 """
 
@@ -13,12 +13,14 @@ import psutil
 import matplotlib.pyplot as plt
 import argparse
 import os
-from mono_thread import monte_carlo_pi_mono
-from multi_thread import monte_carlo_pi_multi
-from multiprocessing_version import monte_carlo_pi_multiprocessing
+from backends import available_backends, estimate_pi, resolve_backend, shutdown_pool
 import multiprocessing as mp
 
 
+# Moteurs comparés par défaut
+DEFAULT_BACKENDS = ('mono', 'thread', 'process')
+
+
 class CPUMonitor:
     """
     Classe pour monitorer l'utilisation CPU en temps réel.
@@ -119,12 +121,14 @@ def benchmark_with_monitoring(func, *args, label="Test"):
     return result, monitor, execution_time
 
 
-def compare_cpu_usage(iterations=5_000_000):
+def compare_cpu_usage(iterations=5_000_000, backends=DEFAULT_BACKENDS, workers=4):
     """
-    Compare l'utilisation CPU entre les différentes versions.
+    Compare l'utilisation CPU entre les différents moteurs du registre.
     
     Args:
         iterations: Nombre d'itérations pour chaque test
+        backends: Noms des moteurs à comparer (voir backends.BACKENDS)
+        workers: Nombre de threads / processus des moteurs parallèles
     """
     print("\n" + "🔬" * 30)
     print("COMPARAISON UTILISATION CPU")
@@ -134,52 +138,37 @@ def compare_cpu_usage(iterations=5_000_000):
     
     results = {}
     
-    # Test 1 : Mono-thread
-    print("\n" + "=" * 60)
-    print("TEST 1/3 : MONO-THREAD")
-    print("=" * 60)
-    _, monitor_mono, time_mono = benchmark_with_monitoring(
-        monte_carlo_pi_mono, iterations, label="Mono-Thread"
-    )
-    results['mono'] = {
-        'monitor': monitor_mono,
-        'time': time_mono,
-        'label': 'Mono-Thread'
-    }
-    
-    # Test 2 : Multi-thread
-    num_threads = 4
-    print("\n" + "=" * 60)
-    print(f"TEST 2/3 : MULTI-THREAD ({num_threads} threads)")
-    print("=" * 60)
-    _, monitor_multi, time_multi = benchmark_with_monitoring(
-        monte_carlo_pi_multi, iterations, num_threads, label=f"Multi-Thread ({num_threads} threads)"
-    )
-    results['multi'] = {
-        'monitor': monitor_multi,
-        'time': time_multi,
-        'label': f'Multi-Thread ({num_threads}T)'
-    }
-    
-    # Test 3 : Multiprocessing
-    num_processes = 4
-    print("\n" + "=" * 60)
-    print(f"TEST 3/3 : MULTIPROCESSING ({num_processes} processus)")
-    print("=" * 60)
-    _, monitor_mp, time_mp = benchmark_with_monitoring(
-        monte_carlo_pi_multiprocessing, iterations, num_processes, 
-        label=f"Multiprocessing ({num_processes} processus)"
-    )
-    results['multiprocessing'] = {
-        'monitor': monitor_mp,
-        'time': time_mp,
-        'label': f'Multiprocessing ({num_processes}P)'
-    }
+    try:
+        for index, backend in enumerate(backends, 1):
+            name, backend_workers, kernel = resolve_backend(iterations, backend, workers)
+            label = name if backend_workers is None else f"{name} ({backend_workers} workers)"
+            print("\n" + "=" * 60)
+            print(f"TEST {index}/{len(backends)} : {label.upper()}")
+            print("=" * 60)
+            
+            # Appel non mesuré : démarre les ressources persistantes (pool, ...)
+            warmup_start = time.perf_counter()
+            estimate_pi(10_000, name, backend_workers, kernel)
+            warmup_time = time.perf_counter() - warmup_start
+            print(f"Démarrage / warm-up  : {warmup_time:.4f}s")
+            
+            _, monitor, elapsed = benchmark_with_monitoring(
+                estimate_pi, iterations, name, backend_workers, kernel, label=label
+            )
+            results[name] = {
+                'monitor': monitor,
+                'time': elapsed,
+                'warmup_time': warmup_time,
+                'label': label
+            }
+    finally:
+        shutdown_pool()
     
     # Générer les graphiques
     plot_cpu_comparison(results)
     
     # Résumé
+    reference_time = next(iter(results.values()))['time']
     print("\n" + "=" * 60)
     print("RÉSUMÉ")
     print("=" * 60)
@@ -188,7 +177,7 @@ def compare_cpu_usage(iterations=5_000_000):
     
     for key, data in results.items():
         stats = data['monitor'].get_stats()
-        speedup = time_mono / data['time']
+        speedup = reference_time / data['time']
         print(f"{data['label']:<25} {data['time']:<12.4f} {stats['avg_cpu']:<12.1f}% {speedup:<10.2f}x")
     
     print("=" * 60)
@@ -207,9 +196,11 @@ def plot_cpu_comparison(results):
     os.makedirs('graphs', exist_ok=True)
     
     # Graphique 1 : Utilisation CPU au fil du temps
-    fig, axes = plt.subplots(3, 1, figsize=(12, 10))
+    fig, axes = plt.subplots(len(results), 1, figsize=(12, 3.4 * len(results)), squeeze=False)
+    axes = axes[:, 0]
     
-    colors = {'mono': 'red', 'multi': 'green', 'multiprocessing': 'blue'}
+    palette = ['red', 'green', 'blue', 'orange', 'purple', 'brown', 'gray']
+    colors = {key: palette[i % len(palette)] for i, key in enumerate(results)}
     
     for idx, (key, data) in enumerate(results.items()):
         monitor = data['monitor']
@@ -232,7 +223,7 @@ def plot_cpu_comparison(results):
         ax.legend(loc='upper right')
     
     axes[-1].set_xlabel('Temps (secondes)', fontsize=11)
-    plt.suptitle('Comparaison Utilisation CPU : Mono vs Multi vs Multiprocessing', 
+    plt.suptitle('Comparaison Utilisation CPU par moteur', 
                  fontsize=14, fontweight='bold')
     plt.tight_layout()
     plt.savefig('graphs/cpu_usage_timeline.png', dpi=300)
@@ -271,9 +262,14 @@ def main():
     parser = argparse.ArgumentParser(description='Monitoring CPU en temps réel')
     parser.add_argument('--iterations', type=int, default=5_000_000,
                         help='Nombre d\'itérations (défaut: 5,000,000)')
+    parser.add_argument('--backends', nargs='+', choices=available_backends(),
+                        default=list(DEFAULT_BACKENDS),
+                        help=f'Moteurs à comparer (défaut: {" ".join(DEFAULT_BACKENDS)})')
+    parser.add_argument('--workers', type=int, default=4,
+                        help='Nombre de threads / processus des moteurs parallèles (défaut: 4)')
     args = parser.parse_args()
     
-    compare_cpu_usage(iterations=args.iterations)
+    compare_cpu_usage(iterations=args.iterations, backends=args.backends, workers=args.workers)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,512 @@
+"""
+Simulation Monte Carlo pour calculer Pi - VERSION DISTRIBUÉE (TCP)
+
+Cette version répartit une seule estimation sur plusieurs machines :
+- Un coordinateur découpe le run en blocs et les distribue sous forme de
+  baux (leases) sur une socket TCP
+- Des workers, sur n'importe quelle machine, demandent un bloc, exécutent
+  le noyau existant et renvoient leurs compteurs
+- Un bail non rendu à temps (worker planté, réseau coupé) est réattribué
+  à un autre worker
+- Le bloc k utilise toujours le k-ième flux enfant de la graine : le
+  résultat est identique à celui de monte_carlo_pi_multiprocessing en
+  ordonnancement dynamique, avec la même graine et le même nombre de blocs
+
+Protocole : une ligne JSON par message (pas de pickle, aucun code reçu du
+réseau n'est exécuté).
+"""
+
+import json
+import time
+import socket
+import argparse
+import threading
+import socketserver
+import multiprocessing as mp
+import numpy as np
+from monte_carlo_core import (
+    DEFAULT_CHUNK_SIZE, KERNELS, VARIANCE_KERNELS, print_variance_report, split_iterations,
+    variance_stats
+)
+from multiprocessing_version import worker_task_indexed
+
+
+# Adresse d'écoute par défaut du coordinateur
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 5555
+
+# Nombre de blocs par défaut d'un run distribué
+DEFAULT_NUM_CHUNKS = 64
+
+# Durée d'un bail avant réattribution du bloc (secondes)
+DEFAULT_LEASE_TIMEOUT = 30.0
+
+# Pause conseillée à un worker quand tous les blocs restants sont loués
+WAIT_DELAY = 0.2
+
+
+def send_message(stream, message):
+    """
+    Envoie un message JSON terminé par un saut de ligne.
+
+    Args:
+        stream: Fichier binaire en écriture (socket.makefile('wb'))
+        message: Dict sérialisable en JSON
+    """
+    stream.write(json.dumps(message).encode('utf-8') + b'\n')
+    stream.flush()
+
+
+def receive_message(stream):
+    """
+    Lit un message JSON (une ligne).
+
+    Args:
+        stream: Fichier binaire en lecture (socket.makefile('rb'))
+
+    Returns:
+        Dict du message, ou None si la connexion est fermée
+    """
+    line = stream.readline()
+    if not line:
+        return None
+    return json.loads(line)
+
+
+class Coordinator:
+    """
+    Distribue les blocs d'un run sous forme de baux et agrège les résultats.
+
+    Exemple :
+        coordinator = Coordinator(10**10, seed=42, kernel='numpy')
+        coordinator.serve('0.0.0.0', 5555)
+        pi = coordinator.wait()
+        coordinator.close()
+    """
+
+    def __init__(self, total_iterations, seed=None, num_chunks=DEFAULT_NUM_CHUNKS,
+                 kernel='python', chunk_size=DEFAULT_CHUNK_SIZE,
+                 lease_timeout=DEFAULT_LEASE_TIMEOUT):
+        """
+        Initialise le run (aucun bloc distribué).
+
+        Args:
+            total_iterations: Nombre total de points à générer
+            seed: Graine globale (défaut: aléatoire)
+            num_chunks: Nombre de blocs du run
+            kernel: Noyau de calcul exécuté par les workers (voir KERNELS)
+            chunk_size: Taille des blocs pour les noyaux vectorisés
+            lease_timeout: Durée d'un bail avant réattribution (secondes)
+        """
+        if kernel not in KERNELS:
+            raise ValueError(f"Noyau inconnu : {kernel!r} (choix : {', '.join(KERNELS)})")
+        self.total_iterations = total_iterations
+        self.num_chunks = max(1, min(num_chunks, total_iterations))
+        self.entropy = np.random.SeedSequence(seed).entropy
+        self.kernel = kernel
+        self.chunk_size = chunk_size
+        self.lease_timeout = lease_timeout
+        self.tasks = split_iterations(total_iterations, self.num_chunks)
+
+        self.pending = list(range(self.num_chunks))
+        self.leases = {}
+        self.results = {}
+        self.reissued = 0
+        self._next_lease_id = 0
+        self._lock = threading.Lock()
+        self._done = threading.Condition(self._lock)
+        self.server = None
+        self._server_thread = None
+        self.start_time = None
+
+    def _reclaim_expired(self, now):
+        """Remet en file les blocs dont le bail a expiré (verrou déjà pris)."""
+        for lease_id, (index, expires) in list(self.leases.items()):
+            if expires <= now:
+                del self.leases[lease_id]
+                if index not in self.results:
+                    self.pending.append(index)
+                    self.reissued += 1
+
+    def lease(self):
+        """
+        Attribue un bloc à un worker.
+
+        Returns:
+            Message 'chunk' (bloc à calculer), 'wait' (tous les blocs
+            restants sont loués) ou 'done' (run terminé)
+        """
+        with self._lock:
+            if len(self.results) == self.num_chunks:
+                return {'type': 'done'}
+            now = time.monotonic()
+            self._reclaim_expired(now)
+            if not self.pending:
+                return {'type': 'wait', 'delay': WAIT_DELAY}
+
+            index = self.pending.pop(0)
+            lease_id = self._next_lease_id
+            self._next_lease_id += 1
+            self.leases[lease_id] = (index, now + self.lease_timeout)
+            return {
+                'type': 'chunk',
+                'lease_id': lease_id,
+                'index': index,
+                'iterations': self.tasks[index],
+                'entropy': self.entropy,
+                'kernel': self.kernel,
+                'chunk_size': self.chunk_size,
+            }
+
+    def report(self, lease_id, index, inside, variance_sum=None):
+        """
+        Enregistre le résultat d'un bloc.
+
+        Un résultat en double (bail expiré puis réattribué) est ignoré : le
+        bloc étant déterministe, les deux résultats sont identiques.
+
+        Args:
+            lease_id: Identifiant du bail
+            index: Indice du bloc
+            inside: Nombre de points dans le cercle
+            variance_sum: Contribution à la variance (noyaux stratifiés)
+
+        Returns:
+            True si le résultat a été pris en compte
+        """
+        with self._lock:
+            self.leases.pop(lease_id, None)
+            if index in self.results or not 0 <= index < self.num_chunks:
+                return False
+            self.results[index] = (inside, variance_sum)
+            if index in self.pending:
+                self.pending.remove(index)
+            if len(self.results) == self.num_chunks:
+                self._done.notify_all()
+            return True
+
+    def progress(self):
+        """
+        Retourne l'avancement du run.
+
+        Returns:
+            Tuple (blocs terminés, blocs loués, blocs réattribués)
+        """
+        with self._lock:
+            return len(self.results), len(self.leases), self.reissued
+
+    def serve(self, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        """
+        Démarre le serveur TCP dans un thread en arrière-plan.
+
+        Args:
+            host: Adresse d'écoute ('0.0.0.0' pour accepter d'autres machines)
+            port: Port d'écoute (0 = port libre choisi par le système)
+
+        Returns:
+            Tuple (host, port) effectivement utilisé
+        """
+        self.server = CoordinatorServer((host, port), CoordinatorHandler)
+        self.server.coordinator = self
+        self._server_thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self._server_thread.start()
+        self.start_time = time.perf_counter()
+        return self.server.server_address
+
+    def wait(self, timeout=None, progress=None, poll_interval=1.0):
+        """
+        Attend la fin du run et agrège les résultats.
+
+        Args:
+            timeout: Durée maximale d'attente (défaut: illimitée)
+            progress: Fonction optionnelle appelée avec (terminés, loués, réattribués)
+            poll_interval: Intervalle d'appel de progress (secondes)
+
+        Returns:
+            Estimation de Pi
+
+        Raises:
+            TimeoutError: Run non terminé à l'échéance
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._done:
+            while len(self.results) < self.num_chunks:
+                remaining = poll_interval
+                if deadline is not None:
+                    remaining = min(remaining, deadline - time.monotonic())
+                    if remaining <= 0:
+                        raise TimeoutError(f"Run non terminé : {len(self.results)}/"
+                                           f"{self.num_chunks} blocs")
+                self._done.wait(remaining)
+                if progress is not None:
+                    progress(len(self.results), len(self.leases), self.reissued)
+        self.execution_time = time.perf_counter() - self.start_time
+
+        # Même réduction que monte_carlo_pi_multiprocessing : somme des résultats
+        total_inside = sum(inside for inside, _ in self.results.values())
+        variance_sum = None
+        if self.kernel in VARIANCE_KERNELS:
+            variance_sum = sum(v for _, v in self.results.values())
+        self.stats = variance_stats(total_inside, self.total_iterations, variance_sum)
+        return 4 * total_inside / self.total_iterations
+
+    def close(self):
+        """Arrête le serveur TCP."""
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+
+
+class CoordinatorServer(socketserver.ThreadingTCPServer):
+    """Serveur TCP du coordinateur (un thread par worker connecté)."""
+
+    allow_reuse_address = True
+    daemon_threads = True
+
+
+class CoordinatorHandler(socketserver.StreamRequestHandler):
+    """Dialogue avec un worker : baux demandés, résultats rendus."""
+
+    def handle(self):
+        coordinator = self.server.coordinator
+        while True:
+            try:
+                message = receive_message(self.rfile)
+            except (ConnectionError, ValueError):
+                return
+            if message is None:
+                return
+
+            if message['type'] == 'lease':
+                reply = coordinator.lease()
+            elif message['type'] == 'result':
+                accepted = coordinator.report(message['lease_id'], message['index'],
+                                              message['inside'], message.get('variance_sum'))
+                reply = {'type': 'ack', 'accepted': accepted}
+            else:
+                reply = {'type': 'error', 'message': f"Type inconnu : {message['type']!r}"}
+
+            try:
+                send_message(self.wfile, reply)
+            except ConnectionError:
+                return
+
+
+def compute_chunk(lease):
+    """
+    Calcule un bloc loué avec le noyau existant.
+
+    Args:
+        lease: Message 'chunk' reçu du coordinateur
+
+    Returns:
+        Tuple (points dans le cercle, contribution à la variance ou None)
+    """
+    # SeedSequence(entropy, spawn_key=(k,)) est le k-ième enfant de la racine
+    seed_sequence = np.random.SeedSequence(lease['entropy'], spawn_key=(lease['index'],))
+    task = (lease['index'], (lease['iterations'], seed_sequence, lease['kernel'],
+                             lease['chunk_size']))
+    _, result = worker_task_indexed(task)
+    return result
+
+
+def run_worker(host=DEFAULT_HOST, port=DEFAULT_PORT, max_chunks=None, connect_timeout=10.0):
+    """
+    Boucle d'un worker : demande des blocs jusqu'à la fin du run.
+
+    Args:
+        host: Adresse du coordinateur
+        port: Port du coordinateur
+        max_chunks: Nombre maximal de blocs à calculer (défaut: illimité)
+        connect_timeout: Durée pendant laquelle réessayer la connexion (secondes)
+
+    Returns:
+        Nombre de blocs calculés par ce worker
+    """
+    deadline = time.monotonic() + connect_timeout
+    while True:
+        try:
+            sock = socket.create_connection((host, port))
+            break
+        except ConnectionRefusedError:
+            # Le coordinateur n'est peut-être pas encore démarré
+            if time.monotonic() >= deadline:
+                raise
+            time.sleep(WAIT_DELAY)
+
+    computed = 0
+    with sock, sock.makefile('rb') as rfile, sock.makefile('wb') as wfile:
+        while max_chunks is None or computed < max_chunks:
+            send_message(wfile, {'type': 'lease'})
+            lease = receive_message(rfile)
+            if lease is None or lease['type'] == 'done':
+                break
+            if lease['type'] == 'wait':
+                time.sleep(lease['delay'])
+                continue
+
+            inside, variance_sum = compute_chunk(lease)
+            send_message(wfile, {'type': 'result', 'lease_id': lease['lease_id'],
+                                 'index': lease['index'], 'inside': inside,
+                                 'variance_sum': variance_sum})
+            if receive_message(rfile) is None:
+                break
+            computed += 1
+    return computed
+
+
+def monte_carlo_pi_distributed_local(total_iterations, num_workers, seed=None,
+                                     num_chunks=DEFAULT_NUM_CHUNKS, kernel='python',
+                                     lease_timeout=DEFAULT_LEASE_TIMEOUT, stats=None):
+    """
+    Calcule Pi avec un coordinateur et des workers TCP sur la machine locale.
+
+    Exerce exactement le même chemin réseau qu'un déploiement multi-machines.
+
+    Args:
+        total_iterations: Nombre total de points à générer
+        num_workers: Nombre de processus workers à lancer
+        seed: Graine globale (défaut: aléatoire)
+        num_chunks: Nombre de blocs du run
+        kernel: Noyau de calcul (voir KERNELS)
+        lease_timeout: Durée d'un bail avant réattribution (secondes)
+        stats: Dict optionnel, rempli avec la variance obtenue
+
+    Returns:
+        Estimation de Pi
+    """
+    coordinator = Coordinator(total_iterations, seed, num_chunks, kernel,
+                              lease_timeout=lease_timeout)
+    host, port = coordinator.serve(DEFAULT_HOST, 0)
+    workers = [mp.Process(target=run_worker, args=(host, port)) for _ in range(num_workers)]
+    try:
+        for p in workers:
+            p.start()
+        pi_estimate = coordinator.wait()
+    finally:
+        coordinator.close()
+        for p in workers:
+            p.join(timeout=5)
+            if p.is_alive():
+                p.terminate()
+    if stats is not None:
+        stats.update(coordinator.stats)
+    return pi_estimate
+
+
+def print_results(coordinator, pi_estimate):
+    """Affiche le résultat d'un run distribué."""
+    completed, _, reissued = coordinator.progress()
+    print("=" * 60)
+    print("RÉSULTATS")
+    print("=" * 60)
+    print(f"Estimation de Pi     : {pi_estimate:.8f}")
+    print(f"Valeur réelle de Pi  : {3.14159265:.8f}")
+    print(f"Erreur               : {abs(pi_estimate - 3.14159265):.8f}")
+    print(f"Blocs terminés       : {completed} (dont {reissued} réattribués)")
+    print(f"Temps d'exécution    : {coordinator.execution_time:.4f} secondes")
+    print(f"Itérations/seconde   : {coordinator.total_iterations / coordinator.execution_time:,.0f}")
+    if coordinator.kernel in VARIANCE_KERNELS:
+        print_variance_report(coordinator.stats)
+    print("=" * 60)
+
+
+def main():
+    """Fonction principale : coordinateur, worker ou run local complet."""
+    parser = argparse.ArgumentParser(description='Simulation Monte Carlo - Distribuée (TCP)')
+    subparsers = parser.add_subparsers(dest='role', required=True)
+
+    run_parser = argparse.ArgumentParser(add_help=False)
+    run_parser.add_argument('--iterations', type=int, default=10_000_000,
+                            help='Nombre d\'itérations (défaut: 10,000,000)')
+    run_parser.add_argument('--seed', type=int, default=None,
+                            help='Graine pour un run reproductible (défaut: aléatoire)')
+    run_parser.add_argument('--chunks', type=int, default=DEFAULT_NUM_CHUNKS,
+                            help=f'Nombre de blocs distribués (défaut: {DEFAULT_NUM_CHUNKS})')
+    run_parser.add_argument('--kernel', choices=KERNELS, default='python',
+                            help='Noyau de calcul (défaut: python)')
+    run_parser.add_argument('--lease-timeout', type=float, default=DEFAULT_LEASE_TIMEOUT,
+                            help=f'Durée d\'un bail avant réattribution '
+                                 f'(défaut: {DEFAULT_LEASE_TIMEOUT} s)')
+
+    coordinator_parser = subparsers.add_parser('coordinator', parents=[run_parser],
+                                               help='Distribue les blocs et agrège les résultats')
+    coordinator_parser.add_argument('--host', default=DEFAULT_HOST,
+                                    help=f'Adresse d\'écoute (défaut: {DEFAULT_HOST})')
+    coordinator_parser.add_argument('--port', type=int, default=DEFAULT_PORT,
+                                    help=f'Port d\'écoute (défaut: {DEFAULT_PORT})')
+
+    worker_parser = subparsers.add_parser('worker', help='Calcule les blocs loués')
+    worker_parser.add_argument('--host', default=DEFAULT_HOST,
+                               help=f'Adresse du coordinateur (défaut: {DEFAULT_HOST})')
+    worker_parser.add_argument('--port', type=int, default=DEFAULT_PORT,
+                               help=f'Port du coordinateur (défaut: {DEFAULT_PORT})')
+
+    local_parser = subparsers.add_parser('local', parents=[run_parser],
+                                         help='Coordinateur + workers sur cette machine')
+    local_parser.add_argument('--workers', type=int, default=None,
+                              help='Nombre de workers locaux (défaut: nombre de CPU)')
+    args = parser.parse_args()
+
+    if args.role == 'worker':
+        computed = run_worker(args.host, args.port)
+        print(f"Worker terminé : {computed} bloc(s) calculé(s)")
+        return {'chunks': computed}
+
+    print("=" * 60)
+    print("SIMULATION MONTE CARLO - DISTRIBUÉE (TCP)")
+    print("=" * 60)
+    print(f"Nombre d'itérations  : {args.iterations:,}")
+    print(f"Nombre de blocs      : {args.chunks}")
+    print(f"Noyau                : {args.kernel}")
+    print(f"Durée d'un bail      : {args.lease_timeout} s")
+
+    coordinator = Coordinator(args.iterations, args.seed, args.chunks, args.kernel,
+                              lease_timeout=args.lease_timeout)
+    workers = []
+    if args.role == 'coordinator':
+        host, port = coordinator.serve(args.host, args.port)
+        print(f"En écoute sur        : {host}:{port}")
+        print(f"Lancer les workers   : python distributed.py worker --host <ip> --port {port}")
+    else:
+        num_workers = args.workers or mp.cpu_count()
+        host, port = coordinator.serve(DEFAULT_HOST, 0)
+        print(f"Workers locaux       : {num_workers} (port {port})")
+        workers = [mp.Process(target=run_worker, args=(host, port)) for _ in range(num_workers)]
+        for p in workers:
+            p.start()
+    print()
+
+    try:
+        pi_estimate = coordinator.wait(progress=lambda done, leased, reissued: print(
+            f"\rBlocs : {done}/{coordinator.num_chunks} terminés, {leased} loués, "
+            f"{reissued} réattribués", end='', flush=True))
+        print()
+    finally:
+        coordinator.close()
+        for p in workers:
+            p.join(timeout=5)
+            if p.is_alive():
+                p.terminate()
+
+    print_results(coordinator, pi_estimate)
+
+    completed, _, reissued = coordinator.progress()
+    return {
+        'pi_estimate': pi_estimate,
+        'execution_time': coordinator.execution_time,
+        'iterations': args.iterations,
+        'num_chunks': coordinator.num_chunks,
+        'reissued_leases': reissued,
+        'seed': args.seed,
+        'kernel': args.kernel,
+        'variance': coordinator.stats['variance'],
+        'iterations_per_second': args.iterations / coordinator.execution_time
+    }
+
+
+if __name__ == "__main__":
+    # Nécessaire pour Windows
+    mp.freeze_support()
+    main()
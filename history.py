@@ -0,0 +1,264 @@
+"""
+Historique des benchmarks, en ajout seul (JSON Lines).
+
+Chaque exécution de comparison.py réécrit son fichier de résultats
+(results/benchmark_results.json, ...) : c'est l'instantané utilisé par
+les graphiques et le contrôle de régression. L'historique, lui, ne fait
+que grandir : chaque run y ajoute une ligne JSON avec
+- la date (UTC) et le type de résultats ('benchmark', 'backends', 'sweep',
+  'scaling')
+- l'empreinte de la machine (host_profile.host_fingerprint) et sa
+  description
+- le build Python (version, GIL, free-threaded)
+- la révision git du code mesuré (et si l'arbre de travail était modifié)
+- les résultats complets
+
+Une ligne par run, écrite en une fois à la fin du fichier : un run
+interrompu ne corrompt pas les précédents, et les lignes illisibles
+(écriture tronquée) sont ignorées à la lecture.
+
+L'API de requête (iter_records, configuration_trend) suit une
+configuration d'un run à l'autre, par machine et par révision.
+"""
+
+import os
+import json
+import argparse
+import statistics
+import subprocess
+from datetime import datetime, timezone
+from monte_carlo_core import python_build_info
+from host_profile import host_fingerprint, host_info
+from regression import extract_configurations
+
+
+# Fichier d'historique par défaut
+DEFAULT_HISTORY_PATH = os.path.join('results', 'history.jsonl')
+
+# Version du format des lignes
+HISTORY_VERSION = 1
+
+# Types de résultats dont les configurations peuvent être suivies
+TREND_KINDS = ('benchmark', 'backends', 'sweep')
+
+
+def git_revision(path=None):
+    """
+    Retourne la révision git du code.
+
+    Args:
+        path: Dossier du dépôt (défaut: celui de ce module)
+
+    Returns:
+        Dict {'commit', 'dirty'}, ou None hors d'un dépôt git
+    """
+    path = path or os.path.dirname(os.path.abspath(__file__))
+    try:
+        commit = subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=path, capture_output=True,
+                                text=True, check=True).stdout.strip()
+        status = subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'],
+                                cwd=path, capture_output=True, text=True, check=True).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return {'commit': commit, 'dirty': bool(status.strip())}
+
+
+def make_record(kind, results):
+    """
+    Construit une ligne d'historique.
+
+    Args:
+        kind: Type de résultats ('benchmark', 'backends', 'sweep', 'scaling')
+        results: Dict des résultats à archiver
+
+    Returns:
+        Dict de la ligne
+    """
+    info = host_info()
+    return {
+        'version': HISTORY_VERSION,
+        'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'kind': kind,
+        'host_fingerprint': host_fingerprint(info),
+        'host': info,
+        'python': python_build_info(),
+        'git': git_revision(),
+        'results': results
+    }
+
+
+def append_results(kind, results, path=DEFAULT_HISTORY_PATH):
+    """
+    Ajoute un run à la fin de l'historique.
+
+    Args:
+        kind: Type de résultats ('benchmark', 'backends', 'sweep', 'scaling')
+        results: Dict des résultats à archiver
+        path: Fichier d'historique
+
+    Returns:
+        La ligne ajoutée
+    """
+    record = make_record(kind, results)
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    line = json.dumps(record, separators=(',', ':')) + '\n'
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write(line)
+    return record
+
+
+def iter_records(path=DEFAULT_HISTORY_PATH, kind=None, host=None, since=None, until=None,
+                 commit=None):
+    """
+    Parcourt l'historique, du plus ancien au plus récent.
+
+    Args:
+        path: Fichier d'historique
+        kind: Ne garder qu'un type de résultats
+        host: Ne garder qu'une empreinte de machine
+        since: Date ISO minimale incluse (ex: '2024-01-31')
+        until: Date ISO maximale exclue
+        commit: Ne garder qu'une révision git (préfixe du hash accepté)
+
+    Yields:
+        Dicts des lignes retenues
+    """
+    if not os.path.exists(path):
+        return
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # Ligne tronquée par un run interrompu
+                continue
+            if record.get('version') != HISTORY_VERSION:
+                continue
+            if kind is not None and record['kind'] != kind:
+                continue
+            if host is not None and record['host_fingerprint'] != host:
+                continue
+            if since is not None and record['timestamp'] < since:
+                continue
+            if until is not None and record['timestamp'] >= until:
+                continue
+            if commit is not None and not (record['git'] or {}).get('commit', '').startswith(commit):
+                continue
+            yield record
+
+
+def configuration_trend(config, path=DEFAULT_HISTORY_PATH, kind=None, host=None, since=None,
+                        until=None):
+    """
+    Suit le débit d'une configuration d'un run à l'autre.
+
+    Args:
+        config: Nom de configuration (voir regression.extract_configurations,
+            ex: 'thread [numpy] x4')
+        path: Fichier d'historique
+        kind: Type de résultats (défaut: tous ceux de TREND_KINDS)
+        host: Empreinte de machine (défaut: toutes)
+        since: Date ISO minimale incluse
+        until: Date ISO maximale exclue
+
+    Returns:
+        Liste de dicts {'timestamp', 'host_fingerprint', 'commit', 'dirty',
+        'python', 'throughput', 'num_runs'} ; débit médian en points/s
+    """
+    trend = []
+    for record in iter_records(path, kind, host, since, until):
+        if record['kind'] not in TREND_KINDS:
+            continue
+        entry = extract_configurations(record['results']).get(config)
+        if entry is None:
+            continue
+        median = statistics.median(entry['iterations'] / t for t in entry['times'])
+        git = record['git'] or {}
+        trend.append({
+            'timestamp': record['timestamp'],
+            'host_fingerprint': record['host_fingerprint'],
+            'commit': git.get('commit'),
+            'dirty': git.get('dirty'),
+            'python': record['python']['version'],
+            'throughput': median,
+            'num_runs': len(entry['times'])
+        })
+    return trend
+
+
+def list_configurations(path=DEFAULT_HISTORY_PATH, kind=None, host=None):
+    """
+    Liste les configurations présentes dans l'historique.
+
+    Args:
+        path: Fichier d'historique
+        kind: Type de résultats (défaut: tous ceux de TREND_KINDS)
+        host: Empreinte de machine (défaut: toutes)
+
+    Returns:
+        Dict {nom de configuration: nombre de runs archivés}
+    """
+    counts = {}
+    for record in iter_records(path, kind, host):
+        if record['kind'] in TREND_KINDS:
+            for config in extract_configurations(record['results']):
+                counts[config] = counts.get(config, 0) + 1
+    return counts
+
+
+def main():
+    """Consulte l'historique des benchmarks."""
+    parser = argparse.ArgumentParser(description='Historique des benchmarks')
+    parser.add_argument('--history', default=DEFAULT_HISTORY_PATH,
+                        help=f'Fichier d\'historique (défaut: {DEFAULT_HISTORY_PATH})')
+    parser.add_argument('--kind', choices=('benchmark', 'backends', 'sweep', 'scaling'),
+                        default=None, help='Type de résultats (défaut: tous)')
+    parser.add_argument('--host', default=None,
+                        help='Empreinte de machine (défaut: toutes ; "local" : cette machine)')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    subparsers.add_parser('list', help='Liste les runs archivés')
+    subparsers.add_parser('configs', help='Liste les configurations suivies')
+    trend = subparsers.add_parser('trend', help='Débit d\'une configuration au fil des runs')
+    trend.add_argument('config', help='Nom de configuration (voir la commande configs)')
+    trend.add_argument('--since', default=None, help='Date ISO minimale (ex: 2024-01-31)')
+    trend.add_argument('--until', default=None, help='Date ISO maximale (exclue)')
+    args = parser.parse_args()
+
+    host = host_fingerprint() if args.host == 'local' else args.host
+
+    if args.command == 'list':
+        print(f"{'Date (UTC)':<27} {'Type':<11} {'Machine':<18} {'Python':<9} {'Révision':<12}")
+        print("-" * 80)
+        for record in iter_records(args.history, args.kind, host):
+            git = record['git'] or {}
+            revision = (git.get('commit') or '-')[:10] + ('+' if git.get('dirty') else '')
+            print(f"{record['timestamp']:<27} {record['kind']:<11} "
+                  f"{record['host_fingerprint']:<18} {record['python']['version']:<9} "
+                  f"{revision:<12}")
+        return
+
+    if args.command == 'configs':
+        for config, count in sorted(list_configurations(args.history, args.kind, host).items()):
+            print(f"{config:<40} {count} run(s)")
+        return
+
+    points = configuration_trend(args.config, args.history, args.kind, host, args.since,
+                                 args.until)
+    if not points:
+        print(f"⚠️  Aucun run archivé pour la configuration {args.config!r}")
+        return
+    first = points[0]['throughput']
+    print(f"Configuration : {args.config}")
+    print(f"{'Date (UTC)':<27} {'Machine':<18} {'Révision':<12} {'Débit (pts/s)':>15} {'vs 1er':>8}")
+    print("-" * 84)
+    for point in points:
+        revision = (point['commit'] or '-')[:10] + ('+' if point['dirty'] else '')
+        print(f"{point['timestamp']:<27} {point['host_fingerprint']:<18} {revision:<12} "
+              f"{point['throughput']:>15,.0f} {point['throughput'] / first - 1:>+8.1%}")
+
+
+if __name__ == "__main__":
+    main()
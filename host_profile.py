@@ -0,0 +1,205 @@
+"""
+Profil de performance de la machine, produit par autotune.py.
+
+Le profil enregistre, pour chaque moteur et noyau, le nombre de workers et
+la taille de bloc qui ont donné le meilleur débit sur cette machine. Il est
+rangé dans un fichier JSON indexé par une empreinte de la machine : un
+même fichier peut contenir les profils de plusieurs hôtes (répertoire
+personnel partagé, conteneurs, ...), et un profil mesuré ailleurs n'est
+jamais appliqué par erreur.
+
+Le chemin du fichier peut être changé avec la variable d'environnement
+MONTE_CARLO_PROFILE ; la valeur 'off' désactive le profil.
+"""
+
+import os
+import json
+import hashlib
+import platform
+import numpy as np
+from monte_carlo_core import gil_enabled
+
+
+# Fichier des profils par défaut (un par utilisateur, indépendant du dossier courant)
+DEFAULT_PROFILE_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'monte_carlo_pi',
+                                    'host_profiles.json')
+
+# Version du format du fichier
+PROFILE_VERSION = 1
+
+# Profils déjà lus, par chemin de fichier
+_cache = {}
+
+
+def profile_path():
+    """
+    Retourne le chemin du fichier des profils.
+
+    Returns:
+        Chemin du fichier, ou None si le profil est désactivé
+    """
+    path = os.environ.get('MONTE_CARLO_PROFILE', DEFAULT_PROFILE_PATH)
+    return None if path == 'off' else path
+
+
+def physical_cpu_count():
+    """
+    Retourne le nombre de cœurs physiques (sans SMT / hyper-threading).
+
+    Returns:
+        Nombre de cœurs physiques, ou le nombre de cœurs logiques si
+        psutil ne sait pas le déterminer
+    """
+    try:
+        import psutil
+        return psutil.cpu_count(logical=False) or os.cpu_count() or 1
+    except ImportError:
+        return os.cpu_count() or 1
+
+
+def host_info():
+    """
+    Décrit la machine et l'environnement d'exécution.
+
+    Returns:
+        Dict des caractéristiques qui influencent les performances
+    """
+    return {
+        'hostname': platform.node(),
+        'machine': platform.machine(),
+        'processor': platform.processor(),
+        'system': platform.system(),
+        'logical_cpus': os.cpu_count() or 1,
+        'physical_cpus': physical_cpu_count(),
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'gil_enabled': gil_enabled(),
+        'numpy': np.__version__,
+    }
+
+
+def host_fingerprint(info=None):
+    """
+    Calcule l'empreinte de la machine.
+
+    Le nom d'hôte n'en fait pas partie : deux machines identiques (ou un
+    conteneur relancé sous un autre nom) partagent le même profil.
+
+    Args:
+        info: Dict retourné par host_info (défaut: machine courante)
+
+    Returns:
+        Empreinte hexadécimale de 16 caractères
+    """
+    info = dict(info or host_info())
+    info.pop('hostname', None)
+    payload = json.dumps(info, sort_keys=True).encode('utf-8')
+    return hashlib.sha256(payload).hexdigest()[:16]
+
+
+def _read_profiles(path):
+    """Lit le fichier des profils (dict vide s'il n'existe pas)."""
+    if path not in _cache:
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            _cache[path] = data.get('hosts', {}) if data.get('version') == PROFILE_VERSION else {}
+        except (OSError, ValueError):
+            _cache[path] = {}
+    return _cache[path]
+
+
+def load_profile(path=None, fingerprint=None):
+    """
+    Retourne le profil de la machine courante.
+
+    Args:
+        path: Fichier des profils (défaut: profile_path())
+        fingerprint: Empreinte de l'hôte (défaut: machine courante)
+
+    Returns:
+        Dict du profil, ou None s'il n'y en a pas
+    """
+    path = path or profile_path()
+    if path is None:
+        return None
+    return _read_profiles(path).get(fingerprint or host_fingerprint())
+
+
+def save_profile(profile, path=None, fingerprint=None):
+    """
+    Enregistre le profil de la machine courante (les autres hôtes sont conservés).
+
+    Args:
+        profile: Dict du profil (voir autotune.calibrate)
+        path: Fichier des profils (défaut: profile_path())
+        fingerprint: Empreinte de l'hôte (défaut: machine courante)
+
+    Returns:
+        Chemin du fichier écrit
+    """
+    path = path or profile_path() or DEFAULT_PROFILE_PATH
+    hosts = dict(_read_profiles(path))
+    hosts[fingerprint or host_fingerprint()] = profile
+
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({'version': PROFILE_VERSION, 'hosts': hosts}, f, indent=2)
+    os.replace(tmp_path, path)
+    _cache[path] = hosts
+    return path
+
+
+def tuned_config(backend, kernel):
+    """
+    Retourne la configuration mesurée pour un moteur et un noyau.
+
+    Args:
+        backend: Nom du moteur
+        kernel: Noyau de calcul
+
+    Returns:
+        Dict {'workers', 'chunk_size', 'throughput'} ou None sans profil
+    """
+    profile = load_profile()
+    if profile is None:
+        return None
+    return profile['backends'].get(f"{backend}:{kernel}")
+
+
+def best_tuned_backend(kernel=None, max_workers=None, backend=None):
+    """
+    Retourne la configuration mesurée la plus rapide du profil.
+
+    Toutes les mesures de la calibration sont candidates, pas seulement la
+    configuration retenue pour chaque moteur : avec max_workers, un petit
+    calcul obtient la plus rapide des configurations à peu de workers.
+
+    Args:
+        kernel: Restreindre aux mesures de ce noyau (défaut: tous)
+        max_workers: Nombre maximal de workers (défaut: aucun) ; un moteur
+            séquentiel compte pour un worker
+        backend: Restreindre aux mesures de ce moteur (défaut: tous)
+
+    Returns:
+        Tuple (moteur, noyau, configuration {'workers', 'chunk_size',
+        'throughput'}) ou None sans profil
+    """
+    profile = load_profile()
+    if profile is None:
+        return None
+    candidates = []
+    for key, config in profile['backends'].items():
+        tuned_backend, tuned_kernel = key.split(':', 1)
+        if (kernel is not None and tuned_kernel != kernel) or \
+                (backend is not None and tuned_backend != backend):
+            continue
+        for measurement in config.get('measurements') or [config]:
+            if max_workers is None or (measurement['workers'] or 1) <= max_workers:
+                candidates.append((tuned_backend, tuned_kernel, measurement))
+    if not candidates:
+        return None
+    return max(candidates, key=lambda item: item[2]['throughput'])
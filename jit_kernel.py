@@ -0,0 +1,329 @@
+"""
+Noyau compilé à la volée (JIT) avec Numba, optionnel.
+
+La boucle de comptage est compilée en code machine :
+- nogil=True : chaque thread du moteur multi-thread exécute la boucle
+  compilée sans tenir le GIL, à un débit proche du C par cœur
+- parallel=True + prange : un seul appel répartit les blocs sur tous les
+  cœurs (moteur 'jit' de backends.py)
+- cache=True : le code compilé est conservé sur disque et réutilisé d'un
+  run à l'autre ; la compilation (ou le chargement du cache) est mesurée
+  et rapportée à part du temps de calcul
+
+Générateur : SplitMix64, un flux indépendant par bloc de `chunk_size`
+points dérivé de la graine du worker. Le découpage en blocs ne dépend pas
+du nombre de threads : versions séquentielle et parallèle donnent le même
+compte pour une même graine.
+
+Sans Numba, le noyau se replie sur le noyau NumPy vectorisé.
+"""
+
+import os
+import time
+import argparse
+import threading
+import numpy as np
+from monte_carlo_core import (DEFAULT_CHUNK_SIZE, check_chunk_size, count_inside_numpy,
+                              make_numpy_rng, positive_int)
+
+# Cache disque du code compilé (modifiable avec NUMBA_CACHE_DIR)
+DEFAULT_JIT_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'monte_carlo_pi', 'numba')
+JIT_CACHE_DIR = os.environ.get('NUMBA_CACHE_DIR') or DEFAULT_JIT_CACHE_DIR
+
+try:
+    import numba
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    numba = None
+    NUMBA_AVAILABLE = False
+
+
+# Constantes de SplitMix64 (typées uint64 pour rester en arithmétique entière)
+_GOLDEN_GAMMA = np.uint64(0x9E3779B97F4A7C15)
+_MIX_1 = np.uint64(0xBF58476D1CE4E5B9)
+_MIX_2 = np.uint64(0x94D049BB133111EB)
+_SHIFT_11 = np.uint64(11)
+_SHIFT_27 = np.uint64(27)
+_SHIFT_30 = np.uint64(30)
+_SHIFT_31 = np.uint64(31)
+_DOUBLE_UNIT = 1.0 / (1 << 53)
+
+# Signature compilée : (iterations int64, graine uint64, taille de bloc int64)
+_SIGNATURE = '(int64, uint64, int64)'
+
+# Compilation cumulée dans ce processus (voir compile_kernels)
+_compile_info = {'available': NUMBA_AVAILABLE, 'compile_time': 0.0, 'cache_hits': 0,
+                 'cache_misses': 0, 'cache_dir': JIT_CACHE_DIR,
+                 'kernels': []}
+_compile_lock = threading.Lock()
+
+
+def _mix64(z):
+    """Fonction de mélange de SplitMix64."""
+    z = (z ^ (z >> _SHIFT_30)) * _MIX_1
+    z = (z ^ (z >> _SHIFT_27)) * _MIX_2
+    return z ^ (z >> _SHIFT_31)
+
+
+def _count_block(iterations, state):
+    """Compte les points dans le cercle pour un bloc (flux SplitMix64)."""
+    inside_circle = 0
+    for _ in range(iterations):
+        state += _GOLDEN_GAMMA
+        x = (_mix64(state) >> _SHIFT_11) * _DOUBLE_UNIT
+        state += _GOLDEN_GAMMA
+        y = (_mix64(state) >> _SHIFT_11) * _DOUBLE_UNIT
+
+        if x * x + y * y <= 1.0:
+            inside_circle += 1
+    return inside_circle
+
+
+def _block_state(seed, block):
+    """État initial du flux d'un bloc."""
+    return _mix64(seed + np.uint64(block) * _GOLDEN_GAMMA)
+
+
+def _count_serial(iterations, seed, block_size):
+    """Parcourt les blocs dans le thread appelant."""
+    inside_circle = 0
+    num_blocks = (iterations + block_size - 1) // block_size
+    for block in range(num_blocks):
+        n = min(block_size, iterations - block * block_size)
+        inside_circle += _count_block(n, _block_state(seed, block))
+    return inside_circle
+
+
+def _count_parallel(iterations, seed, block_size):
+    """Répartit les blocs sur les threads de Numba (prange)."""
+    num_blocks = (iterations + block_size - 1) // block_size
+    counts = np.zeros(num_blocks, dtype=np.int64)
+    for block in prange(num_blocks):
+        n = min(block_size, iterations - block * block_size)
+        counts[block] = _count_block(n, _block_state(seed, block))
+    return counts.sum()
+
+
+if NUMBA_AVAILABLE:
+    # Numba fixe le dossier de cache d'un noyau à sa décoration : le dossier
+    # n'est imposé que pendant celle-ci, sans toucher à l'environnement ni aux
+    # autres modules qui utilisent Numba
+    _previous_cache_dir = numba.config.CACHE_DIR
+    numba.config.CACHE_DIR = JIT_CACHE_DIR
+    try:
+        _mix64 = njit(nogil=True, cache=True)(_mix64)
+        _count_block = njit(nogil=True, cache=True)(_count_block)
+        _block_state = njit(nogil=True, cache=True)(_block_state)
+        _count_serial = njit(nogil=True, cache=True)(_count_serial)
+        _count_parallel = njit(nogil=True, parallel=True, cache=True)(_count_parallel)
+    finally:
+        numba.config.CACHE_DIR = _previous_cache_dir
+
+
+def jit_available():
+    """Indique si le noyau compilé est disponible (Numba installé)."""
+    return NUMBA_AVAILABLE
+
+
+def jit_thread_count():
+    """
+    Retourne le nombre maximum de threads du noyau parallèle.
+
+    Returns:
+        Nombre de threads de Numba, ou 1 sans Numba
+    """
+    return numba.config.NUMBA_NUM_THREADS if NUMBA_AVAILABLE else 1
+
+
+def compile_kernels(parallel=True):
+    """
+    Compile (ou charge depuis le cache disque) les noyaux JIT.
+
+    Chaque noyau n'est compilé qu'une fois par processus ; le temps de
+    compilation est cumulé et rapporté à part du temps de calcul. Le noyau
+    parallèle doit être compilé depuis le thread principal : chargé depuis
+    un thread worker, le pool de threads de Numba bloque la sortie de
+    l'interpréteur.
+
+    Args:
+        parallel: Compiler aussi le noyau parallèle (prange)
+
+    Returns:
+        Dict {'available', 'compile_time', 'cache_hits', 'cache_misses',
+        'cache_dir', 'kernels'}
+    """
+    if not NUMBA_AVAILABLE:
+        return dict(_compile_info)
+
+    with _compile_lock:
+        dispatchers = {'serial': _count_serial, 'parallel': _count_parallel}
+        for name in ('serial', 'parallel') if parallel else ('serial',):
+            if name in _compile_info['kernels']:
+                continue
+            start_time = time.perf_counter()
+            dispatchers[name].compile(_SIGNATURE)
+            _compile_info['compile_time'] += time.perf_counter() - start_time
+            _compile_info['kernels'].append(name)
+
+        all_dispatchers = (_mix64, _count_block, _block_state, _count_serial, _count_parallel)
+        _compile_info['cache_hits'] = sum(sum(d.stats.cache_hits.values())
+                                          for d in all_dispatchers)
+        _compile_info['cache_misses'] = sum(sum(d.stats.cache_misses.values())
+                                            for d in all_dispatchers)
+        return dict(_compile_info, kernels=list(_compile_info['kernels']))
+
+
+def _draw_seed(rng):
+    """Tire la graine SplitMix64 du worker dans son générateur NumPy."""
+    return np.uint64(rng.bit_generator.random_raw())
+
+
+def count_inside_jit(iterations, rng=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Compte les points dans le cercle avec le noyau compilé, dans le thread appelant.
+
+    La boucle s'exécute sans le GIL : plusieurs threads du moteur
+    multi-thread avancent réellement en parallèle.
+
+    Args:
+        iterations: Nombre de points aléatoires à générer
+        rng: Générateur numpy.random.Generator du worker (défaut: nouveau)
+        chunk_size: Nombre de points par bloc (un flux par bloc)
+
+    Returns:
+        Nombre de points dans le cercle (noyau NumPy sans Numba)
+    """
+    check_chunk_size(chunk_size)
+    if rng is None:
+        rng = make_numpy_rng()
+    if not NUMBA_AVAILABLE:
+        return count_inside_numpy(iterations, rng, chunk_size)
+    compile_kernels(parallel=False)
+    return int(_count_serial(iterations, _draw_seed(rng), chunk_size))
+
+
+def count_inside_jit_parallel(iterations, rng=None, num_threads=None,
+                              chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Compte les points dans le cercle en répartissant les blocs avec prange.
+
+    Pour une même graine, le compte est identique à celui de
+    count_inside_jit, quel que soit le nombre de threads. À appeler depuis
+    le thread principal (voir compile_kernels).
+
+    Args:
+        iterations: Nombre de points aléatoires à générer
+        rng: Générateur numpy.random.Generator (défaut: nouveau générateur)
+        num_threads: Nombre de threads de Numba (défaut: tous)
+        chunk_size: Nombre de points par bloc (unité de répartition)
+
+    Returns:
+        Nombre de points dans le cercle (noyau NumPy sans Numba)
+    """
+    check_chunk_size(chunk_size)
+    if rng is None:
+        rng = make_numpy_rng()
+    if not NUMBA_AVAILABLE:
+        return count_inside_numpy(iterations, rng, chunk_size)
+    compile_kernels()
+    # Réglage global à Numba : toujours le refixer, sinon un appel sans
+    # num_threads hériterait du nombre de threads de l'appel précédent
+    if num_threads is None:
+        numba.set_num_threads(jit_thread_count())
+    else:
+        numba.set_num_threads(max(1, min(num_threads, jit_thread_count())))
+    return int(_count_parallel(iterations, _draw_seed(rng), chunk_size))
+
+
+def monte_carlo_pi_jit(iterations, num_threads=None, seed=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Calcule Pi avec le noyau compilé parallèle.
+
+    Args:
+        iterations: Nombre de points aléatoires à générer
+        num_threads: Nombre de threads de Numba (défaut: tous)
+        seed: Graine pour un run reproductible (défaut: aléatoire)
+        chunk_size: Nombre de points par bloc
+
+    Returns:
+        Estimation de Pi
+    """
+    rng = make_numpy_rng(np.random.SeedSequence(seed))
+    return 4 * count_inside_jit_parallel(iterations, rng, num_threads, chunk_size) / iterations
+
+
+def print_compile_report(info, indent=''):
+    """
+    Affiche le temps de compilation JIT, séparé du temps de calcul.
+
+    Args:
+        info: Dict retourné par compile_kernels
+        indent: Préfixe de chaque ligne
+    """
+    if not info['available']:
+        print(f"{indent}Compilation JIT : Numba absent, repli sur le noyau NumPy")
+        return
+    source = "cache disque" if info['cache_misses'] == 0 else "compilation complète"
+    print(f"{indent}Compilation JIT : {info['compile_time']:.4f}s ({source})")
+
+
+def main():
+    """Calcule Pi avec le noyau compilé et sépare compilation et calcul."""
+    parser = argparse.ArgumentParser(description='Simulation Monte Carlo - Noyau JIT (Numba)')
+    parser.add_argument('--iterations', type=int, default=100_000_000,
+                        help='Nombre d\'itérations (défaut: 100,000,000)')
+    parser.add_argument('--threads', type=int, default=None,
+                        help='Nombre de threads de Numba (défaut: tous les cœurs)')
+    parser.add_argument('--chunk-size', type=positive_int, default=DEFAULT_CHUNK_SIZE,
+                        help=f'Points par bloc (défaut: {DEFAULT_CHUNK_SIZE:,})')
+    parser.add_argument('--seed', type=int, default=None,
+                        help='Graine pour un run reproductible (défaut: aléatoire)')
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("SIMULATION MONTE CARLO - NOYAU JIT")
+    print("=" * 60)
+    print(f"Nombre d'itérations  : {args.iterations:,}")
+    if NUMBA_AVAILABLE:
+        print(f"Numba                : {numba.__version__} "
+              f"({args.threads or jit_thread_count()} threads, nogil + prange)")
+        print(f"Cache disque         : {JIT_CACHE_DIR}")
+    else:
+        print("Numba                : non installé (repli sur le noyau NumPy)")
+    print()
+
+    info = compile_kernels()
+    print_compile_report(info)
+    print("Démarrage du calcul...")
+    print()
+
+    start_time = time.perf_counter()
+    pi_estimate = monte_carlo_pi_jit(args.iterations, args.threads, args.seed, args.chunk_size)
+    execution_time = time.perf_counter() - start_time
+
+    print("=" * 60)
+    print("RÉSULTATS")
+    print("=" * 60)
+    print(f"Estimation de Pi     : {pi_estimate:.8f}")
+    print(f"Valeur réelle de Pi  : {3.14159265:.8f}")
+    print(f"Erreur               : {abs(pi_estimate - 3.14159265):.8f}")
+    print(f"Temps de compilation : {info['compile_time']:.4f} secondes")
+    print(f"Temps de calcul      : {execution_time:.4f} secondes")
+    print(f"Itérations/seconde   : {args.iterations / execution_time:,.0f}")
+    print("=" * 60)
+
+    return {
+        'pi_estimate': pi_estimate,
+        'compile_time': info['compile_time'],
+        'execution_time': execution_time,
+        'iterations': args.iterations,
+        'num_threads': args.threads,
+        'jit_available': info['available'],
+        'seed': args.seed,
+        'iterations_per_second': args.iterations / execution_time
+    }
+
+
+if __name__ == "__main__":
+    main()
@@ -5,14 +5,29 @@ Cette version utilise une approche séquentielle simple :
 - Une seule boucle qui traite toutes les itérations
 - Pas de parallélisme
 - Simple mais lent sur grandes données
+- Noyau NumPy optionnel (--kernel numpy) : 20-50x plus rapide sur un cœur
+- Noyau quasi-Monte Carlo (--kernel halton) : moins de points pour une
+  même erreur
+- Mode précision adaptative (--target-error) : s'arrête dès que l'erreur
+  visée est atteinte
+- Mode budget de temps (--time-budget) : meilleure estimation possible
+  avant une échéance
 """
 
-import random
 import time
 import argparse
+import numpy as np
+from monte_carlo_core import (
+    DEFAULT_BATCH_SIZE, DEFAULT_CHUNK_SIZE, KERNELS, add_precision_arguments, positive_int,
+    VARIANCE_KERNELS, add_time_budget_arguments, count_inside, count_until_deadline,
+    iter_batch_sizes, make_python_rng, make_rng, print_precision_report,
+    print_time_budget_report, print_variance_report, run_until_precision, time_budget_result,
+    variance_stats, worker_variance_sum
+)
 
 
-def monte_carlo_pi_mono(iterations):
+def monte_carlo_pi_mono(iterations, kernel='python', chunk_size=DEFAULT_CHUNK_SIZE, seed=None,
+                        stats=None):
     """
     Calcule Pi en utilisant la méthode Monte Carlo (version mono-thread).
     
@@ -23,46 +38,156 @@ def monte_carlo_pi_mono(iterations):
     
     Args:
         iterations: Nombre de points aléatoires à générer
+        kernel: 'python' (boucle pure), 'numpy' (vectorisé par blocs),
+            'integer' (tirages entiers 31 bits),
+            'halton' (quasi-Monte Carlo), 'stratified' ou 'antithetic'
+            (réduction de variance), 'jit' (boucle compilée par Numba)
+        chunk_size: Taille des blocs pour les noyaux vectorisés
+        seed: Graine pour un run reproductible (défaut: aléatoire)
+        stats: Dict optionnel, rempli avec la variance obtenue
+            (voir monte_carlo_core.variance_stats)
         
     Returns:
         Estimation de Pi
     """
+    seed_sequence = np.random.SeedSequence(seed)
+    
+    if kernel != 'python':
+        rng = make_rng(kernel, seed_sequence)
+        inside_circle = count_inside(kernel, iterations, rng, chunk_size)
+        if stats is not None:
+            variance_sum = worker_variance_sum(rng, inside_circle, iterations)
+            stats.update(variance_stats(inside_circle, iterations, variance_sum))
+        return 4 * inside_circle / iterations
+    
     inside_circle = 0
+    rand = make_python_rng(seed_sequence).random
     
     # Traiter toutes les itérations séquentiellement
     for _ in range(iterations):
         # Générer un point aléatoire
-        x = random.random()
-        y = random.random()
+        x = rand()
+        y = rand()
         
         # Vérifier si le point est dans le quart de cercle
         if x * x + y * y <= 1:
             inside_circle += 1
     
+    if stats is not None:
+        stats.update(variance_stats(inside_circle, iterations))
+    
     # Calculer l'estimation de Pi
     pi_estimate = 4 * inside_circle / iterations
     return pi_estimate
 
 
+def iter_batch_counts_mono(batch_size=DEFAULT_BATCH_SIZE, kernel='python',
+                           chunk_size=DEFAULT_CHUNK_SIZE, seed=None, total_iterations=None):
+    """
+    Génère des lots de points sur un flux aléatoire unique.
+    
+    Args:
+        batch_size: Nombre de points par lot
+        kernel: Noyau de calcul (voir KERNELS)
+        chunk_size: Taille des blocs pour les noyaux vectorisés
+        seed: Graine pour un run reproductible (défaut: aléatoire)
+        total_iterations: Nombre total de points (défaut: flux infini)
+        
+    Yields:
+        Tuples (points dans le cercle, points du lot, contribution du lot à
+        la variance ; None hors VARIANCE_KERNELS)
+    """
+    rng = make_rng(kernel, np.random.SeedSequence(seed))
+    variance_sum = 0.0
+    for n in iter_batch_sizes(batch_size, total_iterations):
+        inside = count_inside(kernel, n, rng, chunk_size)
+        if kernel not in VARIANCE_KERNELS:
+            yield inside, n, None
+            continue
+        # L'échantillonneur cumule depuis le début : on rend l'accroissement
+        previous, variance_sum = variance_sum, rng.variance_sum()
+        yield inside, n, variance_sum - previous
+
+
+def monte_carlo_pi_mono_adaptive(target_error, confidence=0.95, batch_size=DEFAULT_BATCH_SIZE,
+                                 max_iterations=None, kernel='python',
+                                 chunk_size=DEFAULT_CHUNK_SIZE, seed=None):
+    """
+    Calcule Pi jusqu'à atteindre une erreur cible (version mono-thread).
+    
+    Args:
+        target_error: Erreur absolue visée (demi-largeur de l'IC)
+        confidence: Niveau de confiance de l'intervalle
+        batch_size: Nombre de points par lot
+        max_iterations: Plafond d'itérations (défaut: aucun)
+        kernel: Noyau de calcul ('python' ou 'numpy')
+        chunk_size: Taille des blocs pour le noyau NumPy
+        seed: Graine pour un run reproductible (défaut: aléatoire)
+        
+    Returns:
+        Dict avec l'estimation et les itérations réellement consommées
+    """
+    batches = iter_batch_counts_mono(batch_size, kernel, chunk_size, seed)
+    return run_until_precision(batches, target_error, confidence, max_iterations)
+
+
+def monte_carlo_pi_mono_time_budget(time_budget, kernel='python', chunk_size=DEFAULT_CHUNK_SIZE,
+                                    seed=None):
+    """
+    Calcule la meilleure estimation de Pi possible dans un budget de temps.
+    
+    Args:
+        time_budget: Durée maximale du calcul (secondes)
+        kernel: Noyau de calcul (voir KERNELS)
+        chunk_size: Points tirés entre deux lectures de l'horloge
+        seed: Graine pour un run reproductible (défaut: aléatoire)
+        
+    Returns:
+        Dict avec l'estimation, les points obtenus et le débit atteint
+    """
+    start = time.monotonic()
+    rng = make_rng(kernel, np.random.SeedSequence(seed))
+    inside, iterations, variance_sum = count_until_deadline(kernel, rng, start + time_budget,
+                                                            chunk_size)
+    return time_budget_result(inside, iterations, time_budget, time.monotonic() - start,
+                              variance_sum if kernel in VARIANCE_KERNELS else None)
+
+
 def main():
     """Fonction principale pour exécuter la simulation mono-thread."""
     parser = argparse.ArgumentParser(description='Simulation Monte Carlo - Mono-Thread')
     parser.add_argument('--iterations', type=int, default=10_000_000,
                         help='Nombre d\'itérations (défaut: 10,000,000)')
+    parser.add_argument('--kernel', choices=KERNELS, default='python',
+                        help='Noyau de calcul (défaut: python)')
+    parser.add_argument('--chunk-size', type=positive_int, default=DEFAULT_CHUNK_SIZE,
+                        help=f'Taille des blocs du noyau NumPy (défaut: {DEFAULT_CHUNK_SIZE:,})')
+    parser.add_argument('--seed', type=int, default=None,
+                        help='Graine pour un run reproductible (défaut: aléatoire)')
+    add_precision_arguments(parser)
+    add_time_budget_arguments(parser)
     args = parser.parse_args()
     
     iterations = args.iterations
+    kernel = args.kernel
+    
+    if args.target_error is not None:
+        return main_adaptive(args)
+    if args.time_budget is not None:
+        return main_time_budget(args)
     
     print("=" * 60)
     print("SIMULATION MONTE CARLO - MONO-THREAD")
     print("=" * 60)
     print(f"Nombre d'itérations : {iterations:,}")
+    print(f"Noyau               : {kernel}")
     print("Démarrage du calcul...")
     print()
     
     # Mesurer le temps d'exécution
+    stats = {}
     start_time = time.time()
-    pi_estimate = monte_carlo_pi_mono(iterations)
+    pi_estimate = monte_carlo_pi_mono(iterations, kernel, args.chunk_size, args.seed, stats)
     end_time = time.time()
     
     execution_time = end_time - start_time
@@ -76,15 +201,65 @@ def main():
     print(f"Erreur               : {abs(pi_estimate - 3.14159265):.8f}")
     print(f"Temps d'exécution    : {execution_time:.4f} secondes")
     print(f"Itérations/seconde   : {iterations / execution_time:,.0f}")
+    if kernel in VARIANCE_KERNELS:
+        print_variance_report(stats)
     print("=" * 60)
     
     return {
         'pi_estimate': pi_estimate,
         'execution_time': execution_time,
         'iterations': iterations,
+        'kernel': kernel,
+        'seed': args.seed,
+        'variance': stats['variance'],
         'iterations_per_second': iterations / execution_time
     }
 
 
+def main_adaptive(args):
+    """Exécute la simulation mono-thread en mode précision adaptative."""
+    print("=" * 60)
+    print("SIMULATION MONTE CARLO - MONO-THREAD (PRÉCISION ADAPTATIVE)")
+    print("=" * 60)
+    print(f"Erreur cible        : ±{args.target_error} (confiance {args.confidence:.0%})")
+    print(f"Points par lot      : {args.batch_size:,}")
+    print(f"Noyau               : {args.kernel}")
+    print("Démarrage du calcul...")
+    print()
+    
+    start_time = time.perf_counter()
+    result = monte_carlo_pi_mono_adaptive(
+        args.target_error, args.confidence, args.batch_size, args.max_iterations,
+        args.kernel, args.chunk_size, args.seed
+    )
+    execution_time = time.perf_counter() - start_time
+    
+    print_precision_report(result, execution_time)
+    
+    result['execution_time'] = execution_time
+    result['kernel'] = args.kernel
+    result['seed'] = args.seed
+    return result
+
+
+def main_time_budget(args):
+    """Exécute la simulation mono-thread en mode budget de temps."""
+    print("=" * 60)
+    print("SIMULATION MONTE CARLO - MONO-THREAD (BUDGET DE TEMPS)")
+    print("=" * 60)
+    print(f"Budget de temps     : {args.time_budget} secondes")
+    print(f"Noyau               : {args.kernel}")
+    print("Démarrage du calcul...")
+    print()
+    
+    result = monte_carlo_pi_mono_time_budget(args.time_budget, args.kernel, args.chunk_size,
+                                             args.seed)
+    print_time_budget_report(result)
+    
+    result['kernel'] = args.kernel
+    result['seed'] = args.seed
+    return result
+
+
 if __name__ == "__main__":
     main()
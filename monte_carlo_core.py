@@ -0,0 +1,1026 @@
+"""
+Noyau commun de la simulation Monte Carlo pour Pi.
+
+Ce module regroupe les noyaux de comptage partagés par les différentes
+versions (mono-thread, multi-thread, multiprocessing) :
+- Noyau NumPy vectorisé, traité par blocs de taille fixe
+- Mémoire bornée quel que soit le nombre d'itérations
+- Flux aléatoires indépendants par worker, dérivés d'une seule graine
+- Mode précision adaptative : arrêt dès qu'une erreur cible est atteinte
+- Échantillonneur quasi-Monte Carlo (suite de Halton brouillée)
+- Réduction de variance : échantillonnage stratifié et variables antithétiques
+- Noyau entier : tirages bruts 64 bits découpés en deux coordonnées 31 bits
+- Mode budget de temps : échantillonnage par blocs jusqu'à une échéance
+- Détection du CPython free-threaded (3.13t) et de l'état du GIL
+- Noyau compilé JIT optionnel (jit_kernel.py, Numba), sans le GIL
+"""
+
+import math
+import random
+import argparse
+import statistics
+import sys
+import sysconfig
+import time
+import platform
+import numpy as np
+
+
+# Noyaux de comptage disponibles
+KERNELS = ('python', 'numpy', 'integer', 'halton', 'stratified', 'antithetic', 'jit')
+
+# Noyaux à réduction de variance (variance mesurée par l'échantillonneur)
+VARIANCE_KERNELS = ('stratified', 'antithetic')
+
+# Taille des blocs traités par le noyau NumPy : 512 Ko par tableau float64,
+# les deux coordonnées d'un bloc restent dans le cache L2
+DEFAULT_CHUNK_SIZE = 65_536
+
+# Nombre de points par lot en mode précision adaptative
+DEFAULT_BATCH_SIZE = 1_000_000
+
+# Écart entre les positions de départ de deux flux de Halton (saut en avant) :
+# chaque worker dispose de 2^32 points contigus sans chevauchement
+HALTON_STREAM_SPACING = 2 ** 32
+
+# Noyau entier : coordonnées sur 31 bits, rayon R = 2^31 ; x² + y² < 2^63
+# tient sans débordement dans un uint64
+_INTEGER_BITS = 31
+_INTEGER_MASK = np.uint64((1 << _INTEGER_BITS) - 1)
+_INTEGER_RADIUS_SQUARED = np.uint64(1 << (2 * _INTEGER_BITS))
+
+# Grille de stratification : STRATA_GRID × STRATA_GRID strates du carré unité
+STRATA_GRID = 64
+
+# Chiffres en base 3 traités (3^-36 < 2^-53), par groupes de 6 chiffres (3^6 = 729)
+_HALTON_BASE3_DIGITS = 36
+_HALTON_BASE3_GROUP = 6
+
+# Table d'inversion des bits d'un octet (pour l'inverse radical en base 2)
+_BIT_REVERSE_TABLE = np.array(
+    [int(f'{i:08b}'[::-1], 2) for i in range(256)], dtype=np.uint8
+)
+
+
+def gil_enabled():
+    """
+    Indique si le GIL est actif dans l'interpréteur courant.
+
+    Sur un build free-threaded (3.13t), le GIL peut être désactivé ;
+    sys._is_gil_enabled n'existe qu'à partir de Python 3.13.
+
+    Returns:
+        True si le GIL est actif (toujours le cas avant 3.13)
+    """
+    is_gil_enabled = getattr(sys, '_is_gil_enabled', None)
+    return True if is_gil_enabled is None else bool(is_gil_enabled())
+
+
+def python_build_info():
+    """
+    Décrit l'interpréteur qui exécute le calcul.
+
+    Returns:
+        Dict avec la version, l'implémentation, le type de build
+        (free-threaded ou non) et l'état du GIL
+    """
+    return {
+        'version': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'free_threaded_build': bool(sysconfig.get_config_var('Py_GIL_DISABLED')),
+        'gil_enabled': gil_enabled(),
+    }
+
+
+def spawn_seed_sequences(seed, num_workers):
+    """
+    Dérive un flux aléatoire indépendant par worker à partir d'une graine.
+
+    Utilise SeedSequence.spawn de NumPy : les flux enfants sont
+    statistiquement indépendants, et un run est reproductible pour un
+    couple (graine, nombre de workers) donné.
+
+    Args:
+        seed: Graine utilisateur (None = entropie du système)
+        num_workers: Nombre de flux à créer
+
+    Returns:
+        Liste de numpy.random.SeedSequence (une par worker)
+    """
+    return np.random.SeedSequence(seed).spawn(num_workers)
+
+
+def python_seed(seed_sequence=None):
+    """
+    Dérive la graine entière d'un random.Random à partir d'une SeedSequence.
+
+    Args:
+        seed_sequence: SeedSequence du worker (None = entropie du système)
+
+    Returns:
+        Entier de 128 bits
+    """
+    if seed_sequence is None:
+        seed_sequence = np.random.SeedSequence()
+    state = seed_sequence.generate_state(4, np.uint32)
+    return int.from_bytes(state.tobytes(), 'little')
+
+
+def make_python_rng(seed_sequence=None):
+    """
+    Crée un générateur random.Random privé à partir d'une SeedSequence.
+
+    Args:
+        seed_sequence: SeedSequence du worker (None = entropie du système)
+
+    Returns:
+        Instance random.Random indépendante du module global `random`
+    """
+    return random.Random(python_seed(seed_sequence))
+
+
+def make_numpy_rng(seed_sequence=None):
+    """
+    Crée un générateur numpy.random.Generator à partir d'une SeedSequence.
+
+    Args:
+        seed_sequence: SeedSequence du worker (None = entropie du système)
+
+    Returns:
+        Instance numpy.random.Generator
+    """
+    return np.random.default_rng(seed_sequence)
+
+
+def check_chunk_size(chunk_size):
+    """
+    Vérifie la taille de bloc d'un noyau découpé en blocs.
+
+    Un bloc vide ne ferait jamais avancer la boucle de comptage.
+
+    Args:
+        chunk_size: Nombre de points traités par bloc
+
+    Raises:
+        ValueError: Si chunk_size n'est pas strictement positif
+    """
+    if chunk_size <= 0:
+        raise ValueError(f"Taille de bloc invalide : {chunk_size} (attendu > 0)")
+
+
+def positive_int(value):
+    """
+    Type argparse : entier strictement positif.
+
+    Args:
+        value: Chaîne passée en ligne de commande
+
+    Returns:
+        Entier converti
+    """
+    number = int(value)
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"entier strictement positif attendu : {value}")
+    return number
+
+
+def split_iterations(total_iterations, num_tasks):
+    """
+    Découpe le nombre total d'itérations en tâches de taille égale.
+
+    Args:
+        total_iterations: Nombre total de points à générer
+        num_tasks: Nombre de tâches
+
+    Returns:
+        Liste des tailles de tâches (la dernière prend le reste)
+    """
+    iterations_per_task = total_iterations // num_tasks
+    remaining_iterations = total_iterations % num_tasks
+
+    tasks = [iterations_per_task] * num_tasks
+    if remaining_iterations > 0:
+        tasks[-1] += remaining_iterations
+    return tasks
+
+
+def iter_batch_sizes(batch_size, total_iterations=None):
+    """
+    Génère les tailles de lots successives d'un calcul en flux.
+
+    Args:
+        batch_size: Nombre de points par lot
+        total_iterations: Nombre total de points (None = flux infini) ;
+            le dernier lot est tronqué pour ne pas le dépasser
+
+    Yields:
+        Taille de chaque lot
+    """
+    if batch_size <= 0:
+        raise ValueError(f"Taille de lot invalide : {batch_size} (attendu > 0)")
+    done = 0
+    while total_iterations is None or done < total_iterations:
+        n = batch_size if total_iterations is None else min(batch_size, total_iterations - done)
+        done += n
+        yield n
+
+
+def make_rng(kernel, seed_sequence=None):
+    """
+    Crée le générateur adapté à un noyau de calcul.
+
+    Args:
+        kernel: Nom du noyau (voir KERNELS)
+        seed_sequence: SeedSequence du worker (None = entropie du système)
+
+    Returns:
+        random.Random pour le noyau 'python', HaltonStream pour 'halton',
+        un échantillonneur pour 'stratified' / 'antithetic',
+        numpy.random.Generator sinon
+    """
+    if kernel not in KERNELS:
+        raise ValueError(f"Noyau inconnu : {kernel!r} (choix : {', '.join(KERNELS)})")
+    if kernel == 'python':
+        return make_python_rng(seed_sequence)
+    if kernel == 'halton':
+        return HaltonStream(seed_sequence)
+    if kernel == 'stratified':
+        return StratifiedSampler(seed_sequence)
+    if kernel == 'antithetic':
+        return AntitheticSampler(seed_sequence)
+    return make_numpy_rng(seed_sequence)
+
+
+def count_inside_python(iterations, rng=None):
+    """
+    Compte les points tombant dans le quart de cercle (boucle Python pure).
+
+    Args:
+        iterations: Nombre de points aléatoires à générer
+        rng: Générateur random.Random (défaut: nouveau générateur)
+
+    Returns:
+        Nombre de points dans le cercle
+    """
+    if rng is None:
+        rng = make_python_rng()
+
+    inside_circle = 0
+    rand = rng.random
+
+    for _ in range(iterations):
+        x = rand()
+        y = rand()
+
+        if x * x + y * y <= 1:
+            inside_circle += 1
+
+    return inside_circle
+
+
+def count_inside_numpy(iterations, rng=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Compte les points tombant dans le quart de cercle avec NumPy.
+
+    Les points sont générés et testés par blocs de `chunk_size` : la
+    mémoire utilisée reste constante, même pour 1e9 itérations.
+
+    Args:
+        iterations: Nombre de points aléatoires à générer
+        rng: Générateur numpy.random.Generator (défaut: nouveau générateur)
+        chunk_size: Nombre de points traités par bloc
+
+    Returns:
+        Nombre de points dans le cercle
+    """
+    if rng is None:
+        rng = make_numpy_rng()
+
+    check_chunk_size(chunk_size)
+    inside_circle = 0
+    remaining = iterations
+
+    while remaining > 0:
+        n = min(chunk_size, remaining)
+
+        # Générer un bloc de points et calculer x² + y² sur place
+        x = rng.random(n)
+        y = rng.random(n)
+        x *= x
+        y *= y
+        x += y
+
+        inside_circle += int(np.count_nonzero(x <= 1.0))
+        remaining -= n
+
+    return inside_circle
+
+
+def count_inside_integer(iterations, rng=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Compte les points dans le cercle en arithmétique entière.
+
+    Chaque point consomme un seul tirage brut de 64 bits du générateur
+    (contre deux float64 pour le noyau NumPy) : les bits 0-30 donnent x,
+    les bits 32-62 donnent y. Le test x² + y² < R² (R = 2^31) est exact en
+    uint64, sans conversion en flottant.
+
+    La grille de 2^31 × 2^31 points introduit un biais en O(1/R) ≈ 5e-10 sur
+    Pi, négligeable devant l'erreur statistique pour N < 1e18.
+
+    Args:
+        iterations: Nombre de points aléatoires à générer
+        rng: Générateur numpy.random.Generator (défaut: nouveau générateur)
+        chunk_size: Nombre de points traités par bloc
+
+    Returns:
+        Nombre de points dans le cercle
+    """
+    if rng is None:
+        rng = make_numpy_rng()
+    bit_generator = rng.bit_generator
+    shift = np.uint64(32)
+
+    check_chunk_size(chunk_size)
+    inside_circle = 0
+    remaining = iterations
+
+    while remaining > 0:
+        n = min(chunk_size, remaining)
+
+        raw = bit_generator.random_raw(n)
+        y = raw >> shift
+        y &= _INTEGER_MASK
+        raw &= _INTEGER_MASK
+        raw *= raw
+        y *= y
+        raw += y
+
+        inside_circle += int(np.count_nonzero(raw < _INTEGER_RADIUS_SQUARED))
+        remaining -= n
+
+    return inside_circle
+
+
+def monte_carlo_pi_numpy(iterations, rng=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Calcule Pi avec le noyau NumPy vectorisé.
+
+    Args:
+        iterations: Nombre de points aléatoires à générer
+        rng: Générateur numpy.random.Generator (défaut: nouveau générateur)
+        chunk_size: Nombre de points traités par bloc
+
+    Returns:
+        Estimation de Pi
+    """
+    inside_circle = count_inside_numpy(iterations, rng, chunk_size)
+    return 4 * inside_circle / iterations
+
+
+class HaltonStream:
+    """
+    Flux de points quasi-aléatoires : suite de Halton (bases 2 et 3) brouillée.
+
+    Les points d'une suite à faible discrépance couvrent le carré bien plus
+    régulièrement que des points pseudo-aléatoires : l'erreur décroît en
+    O(log² N / N) au lieu de O(1/√N).
+
+    Brouillage : permutation aléatoire des chiffres (XOR des bits en base 2,
+    une permutation de {0, 1, 2} par position en base 3). Il est tiré de
+    l'entropie racine de la SeedSequence, donc identique pour tous les
+    workers d'un même run.
+
+    Saut en avant : la position de départ est l'indice d'enfant de la
+    SeedSequence × HALTON_STREAM_SPACING. Les workers créés par
+    spawn_seed_sequences lisent ainsi des segments disjoints de la même suite.
+    """
+
+    def __init__(self, seed_sequence=None):
+        """
+        Initialise le flux.
+
+        Args:
+            seed_sequence: SeedSequence du worker (None = entropie du système)
+        """
+        if seed_sequence is None:
+            seed_sequence = np.random.SeedSequence()
+
+        # Brouillage commun à tous les workers issus de la même graine
+        scramble_rng = np.random.default_rng(np.random.SeedSequence(seed_sequence.entropy))
+        self.base2_mask = np.uint64(int(scramble_rng.integers(0, 2 ** 53)))
+        perms = np.array([scramble_rng.permutation(3) for _ in range(_HALTON_BASE3_DIGITS)])
+        self.base3_tables = self._build_base3_tables(perms)
+        # Contribution des chiffres nuls (permutés) au-delà de la longueur de l'indice
+        self.base3_tail = np.cumsum([t[0] for t in self.base3_tables][::-1])[::-1]
+
+        stream_index = seed_sequence.spawn_key[-1] if seed_sequence.spawn_key else 0
+        self.position = stream_index * HALTON_STREAM_SPACING
+
+    @staticmethod
+    def _build_base3_tables(perms):
+        """
+        Précalcule la contribution de chaque groupe de 6 chiffres en base 3.
+
+        La table du groupe g associe à chaque valeur v < 3^6 la somme des
+        chiffres permutés de v pondérés par 3^-(k+1) : un seul divmod par
+        groupe au lieu d'un par chiffre.
+        """
+        group_size = 3 ** _HALTON_BASE3_GROUP
+        values = np.arange(group_size)
+        tables = []
+
+        for start in range(0, _HALTON_BASE3_DIGITS, _HALTON_BASE3_GROUP):
+            table = np.zeros(group_size)
+            q = values.copy()
+            for k in range(start, start + _HALTON_BASE3_GROUP):
+                q, digits = np.divmod(q, 3)
+                table += perms[k][digits] * 3.0 ** -(k + 1)
+            tables.append(table)
+
+        return tables
+
+    def skip(self, n):
+        """Avance de n points dans la suite sans les générer."""
+        self.position += n
+
+    def points(self, n):
+        """
+        Génère les n points suivants de la suite.
+
+        Args:
+            n: Nombre de points
+
+        Returns:
+            Tuple (x, y) de tableaux float64 dans [0, 1)
+        """
+        indices = np.arange(self.position, self.position + n, dtype=np.uint64)
+        self.position += n
+        return self._radical_inverse_base2(indices), self._radical_inverse_base3(indices)
+
+    def _radical_inverse_base2(self, indices):
+        """Inverse radical brouillé en base 2 (inversion des bits + XOR)."""
+        reversed_bits = _BIT_REVERSE_TABLE[indices.byteswap().view(np.uint8)].view(np.uint64)
+        scrambled = (reversed_bits >> np.uint64(11)) ^ self.base2_mask
+        return scrambled.astype(np.float64) * 2.0 ** -53
+
+    def _radical_inverse_base3(self, indices):
+        """Inverse radical brouillé en base 3 (permutation chiffre par chiffre)."""
+        result = np.zeros(len(indices))
+        q = indices
+        group_size = np.uint64(3 ** _HALTON_BASE3_GROUP)
+
+        for g, table in enumerate(self.base3_tables):
+            if not q.any():
+                # Tous les chiffres restants sont nuls
+                result += self.base3_tail[g]
+                break
+            q, digits = np.divmod(q, group_size)
+            result += table[digits.astype(np.intp)]
+
+        return result
+
+
+def count_inside_halton(iterations, stream=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Compte les points de Halton tombant dans le quart de cercle.
+
+    Args:
+        iterations: Nombre de points à générer
+        stream: HaltonStream à consommer (défaut: nouveau flux)
+        chunk_size: Nombre de points traités par bloc
+
+    Returns:
+        Nombre de points dans le cercle
+    """
+    if stream is None:
+        stream = HaltonStream()
+
+    check_chunk_size(chunk_size)
+    inside_circle = 0
+    remaining = iterations
+
+    while remaining > 0:
+        n = min(chunk_size, remaining)
+
+        x, y = stream.points(n)
+        x *= x
+        y *= y
+        x += y
+
+        inside_circle += int(np.count_nonzero(x <= 1.0))
+        remaining -= n
+
+    return inside_circle
+
+
+class StratifiedSampler:
+    """
+    Échantillonnage stratifié sur une grille du carré unité.
+
+    Le carré est découpé en STRATA_GRID² strates. Les points sont tirés par
+    balayages : un balayage visite chaque strate une fois, dans un ordre
+    aléatoire, et chaque point est tiré uniformément dans sa strate.
+    Seules les strates coupées par l'arc de cercle contribuent à la
+    variance : elle est bien plus faible qu'avec des points indépendants.
+
+    Le dernier balayage est en général incomplet (N n'est pas un multiple
+    de STRATA_GRID²). L'ordre aléatoire répartit ses points sur des strates
+    quelconques : chaque point reste uniforme dans le carré et l'estimation
+    4 × inside / N reste sans biais, y compris quand chaque worker s'arrête
+    sur son propre balayage incomplet.
+    """
+
+    def __init__(self, seed_sequence=None, grid=STRATA_GRID):
+        """
+        Initialise l'échantillonneur.
+
+        Args:
+            seed_sequence: SeedSequence du worker (None = entropie du système)
+            grid: Nombre de strates par côté
+        """
+        self.rng = make_numpy_rng(seed_sequence)
+        self.grid = grid
+        self.num_strata = grid * grid
+        self.hits = np.zeros(self.num_strata, dtype=np.int64)
+        self.counts = np.zeros(self.num_strata, dtype=np.int64)
+
+        # Balayage en cours et nombre de ses strates déjà visitées
+        self.order = np.arange(self.num_strata)
+        self.position = self.num_strata
+
+    def _next_strata(self, n):
+        """Strates des n prochains points (suite des balayages aléatoires)."""
+        parts = []
+        if self.position < self.num_strata:
+            head = self.order[self.position:self.position + n]
+            self.position += len(head)
+            parts.append(head)
+            n -= len(head)
+
+        sweeps, rest = divmod(n, self.num_strata)
+        if sweeps:
+            strata = np.tile(np.arange(self.num_strata), (sweeps, 1))
+            parts.append(self.rng.permuted(strata, axis=1).ravel())
+        if rest:
+            self.order = self.rng.permutation(self.num_strata)
+            self.position = rest
+            parts.append(self.order[:rest])
+
+        if not parts:
+            return np.empty(0, dtype=np.int64)
+        return np.concatenate(parts)
+
+    def count(self, n):
+        """
+        Tire n points stratifiés et compte ceux dans le cercle.
+
+        Args:
+            n: Nombre de points
+
+        Returns:
+            Nombre de points dans le cercle
+        """
+        strata = self._next_strata(n)
+
+        x = (strata % self.grid + self.rng.random(n)) / self.grid
+        y = (strata // self.grid + self.rng.random(n)) / self.grid
+        x *= x
+        y *= y
+        x += y
+        inside = x <= 1.0
+
+        self.hits += np.bincount(strata[inside], minlength=self.num_strata)
+        self.counts += np.bincount(strata, minlength=self.num_strata)
+        return int(np.count_nonzero(inside))
+
+    def variance_sum(self):
+        """
+        Somme V = Σ m_s p_s (1 - p_s) sur les strates (Var(Pi) = 16 V / N²).
+
+        Les r points du balayage incomplet tombent dans r strates tirées au
+        hasard, ce qui ajoute r (S - r) / (S - 1) × Var(p_s) entre strates.
+        Tant qu'une strate a reçu moins de 2 points, p_s n'est pas estimable :
+        la variance binomiale (plus grande) est retournée.
+        """
+        m = self.counts
+        h = self.hits
+        total = int(m.sum())
+        if total == 0:
+            return 0.0
+        if m.min() < 2:
+            p = h.sum() / total
+            return total * p * (1 - p)
+
+        within = float(np.sum(h * (m - h) / (m - 1)))
+        r = self.position % self.num_strata
+        between = r * (self.num_strata - r) / (self.num_strata - 1) * float(np.var(h / m))
+        return within + between
+
+
+class AntitheticSampler:
+    """
+    Variables antithétiques : chaque point (x, y) est apparié à (1-x, 1-y).
+
+    Les deux indicatrices d'une paire sont négativement corrélées (l'une
+    est dans le cercle quand l'autre tend à en sortir) : la moyenne d'une
+    paire varie moins que celle de deux points indépendants.
+    """
+
+    def __init__(self, seed_sequence=None):
+        """
+        Initialise l'échantillonneur.
+
+        Args:
+            seed_sequence: SeedSequence du worker (None = entropie du système)
+        """
+        self.rng = make_numpy_rng(seed_sequence)
+        self.pairs = 0
+        self.pair_sum = 0
+        self.pair_sum_squares = 0
+
+    def count(self, n):
+        """
+        Tire n points (n // 2 paires, plus un point isolé si n est impair).
+
+        Args:
+            n: Nombre de points
+
+        Returns:
+            Nombre de points dans le cercle
+        """
+        half = n // 2
+        x = self.rng.random(half)
+        y = self.rng.random(half)
+        first = x * x + y * y <= 1.0
+        x = 1.0 - x
+        y = 1.0 - y
+        second = x * x + y * y <= 1.0
+
+        values = first.astype(np.int64) + second
+        pair_sum = int(values.sum())
+        self.pairs += half
+        self.pair_sum += pair_sum
+        self.pair_sum_squares += int(np.dot(values, values))
+
+        inside_circle = pair_sum
+        if n % 2:
+            x, y = self.rng.random(2)
+            inside_circle += int(x * x + y * y <= 1.0)
+        return inside_circle
+
+    def variance_sum(self):
+        """Somme V = P × Var(valeur d'une paire) (Var(Pi) = 16 V / N²)."""
+        if self.pairs < 2:
+            return 0.0
+        mean = self.pair_sum / self.pairs
+        pair_variance = (self.pair_sum_squares - self.pairs * mean * mean) / (self.pairs - 1)
+        return self.pairs * pair_variance
+
+
+def count_inside_sampler(iterations, sampler, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Compte les points dans le cercle avec un échantillonneur à réduction de variance.
+
+    Args:
+        iterations: Nombre de points à générer
+        sampler: StratifiedSampler ou AntitheticSampler
+        chunk_size: Nombre de points traités par bloc
+
+    Returns:
+        Nombre de points dans le cercle
+    """
+    check_chunk_size(chunk_size)
+    inside_circle = 0
+    remaining = iterations
+
+    while remaining > 0:
+        n = min(chunk_size, remaining)
+        inside_circle += sampler.count(n)
+        remaining -= n
+
+    return inside_circle
+
+
+def worker_variance_sum(rng, inside, iterations):
+    """
+    Contribution d'un worker à la variance de l'estimation.
+
+    Pour les noyaux à réduction de variance, la valeur mesurée par
+    l'échantillonneur ; sinon la variance binomiale n p (1 - p). Les
+    contributions des workers s'additionnent : Var(Pi) = 16 ΣV / N².
+
+    Args:
+        rng: Générateur ou échantillonneur utilisé par le worker
+        inside: Points dans le cercle comptés par le worker
+        iterations: Points générés par le worker
+
+    Returns:
+        Contribution V du worker
+    """
+    if hasattr(rng, 'variance_sum'):
+        return rng.variance_sum()
+    if iterations == 0:
+        return 0.0
+    p = inside / iterations
+    return iterations * p * (1 - p)
+
+
+def variance_stats(inside, iterations, variance_sum=None):
+    """
+    Statistiques de variance d'une estimation de Pi.
+
+    Args:
+        inside: Nombre total de points dans le cercle
+        iterations: Nombre total de points
+        variance_sum: Somme des contributions V des workers
+            (défaut: variance binomiale de points indépendants)
+
+    Returns:
+        Dict avec la variance de l'estimation, la variance par point,
+        l'erreur standard et le facteur de réduction vs points indépendants
+    """
+    p = inside / iterations
+    binomial_variance = 16 * p * (1 - p) / iterations
+    if variance_sum is None:
+        variance = binomial_variance
+    else:
+        variance = 16 * variance_sum / iterations ** 2
+
+    return {
+        'variance': variance,
+        'variance_per_point': variance * iterations,
+        'stderr': math.sqrt(variance),
+        'variance_reduction': binomial_variance / variance if variance > 0 else math.inf
+    }
+
+
+def count_inside(kernel, iterations, rng, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Compte les points dans le cercle avec le noyau demandé.
+
+    Args:
+        kernel: Nom du noyau (voir KERNELS)
+        iterations: Nombre de points aléatoires à générer
+        rng: Générateur (ou HaltonStream) créé par make_rng(kernel, ...)
+        chunk_size: Taille des blocs pour les noyaux vectorisés
+
+    Returns:
+        Nombre de points dans le cercle
+    """
+    if kernel == 'python':
+        return count_inside_python(iterations, rng)
+    if kernel == 'numpy':
+        return count_inside_numpy(iterations, rng, chunk_size)
+    if kernel == 'integer':
+        return count_inside_integer(iterations, rng, chunk_size)
+    if kernel == 'halton':
+        return count_inside_halton(iterations, rng, chunk_size)
+    if kernel in VARIANCE_KERNELS:
+        return count_inside_sampler(iterations, rng, chunk_size)
+    if kernel == 'jit':
+        # Import tardif : Numba est optionnel et long à charger
+        from jit_kernel import count_inside_jit
+        return count_inside_jit(iterations, rng, chunk_size)
+    raise ValueError(f"Noyau inconnu : {kernel!r} (choix : {', '.join(KERNELS)})")
+
+
+def pi_standard_error(inside, total):
+    """
+    Erreur standard binomiale de l'estimation 4 × inside / total.
+
+    Args:
+        inside: Nombre de points dans le cercle
+        total: Nombre total de points
+
+    Returns:
+        Écart-type estimé de l'estimation de Pi
+    """
+    if total == 0:
+        return math.inf
+    p = inside / total
+    return 4 * math.sqrt(p * (1 - p) / total)
+
+
+def z_score(confidence):
+    """
+    Quantile bilatéral de la loi normale pour un niveau de confiance.
+
+    Args:
+        confidence: Niveau de confiance (ex: 0.95)
+
+    Returns:
+        z tel que P(|Z| ≤ z) = confidence (1.96 pour 0.95)
+    """
+    if not 0 < confidence < 1:
+        raise ValueError(f"Niveau de confiance invalide : {confidence} (attendu dans ]0, 1[)")
+    return statistics.NormalDist().inv_cdf(0.5 + confidence / 2)
+
+
+def run_until_precision(batch_counts, target_error, confidence=0.95, max_iterations=None):
+    """
+    Consomme des lots jusqu'à atteindre la précision demandée.
+
+    Après chaque lot, l'intervalle de confiance de l'estimation courante
+    est calculé ; le calcul s'arrête dès que sa demi-largeur est ≤
+    target_error. L'erreur standard utilise la variance mesurée par les
+    noyaux à réduction de variance (contributions V des lots) et la
+    variance binomiale sinon.
+
+    Args:
+        batch_counts: Itérable de tuples (inside, iterations, variance_sum)
+            par lot ; variance_sum vaut None sans variance propre au noyau
+        target_error: Erreur absolue visée sur Pi (demi-largeur de l'IC)
+        confidence: Niveau de confiance de l'intervalle
+        max_iterations: Plafond d'itérations (défaut: aucun)
+
+    Returns:
+        Dict avec l'estimation, les itérations consommées et la précision
+    """
+    if target_error <= 0:
+        raise ValueError(f"Erreur cible invalide : {target_error} (attendu > 0)")
+    z = z_score(confidence)
+
+    total_inside = 0
+    total_iterations = 0
+    total_variance_sum = 0.0
+    stderr = math.inf
+    half_width = math.inf
+
+    for inside, iterations, variance_sum in batch_counts:
+        total_inside += inside
+        total_iterations += iterations
+        # Un seul lot sans variance propre : variance binomiale pour tout le run
+        if variance_sum is None or total_variance_sum is None:
+            total_variance_sum = None
+        else:
+            total_variance_sum += variance_sum
+        stderr = variance_stats(total_inside, total_iterations, total_variance_sum)['stderr']
+        half_width = z * stderr
+
+        if half_width <= target_error:
+            break
+        if max_iterations is not None and total_iterations >= max_iterations:
+            break
+
+    return {
+        'pi_estimate': 4 * total_inside / total_iterations,
+        'inside': total_inside,
+        'iterations': total_iterations,
+        'stderr': stderr,
+        'half_width': half_width,
+        'confidence': confidence,
+        'target_error': target_error,
+        'target_reached': half_width <= target_error
+    }
+
+
+def count_until_deadline(kernel, rng, deadline, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Tire des blocs de points jusqu'à l'échéance.
+
+    L'échéance est comparée à time.monotonic(), horloge commune à tous les
+    threads et processus d'une même machine. Le dépassement est borné par
+    la durée d'un bloc de chunk_size points.
+
+    Args:
+        kernel: Nom du noyau (voir KERNELS)
+        rng: Générateur (ou HaltonStream) créé par make_rng(kernel, ...)
+        deadline: Échéance absolue (secondes, horloge time.monotonic)
+        chunk_size: Nombre de points tirés entre deux lectures de l'horloge
+
+    Returns:
+        Tuple (points dans le cercle, points tirés, contribution V du
+        worker à la variance, voir worker_variance_sum)
+    """
+    check_chunk_size(chunk_size)
+    inside = 0
+    iterations = 0
+    while time.monotonic() < deadline:
+        inside += count_inside(kernel, chunk_size, rng, chunk_size)
+        iterations += chunk_size
+    return inside, iterations, worker_variance_sum(rng, inside, iterations)
+
+
+def time_budget_result(inside, iterations, time_budget, elapsed, variance_sum=None):
+    """
+    Construit le résultat d'un run à budget de temps.
+
+    Args:
+        inside: Nombre total de points dans le cercle
+        iterations: Nombre total de points tirés avant l'échéance
+        time_budget: Budget demandé (secondes)
+        elapsed: Durée réellement écoulée (secondes)
+        variance_sum: Somme des contributions V des workers pour les
+            noyaux à réduction de variance (défaut: variance binomiale)
+
+    Returns:
+        Dict avec l'estimation, les points obtenus, le débit atteint et,
+        pour les noyaux à réduction de variance, les statistiques de
+        variance_stats
+    """
+    stats = None
+    if variance_sum is not None and iterations:
+        stats = variance_stats(inside, iterations, variance_sum)
+
+    return {
+        'pi_estimate': 4 * inside / iterations if iterations else math.nan,
+        'inside': inside,
+        'iterations': iterations,
+        'stderr': stats['stderr'] if stats else pi_standard_error(inside, iterations),
+        'variance_stats': stats,
+        'time_budget': time_budget,
+        'elapsed': elapsed,
+        'iterations_per_second': iterations / elapsed if elapsed > 0 else 0.0
+    }
+
+
+def add_precision_arguments(parser):
+    """
+    Ajoute les options du mode précision adaptative à un parser argparse.
+
+    Args:
+        parser: argparse.ArgumentParser du script
+    """
+    group = parser.add_argument_group('précision adaptative')
+    group.add_argument('--target-error', type=float, default=None,
+                       help='Erreur absolue visée sur Pi ; active le mode adaptatif '
+                            '(--iterations est alors ignoré)')
+    group.add_argument('--confidence', type=float, default=0.95,
+                       help='Niveau de confiance de l\'intervalle (défaut: 0.95)')
+    group.add_argument('--batch-size', type=positive_int, default=DEFAULT_BATCH_SIZE,
+                       help=f'Points par lot (défaut: {DEFAULT_BATCH_SIZE:,})')
+    group.add_argument('--max-iterations', type=int, default=None,
+                       help='Plafond d\'itérations en mode adaptatif (défaut: aucun)')
+
+
+def print_precision_report(result, execution_time):
+    """
+    Affiche le résultat d'un run en mode précision adaptative.
+
+    Args:
+        result: Dict retourné par run_until_precision
+        execution_time: Durée du run en secondes
+    """
+    status = "atteinte" if result['target_reached'] else "NON atteinte (plafond)"
+    ci_label = f"IC {result['confidence']:.0%}"
+    print("=" * 60)
+    print("RÉSULTATS (PRÉCISION ADAPTATIVE)")
+    print("=" * 60)
+    print(f"Estimation de Pi     : {result['pi_estimate']:.8f}")
+    print(f"Valeur réelle de Pi  : {3.14159265:.8f}")
+    print(f"Erreur               : {abs(result['pi_estimate'] - 3.14159265):.8f}")
+    print(f"{ci_label:<21}: ±{result['half_width']:.8f} "
+          f"(cible ±{result['target_error']:.8f}, {status})")
+    print(f"Itérations utilisées : {result['iterations']:,}")
+    print(f"Temps d'exécution    : {execution_time:.4f} secondes")
+    print(f"Itérations/seconde   : {result['iterations'] / execution_time:,.0f}")
+    print("=" * 60)
+
+
+def add_time_budget_arguments(parser):
+    """
+    Ajoute l'option du mode budget de temps à un parser argparse.
+
+    Args:
+        parser: argparse.ArgumentParser du script
+    """
+    group = parser.add_argument_group('budget de temps')
+    group.add_argument('--time-budget', type=float, default=None, metavar='SECONDS',
+                       help='Échantillonne jusqu\'à l\'échéance puis rend la meilleure '
+                            'estimation (--iterations est alors ignoré)')
+
+
+def print_time_budget_report(result):
+    """
+    Affiche le résultat d'un run en mode budget de temps.
+
+    Args:
+        result: Dict retourné par time_budget_result
+    """
+    print("=" * 60)
+    print("RÉSULTATS (BUDGET DE TEMPS)")
+    print("=" * 60)
+    print(f"Estimation de Pi     : {result['pi_estimate']:.8f}")
+    print(f"Valeur réelle de Pi  : {3.14159265:.8f}")
+    print(f"Erreur               : {abs(result['pi_estimate'] - 3.14159265):.8f}")
+    if result['variance_stats'] is not None:
+        print_variance_report(result['variance_stats'])
+    else:
+        print(f"Erreur standard      : {result['stderr']:.8f}")
+    print(f"Budget / écoulé      : {result['time_budget']:.4f} s / {result['elapsed']:.4f} s")
+    print(f"Itérations obtenues  : {result['iterations']:,}")
+    print(f"Itérations/seconde   : {result['iterations_per_second']:,.0f}")
+    print("=" * 60)
+
+
+def print_variance_report(stats):
+    """
+    Affiche la variance obtenue par un noyau à réduction de variance.
+
+    Args:
+        stats: Dict retourné par variance_stats
+    """
+    print(f"Variance par point   : {stats['variance_per_point']:.6f}")
+    print(f"Erreur standard      : {stats['stderr']:.8f}")
+    print(f"Réduction de variance: {stats['variance_reduction']:.1f}x (vs points indépendants)")
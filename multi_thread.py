@@ -5,18 +5,89 @@ Cette version utilise plusieurs threads pour paralléliser le calcul :
 - Divise les itérations entre plusieurs threads
 - Chaque thread travaille indépendamment
 - Utilise Queue pour collecter les résultats (thread-safe)
+- Chaque thread a son propre générateur aléatoire (flux indépendants)
+- Noyau NumPy optionnel (--kernel numpy) qui libère le GIL pendant le
+  calcul de chaque bloc : vrai parallélisme entre threads
+- Mode précision adaptative (--target-error)
+- Réduction de variance (--kernel stratified / antithetic), strates
+  réparties entre les threads
+- Mode budget de temps (--time-budget) : chaque thread échantillonne
+  jusqu'à une échéance commune
+- CPython free-threaded (3.13t) : sans GIL, chaque thread écrit son
+  résultat dans sa propre case au lieu d'une Queue partagée ; la boucle
+  Python pure profite alors enfin de plusieurs cœurs
 - Plus rapide sur CPU multi-cœur
 """
 
-import random
 import time
 import threading
 import queue
 import argparse
 import os
+from concurrent.futures import ThreadPoolExecutor
+from monte_carlo_core import (
+    DEFAULT_BATCH_SIZE, DEFAULT_CHUNK_SIZE, KERNELS, add_precision_arguments, positive_int,
+    VARIANCE_KERNELS, add_time_budget_arguments, gil_enabled, python_build_info, count_inside, count_until_deadline,
+    iter_batch_sizes, make_python_rng, make_rng, print_precision_report, print_time_budget_report,
+    print_variance_report, run_until_precision, spawn_seed_sequences, split_iterations,
+    time_budget_result, variance_stats, worker_variance_sum
+)
 
 
-def worker(iterations, result_queue, thread_id):
+class ResultSlot:
+    """
+    Case de résultat privée à un thread.
+    
+    Même interface put()/get() qu'une Queue, sans verrou : chaque thread a
+    sa propre case, aucun état n'est partagé entre threads.
+    """
+    
+    __slots__ = ('value',)
+    
+    def __init__(self):
+        self.value = None
+    
+    def put(self, value):
+        """Dépose le résultat du thread."""
+        self.value = value
+    
+    def get(self):
+        """Retourne le résultat déposé."""
+        return self.value
+
+
+def make_result_sinks(num_threads):
+    """
+    Crée les destinations des résultats des threads.
+    
+    Avec le GIL, une Queue thread-safe commune (comportement historique).
+    Sans GIL (build free-threaded), une ResultSlot par thread : plus de
+    contention sur le verrou interne de la Queue.
+    
+    Args:
+        num_threads: Nombre de threads
+        
+    Returns:
+        Liste d'objets put()/get(), un par thread ; appeler get() sur
+        chacun récupère tous les résultats
+    """
+    if gil_enabled():
+        result_queue = queue.Queue()
+        return [result_queue] * num_threads
+    return [ResultSlot() for _ in range(num_threads)]
+
+
+def gil_mode_label():
+    """Décrit l'état du GIL pour l'affichage."""
+    build = python_build_info()
+    if not build['free_threaded_build']:
+        return "actif (build standard)"
+    if build['gil_enabled']:
+        return "actif (build free-threaded, GIL réactivé)"
+    return "désactivé (build free-threaded) : vrai parallélisme des threads"
+
+
+def worker(iterations, result_queue, thread_id, seed_sequence=None):
     """
     Fonction worker exécutée par chaque thread.
     
@@ -24,17 +95,22 @@ def worker(iterations, result_queue, thread_id):
     combien tombent dans le cercle. Le résultat est mis dans une
     queue thread-safe.
     
+    Chaque thread utilise son propre générateur : aucun état du
+    Mersenne Twister n'est partagé avec les autres threads.
+    
     Args:
         iterations: Nombre d'itérations pour ce thread
         result_queue: Queue pour stocker le résultat
         thread_id: Identifiant du thread (pour debug)
+        seed_sequence: SeedSequence du flux de ce thread
     """
     inside_circle = 0
+    rand = make_python_rng(seed_sequence).random
     
     # Générer des points aléatoires
     for _ in range(iterations):
-        x = random.random()
-        y = random.random()
+        x = rand()
+        y = rand()
         
         if x * x + y * y <= 1:
             inside_circle += 1
@@ -43,23 +119,102 @@ def worker(iterations, result_queue, thread_id):
     result_queue.put(inside_circle)
 
 
-def monte_carlo_pi_multi(total_iterations, num_threads):
+def worker_numpy(iterations, result_queue, thread_id, seed_sequence=None,
+                 chunk_size=DEFAULT_CHUNK_SIZE, kernel='numpy', variance_sums=None):
+    """
+    Worker NumPy exécuté par chaque thread (noyaux vectorisés).
+    
+    La génération des points et le test x² + y² ≤ 1 sont des opérations
+    NumPy sur des tableaux : elles s'exécutent en code natif et libèrent
+    le GIL, ce qui permet aux threads de travailler réellement en parallèle.
+    
+    Args:
+        iterations: Nombre d'itérations pour ce thread
+        result_queue: Queue pour stocker le résultat
+        thread_id: Identifiant du thread (pour debug)
+        seed_sequence: SeedSequence du flux de ce thread
+        chunk_size: Nombre de points traités par bloc
+        kernel: Noyau vectorisé ou compilé ('numpy', 'integer', 'halton', 'stratified',
+            'antithetic', 'jit')
+        variance_sums: Liste optionnelle ; la case thread_id reçoit la
+            contribution de ce thread à la variance
+    """
+    rng = make_rng(kernel, seed_sequence)
+    inside_circle = count_inside(kernel, iterations, rng, chunk_size)
+    
+    if variance_sums is not None:
+        # Chaque thread écrit dans sa propre case : pas de conflit
+        variance_sums[thread_id] = worker_variance_sum(rng, inside_circle, iterations)
+    
+    # Mettre le résultat dans la queue (thread-safe)
+    result_queue.put(inside_circle)
+
+
+def worker_deadline(deadline, result_queue, thread_id, seed_sequence=None,
+                    chunk_size=DEFAULT_CHUNK_SIZE, kernel='python'):
+    """
+    Worker du mode budget de temps : tire des blocs jusqu'à l'échéance.
+    
+    Args:
+        deadline: Échéance absolue commune (horloge time.monotonic)
+        result_queue: Queue pour stocker le résultat
+        thread_id: Identifiant du thread (pour debug)
+        seed_sequence: SeedSequence du flux de ce thread
+        chunk_size: Points tirés entre deux lectures de l'horloge
+        kernel: Noyau de calcul (voir KERNELS)
+    """
+    rng = make_rng(kernel, seed_sequence)
+    result_queue.put(count_until_deadline(kernel, rng, deadline, chunk_size))
+
+
+# Association noyau -> fonction worker
+WORKERS = {
+    'python': worker,
+    'numpy': worker_numpy,
+    'integer': worker_numpy,
+    'halton': worker_numpy,
+    'stratified': worker_numpy,
+    'antithetic': worker_numpy,
+    'jit': worker_numpy,
+}
+
+
+def monte_carlo_pi_multi(total_iterations, num_threads, seed=None, kernel='python',
+                         chunk_size=DEFAULT_CHUNK_SIZE, stats=None):
     """
     Calcule Pi en utilisant la méthode Monte Carlo (version multi-thread).
     
     Args:
         total_iterations: Nombre total de points à générer
         num_threads: Nombre de threads à utiliser
+        seed: Graine globale, un flux indépendant est dérivé par thread
+        kernel: 'python' (boucle pure, limitée par le GIL), 'numpy',
+            'integer' (tirages entiers 31 bits),
+            'halton' (quasi-Monte Carlo, un segment de la suite par thread),
+            'stratified' ou 'antithetic' (réduction de variance),
+            'jit' (boucle compilée par Numba, sans le GIL)
+        chunk_size: Taille des blocs pour les noyaux vectorisés
+        stats: Dict optionnel, rempli avec la variance obtenue
+            (voir monte_carlo_core.variance_stats)
         
     Returns:
         Estimation de Pi
     """
+    if kernel not in WORKERS:
+        raise ValueError(f"Noyau inconnu : {kernel!r} (choix : {', '.join(KERNELS)})")
+    
     # Diviser les itérations entre les threads
     iterations_per_thread = total_iterations // num_threads
     remaining_iterations = total_iterations % num_threads
     
-    # Créer une queue thread-safe pour collecter les résultats
-    result_queue = queue.Queue()
+    # Queue thread-safe, ou une case privée par thread sans GIL
+    result_sinks = make_result_sinks(num_threads)
+    
+    # Un flux aléatoire indépendant par thread
+    seed_sequences = spawn_seed_sequences(seed, num_threads)
+    
+    # Contributions à la variance (noyaux à réduction de variance)
+    variance_sums = [0.0] * num_threads if kernel in VARIANCE_KERNELS else None
     
     # Créer et démarrer les threads
     threads = []
@@ -69,7 +224,11 @@ def monte_carlo_pi_multi(total_iterations, num_threads):
         if i == num_threads - 1:
             iterations += remaining_iterations
         
-        t = threading.Thread(target=worker, args=(iterations, result_queue, i))
+        args = (iterations, result_sinks[i], i, seed_sequences[i])
+        if kernel != 'python':
+            args += (chunk_size, kernel, variance_sums)
+        
+        t = threading.Thread(target=WORKERS[kernel], args=args)
         threads.append(t)
         t.start()
     
@@ -79,14 +238,126 @@ def monte_carlo_pi_multi(total_iterations, num_threads):
     
     # Collecter les résultats de tous les threads
     total_inside = 0
-    for _ in range(num_threads):
-        total_inside += result_queue.get()
+    for sink in result_sinks:
+        total_inside += sink.get()
+    
+    if stats is not None:
+        variance_sum = sum(variance_sums) if variance_sums is not None else None
+        stats.update(variance_stats(total_inside, total_iterations, variance_sum))
     
     # Calculer l'estimation de Pi
     pi_estimate = 4 * total_inside / total_iterations
     return pi_estimate
 
 
+def iter_batch_counts_multi(batch_size=DEFAULT_BATCH_SIZE, num_threads=4, kernel='python',
+                            chunk_size=DEFAULT_CHUNK_SIZE, seed=None, total_iterations=None):
+    """
+    Génère des lots de points calculés par plusieurs threads.
+    
+    Les threads et leurs générateurs sont créés une seule fois : chaque
+    thread poursuit son propre flux d'un lot à l'autre.
+    
+    Args:
+        batch_size: Nombre de points par lot
+        num_threads: Nombre de threads à utiliser
+        kernel: Noyau de calcul (voir KERNELS)
+        chunk_size: Taille des blocs pour les noyaux vectorisés
+        seed: Graine globale, un flux indépendant est dérivé par thread
+        total_iterations: Nombre total de points (défaut: flux infini)
+        
+    Yields:
+        Tuples (points dans le cercle, points du lot, contribution du lot à
+        la variance ; None hors VARIANCE_KERNELS)
+    """
+    rngs = [make_rng(kernel, seq) for seq in spawn_seed_sequences(seed, num_threads)]
+    variance_sum = 0.0
+    
+    with ThreadPoolExecutor(max_workers=num_threads) as executor:
+        for batch in iter_batch_sizes(batch_size, total_iterations):
+            tasks = split_iterations(batch, num_threads)
+            futures = [executor.submit(count_inside, kernel, n, rng, chunk_size)
+                       for n, rng in zip(tasks, rngs)]
+            inside = sum(f.result() for f in futures)
+            if kernel not in VARIANCE_KERNELS:
+                yield inside, batch, None
+                continue
+            # Les échantillonneurs cumulent depuis le début : on rend l'accroissement
+            previous, variance_sum = variance_sum, sum(rng.variance_sum() for rng in rngs)
+            yield inside, batch, variance_sum - previous
+
+
+def monte_carlo_pi_multi_adaptive(target_error, num_threads, confidence=0.95,
+                                  batch_size=DEFAULT_BATCH_SIZE, max_iterations=None,
+                                  kernel='python', chunk_size=DEFAULT_CHUNK_SIZE, seed=None):
+    """
+    Calcule Pi jusqu'à atteindre une erreur cible (version multi-thread).
+    
+    Args:
+        target_error: Erreur absolue visée (demi-largeur de l'IC)
+        num_threads: Nombre de threads à utiliser
+        confidence: Niveau de confiance de l'intervalle
+        batch_size: Nombre de points par lot
+        max_iterations: Plafond d'itérations (défaut: aucun)
+        kernel: Noyau de calcul ('python' ou 'numpy')
+        chunk_size: Taille des blocs pour le noyau NumPy
+        seed: Graine globale (défaut: aléatoire)
+        
+    Returns:
+        Dict avec l'estimation et les itérations réellement consommées
+    """
+    batches = iter_batch_counts_multi(batch_size, num_threads, kernel, chunk_size, seed)
+    try:
+        return run_until_precision(batches, target_error, confidence, max_iterations)
+    finally:
+        # Arrête les threads du pool
+        batches.close()
+
+
+def monte_carlo_pi_multi_time_budget(time_budget, num_threads, kernel='python',
+                                     chunk_size=DEFAULT_CHUNK_SIZE, seed=None):
+    """
+    Calcule la meilleure estimation de Pi possible dans un budget de temps.
+    
+    Args:
+        time_budget: Durée maximale du calcul (secondes)
+        num_threads: Nombre de threads à utiliser
+        kernel: Noyau de calcul (voir KERNELS)
+        chunk_size: Points tirés entre deux lectures de l'horloge
+        seed: Graine globale, un flux indépendant est dérivé par thread
+        
+    Returns:
+        Dict avec l'estimation, les points obtenus et le débit atteint
+    """
+    start = time.monotonic()
+    deadline = start + time_budget
+    result_sinks = make_result_sinks(num_threads)
+    seed_sequences = spawn_seed_sequences(seed, num_threads)
+    
+    threads = []
+    for i in range(num_threads):
+        t = threading.Thread(target=worker_deadline,
+                             args=(deadline, result_sinks[i], i, seed_sequences[i], chunk_size,
+                                   kernel))
+        threads.append(t)
+        t.start()
+    
+    for t in threads:
+        t.join()
+    
+    total_inside = 0
+    total_iterations = 0
+    total_variance_sum = 0.0
+    for sink in result_sinks:
+        inside, iterations, variance_sum = sink.get()
+        total_inside += inside
+        total_iterations += iterations
+        total_variance_sum += variance_sum
+    
+    return time_budget_result(total_inside, total_iterations, time_budget, time.monotonic() - start,
+                              total_variance_sum if kernel in VARIANCE_KERNELS else None)
+
+
 def main():
     """Fonction principale pour exécuter la simulation multi-thread."""
     parser = argparse.ArgumentParser(description='Simulation Monte Carlo - Multi-Thread')
@@ -94,6 +365,14 @@ def main():
                         help='Nombre d\'itérations (défaut: 10,000,000)')
     parser.add_argument('--threads', type=int, default=None,
                         help='Nombre de threads (défaut: nombre de CPU)')
+    parser.add_argument('--seed', type=int, default=None,
+                        help='Graine pour un run reproductible (défaut: aléatoire)')
+    parser.add_argument('--kernel', choices=KERNELS, default='python',
+                        help='Noyau de calcul (défaut: python, numpy libère le GIL)')
+    parser.add_argument('--chunk-size', type=positive_int, default=DEFAULT_CHUNK_SIZE,
+                        help=f'Taille des blocs du noyau NumPy (défaut: {DEFAULT_CHUNK_SIZE:,})')
+    add_precision_arguments(parser)
+    add_time_budget_arguments(parser)
     args = parser.parse_args()
     
     iterations = args.iterations
@@ -104,19 +383,28 @@ def main():
     else:
         num_threads = args.threads
     
+    if args.target_error is not None:
+        return main_adaptive(args, num_threads)
+    if args.time_budget is not None:
+        return main_time_budget(args, num_threads)
+    
     print("=" * 60)
     print("SIMULATION MONTE CARLO - MULTI-THREAD")
     print("=" * 60)
     print(f"Nombre d'itérations  : {iterations:,}")
     print(f"Nombre de threads    : {num_threads}")
+    print(f"Noyau                : {args.kernel}")
     print(f"Nombre de CPU        : {os.cpu_count()}")
+    print(f"GIL                  : {gil_mode_label()}")
     print(f"Itérations/thread    : {iterations // num_threads:,}")
     print("Démarrage du calcul...")
     print()
     
     # Mesurer le temps d'exécution
+    stats = {}
     start_time = time.time()
-    pi_estimate = monte_carlo_pi_multi(iterations, num_threads)
+    pi_estimate = monte_carlo_pi_multi(iterations, num_threads, args.seed, args.kernel,
+                                       args.chunk_size, stats)
     end_time = time.time()
     
     execution_time = end_time - start_time
@@ -130,6 +418,8 @@ def main():
     print(f"Erreur               : {abs(pi_estimate - 3.14159265):.8f}")
     print(f"Temps d'exécution    : {execution_time:.4f} secondes")
     print(f"Itérations/seconde   : {iterations / execution_time:,.0f}")
+    if args.kernel in VARIANCE_KERNELS:
+        print_variance_report(stats)
     print("=" * 60)
     
     return {
@@ -137,9 +427,62 @@ def main():
         'execution_time': execution_time,
         'iterations': iterations,
         'num_threads': num_threads,
+        'kernel': args.kernel,
+        'seed': args.seed,
+        'python': python_build_info(),
+        'variance': stats['variance'],
         'iterations_per_second': iterations / execution_time
     }
 
 
+def main_adaptive(args, num_threads):
+    """Exécute la simulation multi-thread en mode précision adaptative."""
+    print("=" * 60)
+    print("SIMULATION MONTE CARLO - MULTI-THREAD (PRÉCISION ADAPTATIVE)")
+    print("=" * 60)
+    print(f"Erreur cible         : ±{args.target_error} (confiance {args.confidence:.0%})")
+    print(f"Points par lot       : {args.batch_size:,}")
+    print(f"Nombre de threads    : {num_threads}")
+    print(f"Noyau                : {args.kernel}")
+    print("Démarrage du calcul...")
+    print()
+    
+    start_time = time.perf_counter()
+    result = monte_carlo_pi_multi_adaptive(
+        args.target_error, num_threads, args.confidence, args.batch_size,
+        args.max_iterations, args.kernel, args.chunk_size, args.seed
+    )
+    execution_time = time.perf_counter() - start_time
+    
+    print_precision_report(result, execution_time)
+    
+    result['execution_time'] = execution_time
+    result['num_threads'] = num_threads
+    result['kernel'] = args.kernel
+    result['seed'] = args.seed
+    return result
+
+
+def main_time_budget(args, num_threads):
+    """Exécute la simulation multi-thread en mode budget de temps."""
+    print("=" * 60)
+    print("SIMULATION MONTE CARLO - MULTI-THREAD (BUDGET DE TEMPS)")
+    print("=" * 60)
+    print(f"Budget de temps      : {args.time_budget} secondes")
+    print(f"Nombre de threads    : {num_threads}")
+    print(f"Noyau                : {args.kernel}")
+    print("Démarrage du calcul...")
+    print()
+    
+    result = monte_carlo_pi_multi_time_budget(args.time_budget, num_threads, args.kernel,
+                                              args.chunk_size, args.seed)
+    print_time_budget_report(result)
+    
+    result['num_threads'] = num_threads
+    result['kernel'] = args.kernel
+    result['seed'] = args.seed
+    return result
+
+
 if __name__ == "__main__":
     main()
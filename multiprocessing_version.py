@@ -6,34 +6,81 @@ Cette version utilise multiprocessing au lieu de threading pour contourner le GI
 - Chaque processus a son propre interpréteur Python
 - Speedup réel de 4x sur 4 cœurs (pas limité par le GIL)
 - Idéal pour tâches CPU-bound intensives
+- Chaque processus reçoit son propre flux aléatoire (pas de séquence
+  dupliquée par fork)
+- Ordonnancement dynamique optionnel : nombreux petits blocs distribués
+  aux processus libres (imap_unordered)
+- Mode précision adaptative (--target-error) sur un pool persistant
+- Noyaux vectorisés optionnels (--kernel numpy / halton / stratified /
+  antithetic), avec mesure de la variance obtenue
+- Compteurs en mémoire partagée (--shared-memory) : progression et
+  estimation partielle lisibles en direct par le parent
+- Mode budget de temps (--time-budget) : chaque processus échantillonne
+  jusqu'à une échéance commune (horloge monotone du système)
+- Points de reprise (--checkpoint / --resume) : un run interrompu reprend
+  là où il s'était arrêté, avec un résultat identique
 """
 
-import random
+import sys
 import time
 import multiprocessing as mp
+from multiprocessing import shared_memory
 import argparse
 import os
+import numpy as np
+from checkpoint import DEFAULT_CHECKPOINT_INTERVAL, Checkpoint
+from monte_carlo_core import (
+    DEFAULT_BATCH_SIZE, DEFAULT_CHUNK_SIZE, KERNELS, VARIANCE_KERNELS, add_precision_arguments,
+    add_time_budget_arguments, count_inside, count_until_deadline, iter_batch_sizes,
+    make_python_rng, make_rng, positive_int, print_precision_report, print_time_budget_report,
+    print_variance_report, run_until_precision, split_iterations, time_budget_result,
+    variance_stats, worker_variance_sum
+)
 
 
-def worker_process(iterations):
+# Modes d'ordonnancement des tâches
+SCHEDULES = ('static', 'dynamic')
+
+# Nombre de blocs par processus en mode dynamique
+DEFAULT_CHUNKS_PER_PROCESS = 8
+
+# Intervalle de lecture des compteurs partagés par le parent (secondes)
+DEFAULT_POLL_INTERVAL = 0.1
+
+# Segment de mémoire partagée attaché par ce worker : (nom, SharedMemory, vues NumPy)
+_attached_counters = None
+
+
+def worker_process(iterations, seed_sequence=None, kernel='python', chunk_size=DEFAULT_CHUNK_SIZE):
     """
     Fonction worker exécutée par chaque processus.
     
     Chaque processus génère ses propres points aléatoires et compte
     combien tombent dans le cercle. Le résultat est retourné directement.
     
+    Le générateur est créé dans le processus à partir de sa propre
+    SeedSequence : un enfant créé par fork ne rejoue pas la séquence
+    héritée du parent.
+    
     Args:
         iterations: Nombre d'itérations pour ce processus
+        seed_sequence: SeedSequence du flux de ce processus
+        kernel: Noyau de calcul (voir KERNELS)
+        chunk_size: Taille des blocs pour les noyaux vectorisés
         
     Returns:
         Nombre de points dans le cercle
     """
+    if kernel != 'python':
+        return count_inside(kernel, iterations, make_rng(kernel, seed_sequence), chunk_size)
+    
     inside_circle = 0
+    rand = make_python_rng(seed_sequence).random
     
     # Générer des points aléatoires
     for _ in range(iterations):
-        x = random.random()
-        y = random.random()
+        x = rand()
+        y = rand()
         
         if x * x + y * y <= 1:
             inside_circle += 1
@@ -41,36 +88,693 @@ def worker_process(iterations):
     return inside_circle
 
 
-def monte_carlo_pi_multiprocessing(total_iterations, num_processes):
+def worker_task(task):
+    """
+    Adaptateur pour imap_unordered : dépaquette les arguments d'une tâche.
+    
+    Args:
+        task: Tuple (iterations, seed_sequence, kernel, chunk_size)
+        
+    Returns:
+        Nombre de points dans le cercle
+    """
+    return worker_process(*task)
+
+
+def worker_process_variance(iterations, seed_sequence=None, kernel='stratified',
+                            chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Worker pour les noyaux à réduction de variance.
+    
+    Args:
+        iterations: Nombre d'itérations pour ce processus
+        seed_sequence: SeedSequence du flux de ce processus
+        kernel: Noyau de calcul ('stratified' ou 'antithetic')
+        chunk_size: Taille des blocs
+        
+    Returns:
+        Tuple (points dans le cercle, contribution à la variance)
+    """
+    rng = make_rng(kernel, seed_sequence)
+    inside_circle = count_inside(kernel, iterations, rng, chunk_size)
+    return inside_circle, worker_variance_sum(rng, inside_circle, iterations)
+
+
+def worker_task_variance(task):
+    """Adaptateur de worker_process_variance pour imap_unordered."""
+    return worker_process_variance(*task)
+
+
+def worker_task_indexed(task):
+    """
+    Adaptateur pour imap_unordered qui renvoie aussi l'indice du bloc.
+    
+    Args:
+        task: Tuple (indice, (iterations, seed_sequence, kernel, chunk_size))
+        
+    Returns:
+        Tuple (indice, (points dans le cercle, contribution à la variance ou None))
+    """
+    index, args = task
+    if args[2] in VARIANCE_KERNELS:
+        return index, worker_process_variance(*args)
+    return index, (worker_process(*args), None)
+
+
+def worker_process_deadline(deadline, seed_sequence=None, kernel='python',
+                            chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Worker du mode budget de temps : tire des blocs jusqu'à l'échéance.
+    
+    Args:
+        deadline: Échéance absolue commune (horloge time.monotonic)
+        seed_sequence: SeedSequence du flux de ce processus
+        kernel: Noyau de calcul (voir KERNELS)
+        chunk_size: Points tirés entre deux lectures de l'horloge
+        
+    Returns:
+        Tuple (points dans le cercle, points tirés, contribution à la variance)
+    """
+    rng = make_rng(kernel, seed_sequence)
+    return count_until_deadline(kernel, rng, deadline, chunk_size)
+
+
+def worker_task_deadline(task):
+    """Adaptateur de worker_process_deadline pour imap_unordered."""
+    return worker_process_deadline(*task)
+
+
+def _counter_views(buffer, num_slots):
+    """Vues NumPy d'un segment de compteurs : (inside, total) entiers et variance."""
+    counts = np.ndarray((num_slots, 2), dtype=np.int64, buffer=buffer)
+    variances = np.ndarray((num_slots,), dtype=np.float64, buffer=buffer,
+                           offset=counts.nbytes)
+    return counts, variances
+
+
+def _attach_counters(shm_name, num_slots):
+    """Attache (une seule fois par segment) les compteurs partagés."""
+    global _attached_counters
+    if _attached_counters is None or _attached_counters[0] != shm_name:
+        if _attached_counters is not None:
+            _attached_counters[1].close()
+        shm = shared_memory.SharedMemory(name=shm_name)
+        _attached_counters = (shm_name, shm, _counter_views(shm.buf, num_slots))
+    return _attached_counters[2]
+
+
+def worker_process_shared(shm_name, num_slots, slot, iterations, seed_sequence=None,
+                          kernel='python', chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Worker qui accumule ses résultats dans des compteurs en mémoire partagée.
+    
+    Après chaque bloc, le worker ajoute (points dans le cercle, points
+    générés) à la case de sa tâche : aucune valeur ne repasse par le
+    pickling du pool, et le parent lit la progression sans copie. En fin
+    de tâche, la contribution à la variance est écrite dans la même case.
+    
+    Args:
+        shm_name: Nom du segment SharedMemory des compteurs
+        num_slots: Nombre de cases (une par tâche)
+        slot: Case de cette tâche
+        iterations: Nombre d'itérations pour cette tâche
+        seed_sequence: SeedSequence du flux de cette tâche
+        kernel: Noyau de calcul (voir KERNELS)
+        chunk_size: Nombre de points entre deux mises à jour des compteurs
+    """
+    counts, variances = _attach_counters(shm_name, num_slots)
+    counters = counts[slot]
+    rng = make_rng(kernel, seed_sequence)
+    remaining = iterations
+    
+    while remaining > 0:
+        n = min(chunk_size, remaining)
+        # Une case par tâche, écrite par un seul processus : pas besoin de verrou
+        counters[0] += count_inside(kernel, n, rng, chunk_size)
+        counters[1] += n
+        remaining -= n
+    variances[slot] = worker_variance_sum(rng, int(counters[0]), iterations)
+
+
+class SharedCounters:
+    """
+    Compteurs (inside, total) et contribution à la variance par tâche,
+    dans un segment SharedMemory.
+    
+    Le parent crée le segment, les workers l'attachent par son nom ; la
+    lecture par le parent est une vue NumPy (zéro copie). Chaque tâche a
+    sa propre case : aucune case n'est écrite par deux processus, même si
+    le pool remplace un worker.
+    """
+    
+    def __init__(self, num_slots):
+        """
+        Crée le segment de mémoire partagée (initialisé à zéro).
+        
+        Args:
+            num_slots: Nombre de cases (une par tâche)
+        """
+        self.num_slots = num_slots
+        self.shm = shared_memory.SharedMemory(create=True, size=num_slots * 3 * 8)
+        self.counters, self.variances = _counter_views(self.shm.buf, num_slots)
+        self.counters[:] = 0
+        self.variances[:] = 0.0
+    
+    @property
+    def name(self):
+        """Nom du segment, à transmettre aux workers."""
+        return self.shm.name
+    
+    def totals(self):
+        """
+        Lit les compteurs de toutes les tâches.
+        
+        Pendant le calcul, la valeur est une photographie approximative
+        (un worker peut être entre ses deux écritures).
+        
+        Returns:
+            Tuple (points dans le cercle, points générés)
+        """
+        inside, total = self.counters.sum(axis=0)
+        return int(inside), int(total)
+    
+    def variance_sum(self):
+        """Somme des contributions à la variance des tâches terminées."""
+        return float(self.variances.sum())
+    
+    def close(self):
+        """Libère et supprime le segment."""
+        del self.counters, self.variances
+        self.shm.close()
+        self.shm.unlink()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class MonteCarloPool:
+    """
+    Pool de processus persistant et réutilisable.
+    
+    Les processus sont créés une seule fois puis réutilisés pour plusieurs
+    estimations : le coût de démarrage n'est payé qu'une fois et il est
+    mesuré séparément du temps de calcul.
+    
+    Exemple :
+        with MonteCarloPool(4) as pool:
+            for _ in range(100):
+                pi = pool.estimate(1_000_000)
+    """
+    
+    def __init__(self, num_processes=None, kernel='python', chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Initialise le pool (les processus ne sont pas encore créés).
+        
+        Args:
+            num_processes: Nombre de processus (défaut: nombre de CPU)
+            kernel: Noyau de calcul utilisé par les workers (voir KERNELS)
+            chunk_size: Taille des blocs pour les noyaux vectorisés
+        """
+        if kernel not in KERNELS:
+            raise ValueError(f"Noyau inconnu : {kernel!r} (choix : {', '.join(KERNELS)})")
+        self.num_processes = num_processes or os.cpu_count() or 4
+        self.kernel = kernel
+        self.chunk_size = chunk_size
+        self.pool = None
+        self.startup_time = 0.0
+        self.warmup_time = 0.0
+        self.last_compute_time = 0.0
+        self.last_variance_sum = None
+        self.last_stats = {}
+        self.last_checkpoint = None
+        self.last_resumed_chunks = 0
+        self.last_resumed_iterations = 0
+    
+    def start(self):
+        """Crée les processus et les prépare (warm-up)."""
+        if self.pool is not None:
+            return self
+        
+        if os.name == 'posix':
+            # Démarrer le resource tracker avant le fork : les workers le
+            # partagent au lieu d'en lancer un chacun, qui supprimerait les
+            # segments SharedMemory attachés à la fin du worker
+            from multiprocessing import resource_tracker
+            resource_tracker.ensure_running()
+        
+        start_time = time.perf_counter()
+        self.pool = mp.Pool(processes=self.num_processes)
+        self.startup_time = time.perf_counter() - start_time
+        
+        self.warm_up()
+        return self
+    
+    def warm_up(self):
+        """
+        Envoie une tâche vide à chaque processus.
+        
+        Force le démarrage effectif des workers et l'import des modules,
+        pour que la première estimation ne paie pas ce coût.
+        """
+        start_time = time.perf_counter()
+        self.pool.map(worker_process, [0] * self.num_processes, chunksize=1)
+        self.warmup_time = time.perf_counter() - start_time
+    
+    def count_inside(self, total_iterations, seed_sequence, schedule='static', num_chunks=None):
+        """
+        Compte les points dans le cercle avec les processus du pool.
+        
+        En mode 'static', une tâche par processus. En mode 'dynamic', les
+        itérations sont découpées en `num_chunks` blocs que les processus
+        libres viennent chercher au fur et à mesure ; les résultats sont
+        sommés dès leur arrivée. Un cœur lent ou préempté ne retarde alors
+        qu'un petit bloc.
+        
+        Args:
+            total_iterations: Nombre total de points à générer
+            seed_sequence: SeedSequence racine ; chaque appel en dérive de
+                nouveaux flux enfants, un par tâche
+            schedule: 'static' ou 'dynamic'
+            num_chunks: Nombre de blocs en mode dynamique
+                (défaut: DEFAULT_CHUNKS_PER_PROCESS × nombre de processus)
+            
+        Returns:
+            Nombre de points dans le cercle
+        """
+        if schedule not in SCHEDULES:
+            raise ValueError(f"Ordonnancement inconnu : {schedule!r} (choix : {', '.join(SCHEDULES)})")
+        if self.pool is None:
+            self.start()
+        
+        if schedule == 'static':
+            num_tasks = self.num_processes
+        else:
+            num_tasks = num_chunks or DEFAULT_CHUNKS_PER_PROCESS * self.num_processes
+        num_tasks = max(1, min(num_tasks, total_iterations))
+        
+        tasks = split_iterations(total_iterations, num_tasks)
+        
+        # Un flux aléatoire indépendant par tâche
+        seed_sequences = seed_sequence.spawn(num_tasks)
+        task_args = [(n, seq, self.kernel, self.chunk_size)
+                     for n, seq in zip(tasks, seed_sequences)]
+        
+        start_time = time.perf_counter()
+        if self.kernel in VARIANCE_KERNELS:
+            total_inside = self._count_inside_variance(task_args, schedule)
+        elif schedule == 'static':
+            results = self.pool.starmap(worker_process, task_args)
+            total_inside = sum(results)
+        else:
+            # Réduction au fil de l'arrivée des blocs, quel que soit leur ordre
+            total_inside = 0
+            for inside in self.pool.imap_unordered(worker_task, task_args):
+                total_inside += inside
+        self.last_compute_time = time.perf_counter() - start_time
+        
+        return total_inside
+    
+    def _count_inside_variance(self, task_args, schedule):
+        """Variante de count_inside qui additionne aussi les contributions à la variance."""
+        if schedule == 'static':
+            results = self.pool.starmap(worker_process_variance, task_args)
+        else:
+            results = self.pool.imap_unordered(worker_task_variance, task_args)
+        
+        total_inside = 0
+        self.last_variance_sum = 0.0
+        for inside, variance_sum in results:
+            total_inside += inside
+            self.last_variance_sum += variance_sum
+        return total_inside
+    
+    def estimate(self, total_iterations, seed=None, schedule='static', num_chunks=None):
+        """
+        Calcule Pi avec les processus du pool.
+        
+        La variance obtenue est disponible ensuite dans `last_stats`.
+        
+        Args:
+            total_iterations: Nombre total de points à générer
+            seed: Graine globale, un flux indépendant est dérivé par tâche
+            schedule: 'static' (une tâche par processus) ou 'dynamic'
+            num_chunks: Nombre de blocs en mode dynamique
+            
+        Returns:
+            Estimation de Pi
+        """
+        seed_sequence = np.random.SeedSequence(seed)
+        self.last_variance_sum = None
+        total_inside = self.count_inside(total_iterations, seed_sequence, schedule, num_chunks)
+        self.last_stats = variance_stats(total_inside, total_iterations, self.last_variance_sum)
+        return 4 * total_inside / total_iterations
+    
+    def estimate_checkpointed(self, total_iterations, checkpoint_path, seed=None,
+                              num_chunks=None, resume=False,
+                              interval=DEFAULT_CHECKPOINT_INTERVAL):
+        """
+        Calcule Pi en enregistrant régulièrement l'avancement sur disque.
+        
+        Le run est découpé en `num_chunks` blocs, le bloc k utilisant le
+        k-ième flux enfant de la graine : avec la même graine et le même
+        nombre de blocs, le résultat (repris ou non) est identique à celui
+        de estimate(..., schedule='dynamic', num_chunks=num_chunks).
+        
+        Args:
+            total_iterations: Nombre total de points à générer
+            checkpoint_path: Chemin du fichier de reprise
+            seed: Graine globale (défaut: aléatoire, ou celle du fichier en reprise)
+            num_chunks: Nombre de blocs du run (défaut: celui du fichier en
+                reprise, sinon DEFAULT_CHUNKS_PER_PROCESS × nombre de processus)
+            resume: Reprendre le run enregistré dans checkpoint_path
+            interval: Intervalle minimal entre deux écritures (secondes)
+            
+        Returns:
+            Estimation de Pi
+        """
+        if self.pool is None:
+            self.start()
+        
+        # En reprise, sans valeur explicite, le nombre de blocs et l'entropie
+        # sont relus dans le fichier : la reprise ne dépend pas de --processes
+        if not (resume and num_chunks is None):
+            num_chunks = num_chunks or DEFAULT_CHUNKS_PER_PROCESS * self.num_processes
+            num_chunks = max(1, min(num_chunks, total_iterations))
+        entropy = None if resume and seed is None else np.random.SeedSequence(seed).entropy
+        ckpt = Checkpoint.open(checkpoint_path, total_iterations, entropy, self.kernel,
+                               num_chunks, resume, interval)
+        self.last_checkpoint = ckpt
+        self.last_resumed_chunks = len(ckpt.completed)
+        self.last_resumed_iterations = ckpt.totals()[1]
+        num_chunks = ckpt.num_chunks
+        
+        tasks = split_iterations(total_iterations, num_chunks)
+        seed_sequences = np.random.SeedSequence(ckpt.entropy).spawn(num_chunks)
+        task_args = [(k, (tasks[k], seed_sequences[k], self.kernel, self.chunk_size))
+                     for k in ckpt.pending()]
+        
+        start_time = time.perf_counter()
+        try:
+            for index, (inside, variance_sum) in self.pool.imap_unordered(worker_task_indexed,
+                                                                          task_args):
+                ckpt.record(index, inside, tasks[index], variance_sum)
+        finally:
+            # Interruption ou fin normale : les blocs terminés sont conservés
+            ckpt.save()
+        self.last_compute_time = time.perf_counter() - start_time
+        
+        total_inside, _, variance_sum = ckpt.totals()
+        self.last_variance_sum = variance_sum if self.kernel in VARIANCE_KERNELS else None
+        self.last_stats = variance_stats(total_inside, total_iterations, self.last_variance_sum)
+        return 4 * total_inside / total_iterations
+    
+    def count_inside_shared(self, total_iterations, seed_sequence, num_chunks=None,
+                            progress=None, poll_interval=DEFAULT_POLL_INTERVAL):
+        """
+        Compte les points dans le cercle via des compteurs en mémoire partagée.
+        
+        Les blocs sont distribués dynamiquement ; chaque bloc accumule
+        dans sa case du segment partagé, avec sa contribution à la variance
+        (last_variance_sum pour les noyaux à réduction de variance). Pendant le calcul, le parent lit
+        les compteurs toutes les `poll_interval` secondes et appelle
+        progress(inside, total) avec l'estimation partielle.
+        
+        Args:
+            total_iterations: Nombre total de points à générer
+            seed_sequence: SeedSequence racine (un flux enfant par bloc)
+            num_chunks: Nombre de blocs
+                (défaut: DEFAULT_CHUNKS_PER_PROCESS × nombre de processus)
+            progress: Fonction optionnelle appelée avec (inside, total)
+            poll_interval: Intervalle de lecture des compteurs (secondes)
+            
+        Returns:
+            Nombre de points dans le cercle
+        """
+        if self.pool is None:
+            self.start()
+        
+        num_tasks = num_chunks or DEFAULT_CHUNKS_PER_PROCESS * self.num_processes
+        num_tasks = max(1, min(num_tasks, total_iterations))
+        tasks = split_iterations(total_iterations, num_tasks)
+        seed_sequences = seed_sequence.spawn(num_tasks)
+        
+        with SharedCounters(num_tasks) as counters:
+            task_args = [(counters.name, num_tasks, slot, n, seq, self.kernel, self.chunk_size)
+                         for slot, (n, seq) in enumerate(zip(tasks, seed_sequences))]
+            
+            start_time = time.perf_counter()
+            result = self.pool.starmap_async(worker_process_shared, task_args, chunksize=1)
+            while not result.ready():
+                result.wait(poll_interval)
+                if progress is not None:
+                    progress(*counters.totals())
+            # Propage une éventuelle exception d'un worker
+            result.get()
+            self.last_compute_time = time.perf_counter() - start_time
+            
+            total_inside, _ = counters.totals()
+            self.last_variance_sum = (counters.variance_sum()
+                                      if self.kernel in VARIANCE_KERNELS else None)
+        
+        return total_inside
+    
+    def estimate_shared(self, total_iterations, seed=None, num_chunks=None, progress=None,
+                        poll_interval=DEFAULT_POLL_INTERVAL):
+        """
+        Calcule Pi avec les compteurs en mémoire partagée.
+        
+        Args:
+            total_iterations: Nombre total de points à générer
+            seed: Graine globale, un flux indépendant est dérivé par bloc
+            num_chunks: Nombre de blocs
+            progress: Fonction optionnelle appelée avec (inside, total)
+            poll_interval: Intervalle de lecture des compteurs (secondes)
+            
+        Returns:
+            Estimation de Pi
+        """
+        seed_sequence = np.random.SeedSequence(seed)
+        total_inside = self.count_inside_shared(total_iterations, seed_sequence, num_chunks,
+                                                progress, poll_interval)
+        self.last_stats = variance_stats(total_inside, total_iterations, self.last_variance_sum)
+        return 4 * total_inside / total_iterations
+    
+    def iter_batch_counts(self, batch_size=DEFAULT_BATCH_SIZE, seed=None,
+                          schedule='static', num_chunks=None, total_iterations=None):
+        """
+        Génère des lots de points calculés par le pool.
+        
+        Chaque lot utilise de nouveaux flux enfants de la même racine :
+        la suite des lots est reproductible pour une graine donnée.
+        
+        Args:
+            batch_size: Nombre de points par lot
+            seed: Graine globale (défaut: aléatoire)
+            schedule: 'static' ou 'dynamic'
+            num_chunks: Nombre de blocs par lot en mode dynamique
+            total_iterations: Nombre total de points (défaut: flux infini)
+            
+        Yields:
+            Tuples (points dans le cercle, points du lot, contribution du lot
+            à la variance ; None hors VARIANCE_KERNELS)
+        """
+        seed_sequence = np.random.SeedSequence(seed)
+        for n in iter_batch_sizes(batch_size, total_iterations):
+            inside = self.count_inside(n, seed_sequence, schedule, num_chunks)
+            # Chaque lot utilise de nouveaux flux : sa contribution est indépendante
+            yield inside, n, self.last_variance_sum if self.kernel in VARIANCE_KERNELS else None
+    
+    def estimate_time_budget(self, time_budget, seed=None):
+        """
+        Calcule la meilleure estimation de Pi possible dans un budget de temps.
+        
+        Le pool est démarré avant l'échéance si besoin : seul le calcul
+        consomme le budget.
+        
+        Args:
+            time_budget: Durée maximale du calcul (secondes)
+            seed: Graine globale (défaut: aléatoire)
+            
+        Returns:
+            Dict avec l'estimation, les points obtenus et le débit atteint
+        """
+        if self.pool is None:
+            self.start()
+        
+        start = time.monotonic()
+        deadline = start + time_budget
+        seed_sequences = np.random.SeedSequence(seed).spawn(self.num_processes)
+        tasks = [(deadline, seq, self.kernel, self.chunk_size) for seq in seed_sequences]
+        
+        total_inside = 0
+        total_iterations = 0
+        total_variance_sum = 0.0
+        for inside, iterations, variance_sum in self.pool.imap_unordered(worker_task_deadline,
+                                                                         tasks):
+            total_inside += inside
+            total_iterations += iterations
+            total_variance_sum += variance_sum
+        
+        elapsed = time.monotonic() - start
+        self.last_compute_time = elapsed
+        return time_budget_result(total_inside, total_iterations, time_budget, elapsed,
+                                  total_variance_sum if self.kernel in VARIANCE_KERNELS else None)
+    
+    def close(self):
+        """Arrête proprement les processus du pool."""
+        if self.pool is not None:
+            self.pool.close()
+            self.pool.join()
+            self.pool = None
+    
+    def terminate(self):
+        """Arrête immédiatement les processus, sans attendre les tâches en file."""
+        if self.pool is not None:
+            self.pool.terminate()
+            self.pool.join()
+            self.pool = None
+    
+    def __enter__(self):
+        return self.start()
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        # Sur erreur ou Ctrl+C, inutile de laisser finir les blocs restants
+        if exc_type is not None:
+            self.terminate()
+        else:
+            self.close()
+
+
+def monte_carlo_pi_multiprocessing(total_iterations, num_processes, seed=None,
+                                   schedule='static', num_chunks=None, kernel='python',
+                                   stats=None):
     """
     Calcule Pi en utilisant la méthode Monte Carlo (version multiprocessing).
     
+    Crée un pool éphémère : pour des estimations répétées, préférer
+    MonteCarloPool qui réutilise les mêmes processus.
+    
     Args:
         total_iterations: Nombre total de points à générer
         num_processes: Nombre de processus à utiliser
+        seed: Graine globale, un flux indépendant est dérivé par processus
+        schedule: 'static' (une tâche par processus) ou 'dynamic'
+        num_chunks: Nombre de blocs en mode dynamique
+        kernel: Noyau de calcul (voir KERNELS)
+        stats: Dict optionnel, rempli avec la variance obtenue
+            (voir monte_carlo_core.variance_stats)
         
     Returns:
         Estimation de Pi
     """
-    # Diviser les itérations entre les processus
-    iterations_per_process = total_iterations // num_processes
-    remaining_iterations = total_iterations % num_processes
+    with MonteCarloPool(num_processes, kernel) as pool:
+        pi_estimate = pool.estimate(total_iterations, seed, schedule, num_chunks)
+        if stats is not None:
+            stats.update(pool.last_stats)
+        return pi_estimate
+
+
+def monte_carlo_pi_checkpointed(total_iterations, num_processes, checkpoint_path, seed=None,
+                                num_chunks=None, kernel='python', resume=False,
+                                interval=DEFAULT_CHECKPOINT_INTERVAL):
+    """
+    Calcule Pi avec points de reprise sur disque (version multiprocessing).
     
-    # Créer la liste des tâches
-    tasks = [iterations_per_process] * num_processes
-    if remaining_iterations > 0:
-        tasks[-1] += remaining_iterations
+    Args:
+        total_iterations: Nombre total de points à générer
+        num_processes: Nombre de processus à utiliser
+        checkpoint_path: Chemin du fichier de reprise
+        seed: Graine globale (défaut: aléatoire, ou celle du fichier en reprise)
+        num_chunks: Nombre de blocs du run
+        kernel: Noyau de calcul (voir KERNELS)
+        resume: Reprendre le run enregistré dans checkpoint_path
+        interval: Intervalle minimal entre deux écritures (secondes)
+        
+    Returns:
+        Estimation de Pi
+    """
+    with MonteCarloPool(num_processes, kernel) as pool:
+        return pool.estimate_checkpointed(total_iterations, checkpoint_path, seed, num_chunks,
+                                          resume, interval)
+
+
+def monte_carlo_pi_shared_memory(total_iterations, num_processes, seed=None, kernel='python',
+                                 num_chunks=None, progress=None):
+    """
+    Calcule Pi avec des compteurs en mémoire partagée (progression en direct).
     
-    # Créer un pool de processus et exécuter en parallèle
-    with mp.Pool(processes=num_processes) as pool:
-        results = pool.map(worker_process, tasks)
+    Args:
+        total_iterations: Nombre total de points à générer
+        num_processes: Nombre de processus à utiliser
+        seed: Graine globale, un flux indépendant est dérivé par bloc
+        kernel: Noyau de calcul (voir KERNELS)
+        num_chunks: Nombre de blocs distribués dynamiquement
+        progress: Fonction optionnelle appelée avec (inside, total)
+        
+    Returns:
+        Estimation de Pi
+    """
+    with MonteCarloPool(num_processes, kernel) as pool:
+        return pool.estimate_shared(total_iterations, seed, num_chunks, progress)
+
+
+def print_progress(inside, total, total_iterations):
+    """Affiche sur une ligne la progression et l'estimation partielle."""
+    if total == 0:
+        return
+    sys.stdout.write(f"\r  Progression : {total / total_iterations:6.1%}  "
+                     f"Pi ≈ {4 * inside / total:.8f}  ({total:,} points)")
+    sys.stdout.flush()
+
+
+def monte_carlo_pi_multiprocessing_adaptive(target_error, num_processes, confidence=0.95,
+                                            batch_size=DEFAULT_BATCH_SIZE, max_iterations=None,
+                                            seed=None, schedule='static', num_chunks=None,
+                                            kernel='python'):
+    """
+    Calcule Pi jusqu'à atteindre une erreur cible (version multiprocessing).
     
-    # Sommer les résultats de tous les processus
-    total_inside = sum(results)
+    Args:
+        target_error: Erreur absolue visée (demi-largeur de l'IC)
+        num_processes: Nombre de processus à utiliser
+        confidence: Niveau de confiance de l'intervalle
+        batch_size: Nombre de points par lot
+        max_iterations: Plafond d'itérations (défaut: aucun)
+        seed: Graine globale (défaut: aléatoire)
+        schedule: 'static' ou 'dynamic'
+        num_chunks: Nombre de blocs par lot en mode dynamique
+        kernel: Noyau de calcul (voir KERNELS)
+        
+    Returns:
+        Dict avec l'estimation et les itérations réellement consommées
+    """
+    with MonteCarloPool(num_processes, kernel) as pool:
+        batches = pool.iter_batch_counts(batch_size, seed, schedule, num_chunks)
+        return run_until_precision(batches, target_error, confidence, max_iterations)
+
+
+def monte_carlo_pi_multiprocessing_time_budget(time_budget, num_processes, seed=None,
+                                               kernel='python'):
+    """
+    Calcule la meilleure estimation de Pi possible dans un budget de temps.
     
-    # Calculer l'estimation de Pi
-    pi_estimate = 4 * total_inside / total_iterations
-    return pi_estimate
+    Args:
+        time_budget: Durée maximale du calcul (secondes, hors démarrage du pool)
+        num_processes: Nombre de processus à utiliser
+        seed: Graine globale (défaut: aléatoire)
+        kernel: Noyau de calcul (voir KERNELS)
+        
+    Returns:
+        Dict avec l'estimation, les points obtenus et le débit atteint
+    """
+    with MonteCarloPool(num_processes, kernel) as pool:
+        result = pool.estimate_time_budget(time_budget, seed)
+    result['pool_startup_time'] = pool.startup_time
+    result['pool_warmup_time'] = pool.warmup_time
+    return result
 
 
 def main():
@@ -80,8 +784,33 @@ def main():
                         help='Nombre d\'itérations (défaut: 10,000,000)')
     parser.add_argument('--processes', type=int, default=None,
                         help='Nombre de processus (défaut: nombre de CPU)')
+    parser.add_argument('--seed', type=int, default=None,
+                        help='Graine pour un run reproductible (défaut: aléatoire)')
+    parser.add_argument('--repeat', type=positive_int, default=1,
+                        help='Nombre d\'estimations sur le même pool (défaut: 1)')
+    parser.add_argument('--schedule', choices=SCHEDULES, default='static',
+                        help='Ordonnancement des tâches (défaut: static)')
+    parser.add_argument('--chunks', type=int, default=None,
+                        help=f'Nombre de blocs en mode dynamique '
+                             f'(défaut: {DEFAULT_CHUNKS_PER_PROCESS} × processus)')
+    parser.add_argument('--kernel', choices=KERNELS, default='python',
+                        help='Noyau de calcul (défaut: python)')
+    parser.add_argument('--shared-memory', action='store_true',
+                        help='Compteurs en mémoire partagée avec progression en direct')
+    parser.add_argument('--checkpoint', metavar='PATH', default=None,
+                        help='Fichier de reprise, mis à jour pendant le calcul')
+    parser.add_argument('--resume', action='store_true',
+                        help='Reprend le run enregistré dans --checkpoint')
+    parser.add_argument('--checkpoint-interval', type=float, default=DEFAULT_CHECKPOINT_INTERVAL,
+                        help=f'Secondes minimum entre deux écritures du fichier de reprise '
+                             f'(défaut: {DEFAULT_CHECKPOINT_INTERVAL})')
+    add_precision_arguments(parser)
+    add_time_budget_arguments(parser)
     args = parser.parse_args()
     
+    if args.resume and args.checkpoint is None:
+        parser.error('--resume nécessite --checkpoint PATH')
+    
     iterations = args.iterations
     
     # Déterminer le nombre de processus
@@ -90,6 +819,13 @@ def main():
     else:
         num_processes = args.processes
     
+    if args.target_error is not None:
+        return main_adaptive(args, num_processes)
+    if args.time_budget is not None:
+        return main_time_budget(args, num_processes)
+    if args.checkpoint is not None:
+        return main_checkpoint(args, num_processes)
+    
     print("=" * 60)
     print("SIMULATION MONTE CARLO - MULTIPROCESSING")
     print("=" * 60)
@@ -97,18 +833,29 @@ def main():
     print(f"Nombre de processus  : {num_processes}")
     print(f"Nombre de CPU        : {os.cpu_count()}")
     print(f"Itérations/processus : {iterations // num_processes:,}")
+    print(f"Ordonnancement       : {'shared-memory' if args.shared_memory else args.schedule}")
+    print(f"Noyau                : {args.kernel}")
     print("\n🚀 AVANTAGE : Contourne le GIL de Python !")
     print("   → Vrai parallélisme sur CPU multi-cœur")
     print("   → Speedup réel proche du nombre de cœurs")
     print("\nDémarrage du calcul...")
     print()
     
-    # Mesurer le temps d'exécution
-    start_time = time.time()
-    pi_estimate = monte_carlo_pi_multiprocessing(iterations, num_processes)
-    end_time = time.time()
+    # Démarrer le pool une seule fois, puis mesurer le calcul seul
+    with MonteCarloPool(num_processes, args.kernel) as pool:
+        compute_times = []
+        for _ in range(args.repeat):
+            if args.shared_memory:
+                pi_estimate = pool.estimate_shared(
+                    iterations, args.seed, args.chunks,
+                    progress=lambda inside, total: print_progress(inside, total, iterations)
+                )
+                print()
+            else:
+                pi_estimate = pool.estimate(iterations, args.seed, args.schedule, args.chunks)
+            compute_times.append(pool.last_compute_time)
     
-    execution_time = end_time - start_time
+    execution_time = sum(compute_times) / len(compute_times)
     
     # Afficher les résultats
     print("=" * 60)
@@ -117,8 +864,11 @@ def main():
     print(f"Estimation de Pi     : {pi_estimate:.8f}")
     print(f"Valeur réelle de Pi  : {3.14159265:.8f}")
     print(f"Erreur               : {abs(pi_estimate - 3.14159265):.8f}")
-    print(f"Temps d'exécution    : {execution_time:.4f} secondes")
+    print(f"Démarrage du pool    : {pool.startup_time:.4f} s (+ warm-up {pool.warmup_time:.4f} s)")
+    print(f"Temps d'exécution    : {execution_time:.4f} secondes (moyenne sur {args.repeat} run(s))")
     print(f"Itérations/seconde   : {iterations / execution_time:,.0f}")
+    if args.kernel in VARIANCE_KERNELS:
+        print_variance_report(pool.last_stats)
     print("=" * 60)
     
     return {
@@ -126,10 +876,118 @@ def main():
         'execution_time': execution_time,
         'iterations': iterations,
         'num_processes': num_processes,
+        'seed': args.seed,
+        'schedule': 'shared-memory' if args.shared_memory else args.schedule,
+        'kernel': args.kernel,
+        'variance': pool.last_stats['variance'],
+        'pool_startup_time': pool.startup_time,
+        'pool_warmup_time': pool.warmup_time,
         'iterations_per_second': iterations / execution_time
     }
 
 
+def main_adaptive(args, num_processes):
+    """Exécute la simulation multiprocessing en mode précision adaptative."""
+    print("=" * 60)
+    print("SIMULATION MONTE CARLO - MULTIPROCESSING (PRÉCISION ADAPTATIVE)")
+    print("=" * 60)
+    print(f"Erreur cible         : ±{args.target_error} (confiance {args.confidence:.0%})")
+    print(f"Points par lot       : {args.batch_size:,}")
+    print(f"Nombre de processus  : {num_processes}")
+    print(f"Ordonnancement       : {args.schedule}")
+    print(f"Noyau                : {args.kernel}")
+    print("Démarrage du calcul...")
+    print()
+    
+    start_time = time.perf_counter()
+    result = monte_carlo_pi_multiprocessing_adaptive(
+        args.target_error, num_processes, args.confidence, args.batch_size,
+        args.max_iterations, args.seed, args.schedule, args.chunks, args.kernel
+    )
+    execution_time = time.perf_counter() - start_time
+    
+    print_precision_report(result, execution_time)
+    
+    result['execution_time'] = execution_time
+    result['num_processes'] = num_processes
+    result['kernel'] = args.kernel
+    result['seed'] = args.seed
+    return result
+
+
+def main_time_budget(args, num_processes):
+    """Exécute la simulation multiprocessing en mode budget de temps."""
+    print("=" * 60)
+    print("SIMULATION MONTE CARLO - MULTIPROCESSING (BUDGET DE TEMPS)")
+    print("=" * 60)
+    print(f"Budget de temps      : {args.time_budget} secondes")
+    print(f"Nombre de processus  : {num_processes}")
+    print(f"Noyau                : {args.kernel}")
+    print("Démarrage du calcul...")
+    print()
+    
+    result = monte_carlo_pi_multiprocessing_time_budget(args.time_budget, num_processes,
+                                                        args.seed, args.kernel)
+    print_time_budget_report(result)
+    print(f"Démarrage du pool    : {result['pool_startup_time']:.4f} s "
+          f"(+ warm-up {result['pool_warmup_time']:.4f} s, hors budget)")
+    
+    result['num_processes'] = num_processes
+    result['kernel'] = args.kernel
+    result['seed'] = args.seed
+    return result
+
+
+def main_checkpoint(args, num_processes):
+    """Exécute la simulation multiprocessing avec points de reprise."""
+    print("=" * 60)
+    print("SIMULATION MONTE CARLO - MULTIPROCESSING (POINTS DE REPRISE)")
+    print("=" * 60)
+    print(f"Nombre d'itérations  : {args.iterations:,}")
+    print(f"Nombre de processus  : {num_processes}")
+    print(f"Noyau                : {args.kernel}")
+    print(f"Fichier de reprise   : {args.checkpoint} ({'reprise' if args.resume else 'nouveau run'})")
+    print("Démarrage du calcul...")
+    print()
+    
+    with MonteCarloPool(num_processes, args.kernel) as pool:
+        pi_estimate = pool.estimate_checkpointed(
+            args.iterations, args.checkpoint, args.seed, args.chunks, args.resume,
+            args.checkpoint_interval
+        )
+    ckpt = pool.last_checkpoint
+    execution_time = pool.last_compute_time
+    computed = args.iterations - pool.last_resumed_iterations
+    
+    print("=" * 60)
+    print("RÉSULTATS")
+    print("=" * 60)
+    print(f"Estimation de Pi     : {pi_estimate:.8f}")
+    print(f"Valeur réelle de Pi  : {3.14159265:.8f}")
+    print(f"Erreur               : {abs(pi_estimate - 3.14159265):.8f}")
+    print(f"Blocs repris         : {pool.last_resumed_chunks} / {ckpt.num_chunks}")
+    print(f"Temps d'exécution    : {execution_time:.4f} secondes")
+    if execution_time > 0:
+        print(f"Itérations/seconde   : {computed / execution_time:,.0f} "
+              f"({computed:,} calculées dans ce run)")
+    if args.kernel in VARIANCE_KERNELS:
+        print_variance_report(pool.last_stats)
+    print("=" * 60)
+    
+    return {
+        'pi_estimate': pi_estimate,
+        'execution_time': execution_time,
+        'iterations': args.iterations,
+        'num_processes': num_processes,
+        'num_chunks': ckpt.num_chunks,
+        'resumed_chunks': pool.last_resumed_chunks,
+        'seed': args.seed,
+        'entropy': ckpt.entropy,
+        'kernel': args.kernel,
+        'variance': pool.last_stats['variance']
+    }
+
+
 if __name__ == "__main__":
     # Nécessaire pour Windows
     mp.freeze_support()
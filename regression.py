@@ -0,0 +1,221 @@
+"""
+Garde-fou contre les régressions de performance.
+
+Compare un fichier de résultats de référence à un nouveau, configuration
+par configuration. Pour chaque configuration présente dans les deux :
+- Le débit de chaque run (itérations / temps) est calculé à partir des
+  listes 'times' : les deux fichiers peuvent utiliser des tailles
+  différentes
+- Un test de Mann-Whitney unilatéral (non paramétrique) indique si le
+  nouveau débit est significativement plus faible
+- Une régression est signalée si le débit médian baisse de plus du seuil
+  ET que la baisse est significative : une configuration bruitée ne fait
+  pas échouer le contrôle, une vraie baisse de quelques % si
+- Avec trop peu de runs, le test ne peut jamais être significatif (3 runs
+  de chaque côté : p ≥ 1/C(6,3) = 0.05) : ces configurations sont
+  signalées « non testables » ; il faut au moins
+  mann_whitney_min_runs(significance) runs par côté (4 pour p < 0.05)
+
+Formats acceptés : results/benchmark_results.json (compare_performance),
+results/backends_results.json (--backends) et results/sweep_results.json
+(--sweep).
+"""
+
+import sys
+import json
+import statistics
+import argparse
+from benchmark import mann_whitney_min_p, mann_whitney_min_runs, mann_whitney_u
+
+
+# Baisse de débit tolérée (5 %) et seuil de significativité du test
+DEFAULT_REGRESSION_THRESHOLD = 0.05
+DEFAULT_SIGNIFICANCE = 0.05
+
+# Code de sortie quand au moins une régression est détectée
+REGRESSION_EXIT_CODE = 1
+
+
+def _config_label(backend, kernel, workers):
+    """Nom lisible d'une configuration."""
+    return f"{backend} [{kernel}]" + (f" x{workers}" if workers and workers > 1 else "")
+
+
+def extract_configurations(results):
+    """
+    Extrait les séries de runs de chaque configuration d'un fichier de résultats.
+
+    Args:
+        results: Dict chargé depuis un fichier de résultats
+
+    Returns:
+        Dict {nom de configuration: {'iterations', 'times'}}
+    """
+    configurations = {}
+
+    if results.get('schema') == 'monte_carlo_pi.sweep':
+        for row in results['runs']:
+            label = _config_label(row['backend'], row['kernel'], row['workers'])
+            label += f" N={row['iterations']:,}"
+            entry = configurations.setdefault(label, {'iterations': row['iterations'],
+                                                      'times': []})
+            entry['times'].append(row['wall_time'])
+        return configurations
+
+    if 'runs' in results:
+        for run in results['runs']:
+            label = _config_label(run['backend'], run['kernel'], run['workers'])
+            configurations[label] = {'iterations': run['iterations'], 'times': run['times']}
+        return configurations
+
+    # compare_performance : un bloc par noyau (anciens fichiers : noyau python seul)
+    by_kernel = results.get('by_kernel') or {
+        results['mono_thread'].get('kernel', 'python'): {
+            'mono_thread': results['mono_thread'],
+            'multi_thread': results['multi_thread']
+        }
+    }
+    for kernel, kernel_results in by_kernel.items():
+        mono = kernel_results['mono_thread']
+        configurations[_config_label('mono', kernel, None)] = {
+            'iterations': mono['iterations'], 'times': mono['times']}
+        for multi in kernel_results['multi_thread']:
+            configurations[_config_label('thread', kernel, multi['num_threads'])] = {
+                'iterations': multi['iterations'], 'times': multi['times']}
+        for multi in kernel_results.get('multiprocessing', []):
+            configurations[_config_label('process', kernel, multi['num_processes'])] = {
+                'iterations': multi['iterations'], 'times': multi['times']}
+    return configurations
+
+
+def compare_results(baseline, new, threshold=DEFAULT_REGRESSION_THRESHOLD,
+                    significance=DEFAULT_SIGNIFICANCE):
+    """
+    Compare deux fichiers de résultats configuration par configuration.
+
+    Args:
+        baseline: Dict des résultats de référence
+        new: Dict des nouveaux résultats
+        threshold: Baisse relative de débit tolérée (0.05 = 5 %)
+        significance: Seuil de la p-valeur du test de Mann-Whitney
+
+    Returns:
+        Liste de dicts, un par configuration commune : 'config',
+        'baseline_throughput', 'new_throughput', 'delta', 'p_value',
+        'min_p_value', 'testable' (le test peut descendre sous le seuil),
+        'regression'
+    """
+    baseline_configs = extract_configurations(baseline)
+    new_configs = extract_configurations(new)
+
+    comparisons = []
+    for label, base in baseline_configs.items():
+        if label not in new_configs:
+            continue
+        current = new_configs[label]
+        base_throughput = [base['iterations'] / t for t in base['times']]
+        new_throughput = [current['iterations'] / t for t in current['times']]
+
+        base_median = statistics.median(base_throughput)
+        new_median = statistics.median(new_throughput)
+        delta = new_median / base_median - 1
+        _, p_value = mann_whitney_u(new_throughput, base_throughput)
+        min_p_value = mann_whitney_min_p(len(new_throughput), len(base_throughput))
+
+        comparisons.append({
+            'config': label,
+            'baseline_throughput': base_median,
+            'new_throughput': new_median,
+            'delta': delta,
+            'p_value': p_value,
+            'min_p_value': min_p_value,
+            'testable': min_p_value < significance,
+            'regression': delta < -threshold and p_value < significance
+        })
+    return comparisons
+
+
+def print_comparison(comparisons, threshold, significance):
+    """
+    Affiche le tableau des écarts de débit.
+
+    Args:
+        comparisons: Liste retournée par compare_results
+        threshold: Baisse relative de débit tolérée
+        significance: Seuil de la p-valeur
+    """
+    print("=" * 78)
+    print("CONTRÔLE DE RÉGRESSION")
+    print("=" * 78)
+    print(f"Seuil               : baisse de débit > {threshold:.1%} avec p < {significance}")
+    print("-" * 78)
+    print(f"{'Configuration':<26} {'Référence':>13} {'Nouveau':>13} {'Écart':>9} "
+          f"{'p':>8}  Statut")
+    print("-" * 78)
+    for c in comparisons:
+        if c['regression']:
+            status = "❌ RÉGRESSION"
+        elif not c['testable']:
+            status = "⚠️  non testable"
+        else:
+            status = "✅"
+        print(f"{c['config']:<26} {c['baseline_throughput']:>13,.0f} "
+              f"{c['new_throughput']:>13,.0f} {c['delta']:>+9.1%} {c['p_value']:>8.4f}  {status}")
+    print("=" * 78)
+    print("Débits médians en points/s ; p : test de Mann-Whitney unilatéral (nouveau plus lent)")
+    untestable = [c for c in comparisons if not c['testable']]
+    if untestable:
+        print(f"⚠️  {len(untestable)} configuration(s) non testable(s) : trop peu de runs, la "
+              f"p-valeur ne peut pas descendre sous {significance} ; au moins "
+              f"{mann_whitney_min_runs(significance)} runs par côté sont nécessaires")
+
+
+def load_results(path):
+    """Charge un fichier de résultats JSON."""
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def main(argv=None):
+    """
+    Compare deux fichiers de résultats et échoue en cas de régression.
+
+    Returns:
+        Code de sortie : 0 sans régression, 1 si au moins une
+        configuration régresse, 2 si aucune configuration n'est commune
+        ou qu'aucune n'a assez de runs pour être testée
+    """
+    parser = argparse.ArgumentParser(description='Contrôle de régression de performance')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    compare = subparsers.add_parser('compare', help='Compare une référence à de nouveaux résultats')
+    compare.add_argument('baseline', help='Fichier de résultats de référence')
+    compare.add_argument('new', nargs='?', default='results/benchmark_results.json',
+                         help='Nouveaux résultats (défaut: results/benchmark_results.json)')
+    compare.add_argument('--threshold', type=float, default=DEFAULT_REGRESSION_THRESHOLD,
+                         help=f'Baisse de débit tolérée (défaut: {DEFAULT_REGRESSION_THRESHOLD})')
+    compare.add_argument('--significance', type=float, default=DEFAULT_SIGNIFICANCE,
+                         help=f'Seuil de la p-valeur (défaut: {DEFAULT_SIGNIFICANCE})')
+    args = parser.parse_args(argv)
+
+    comparisons = compare_results(load_results(args.baseline), load_results(args.new),
+                                  args.threshold, args.significance)
+    if not comparisons:
+        print("⚠️  Aucune configuration commune entre les deux fichiers")
+        return 2
+
+    print_comparison(comparisons, args.threshold, args.significance)
+    if not any(c['testable'] for c in comparisons):
+        print(f"\n⚠️  Contrôle impossible : aucune configuration n'a assez de runs "
+              f"(au moins {mann_whitney_min_runs(args.significance)} par côté)")
+        return 2
+    regressions = [c for c in comparisons if c['regression']]
+    if regressions:
+        print(f"\n❌ {len(regressions)} configuration(s) en régression")
+        return REGRESSION_EXIT_CODE
+    print("\n✅ Aucune régression détectée")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
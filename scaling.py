@@ -0,0 +1,144 @@
+"""
+Modèles de passage à l'échelle : lois d'Amdahl et de Gustafson.
+
+Deux façons de mesurer le passage à l'échelle :
+- Forte (strong scaling) : le travail total est fixe, on ajoute des
+  workers. Le speedup S(p) = T(1) / T(p) suit la loi d'Amdahl,
+  S(p) = 1 / (s + (1 - s) / p), plafonnée à 1 / s par la fraction
+  séquentielle s.
+- Faible (weak scaling) : le travail par worker est fixe, le travail total
+  croît avec p. Le speedup à l'échelle S(p) = p · T(1) / T(p) suit la loi
+  de Gustafson, S(p) = p - α (p - 1), où α est la fraction séquentielle
+  du run parallèle.
+
+Les ajustements se font par moindres carrés sur la forme linéarisée de
+chaque loi ; le coefficient de détermination R² indique si le modèle
+décrit bien les mesures.
+"""
+
+import math
+
+
+# Efficacité minimale (speedup / workers) pour qu'un cœur soit jugé utile
+DEFAULT_TARGET_EFFICIENCY = 0.5
+
+
+def amdahl_speedup(serial_fraction, workers):
+    """
+    Speedup prédit par la loi d'Amdahl.
+
+    Args:
+        serial_fraction: Fraction séquentielle s (0 à 1)
+        workers: Nombre de workers p
+
+    Returns:
+        1 / (s + (1 - s) / p)
+    """
+    return 1 / (serial_fraction + (1 - serial_fraction) / workers)
+
+
+def gustafson_speedup(serial_fraction, workers):
+    """
+    Speedup à l'échelle prédit par la loi de Gustafson.
+
+    Args:
+        serial_fraction: Fraction séquentielle α (0 à 1)
+        workers: Nombre de workers p
+
+    Returns:
+        p - α (p - 1)
+    """
+    return workers - serial_fraction * (workers - 1)
+
+
+def _fit_through_origin(xs, ys):
+    """Pente de la droite y = a·x passant par l'origine (moindres carrés)."""
+    denominator = sum(x * x for x in xs)
+    if denominator == 0:
+        return None
+    return sum(x * y for x, y in zip(xs, ys)) / denominator
+
+
+def _r_squared(observed, predicted):
+    """Coefficient de détermination R² (None si les mesures sont constantes)."""
+    mean = sum(observed) / len(observed)
+    total = sum((y - mean) ** 2 for y in observed)
+    if total == 0:
+        return None
+    residual = sum((y - f) ** 2 for y, f in zip(observed, predicted))
+    return 1 - residual / total
+
+
+def fit_amdahl(workers, speedups):
+    """
+    Ajuste la fraction séquentielle d'Amdahl sur des mesures de scaling fort.
+
+    Forme linéaire : 1/S - 1/p = s · (1 - 1/p).
+
+    Args:
+        workers: Nombres de workers mesurés
+        speedups: Speedups T(1) / T(p) correspondants
+
+    Returns:
+        Dict {'serial_fraction', 'max_speedup', 'r_squared'} ('max_speedup'
+        vaut None si rien n'est séquentiel), ou None s'il n'y a aucune
+        mesure à plus d'un worker
+    """
+    points = [(p, s) for p, s in zip(workers, speedups) if p > 1]
+    slope = _fit_through_origin([1 - 1 / p for p, _ in points],
+                                [1 / s - 1 / p for p, s in points])
+    if slope is None:
+        return None
+    serial_fraction = min(1.0, max(0.0, slope))
+    predicted = [amdahl_speedup(serial_fraction, p) for p in workers]
+    return {
+        'serial_fraction': serial_fraction,
+        'max_speedup': 1 / serial_fraction if serial_fraction > 0 else None,
+        'r_squared': _r_squared(list(speedups), predicted)
+    }
+
+
+def fit_gustafson(workers, scaled_speedups):
+    """
+    Ajuste la fraction séquentielle de Gustafson sur des mesures de scaling faible.
+
+    Forme linéaire : p - S = α · (p - 1).
+
+    Args:
+        workers: Nombres de workers mesurés
+        scaled_speedups: Speedups à l'échelle p · T(1) / T(p)
+
+    Returns:
+        Dict {'serial_fraction', 'r_squared'}, ou None s'il n'y a aucune
+        mesure à plus d'un worker
+    """
+    points = [(p, s) for p, s in zip(workers, scaled_speedups) if p > 1]
+    slope = _fit_through_origin([p - 1 for p, _ in points], [p - s for p, s in points])
+    if slope is None:
+        return None
+    serial_fraction = min(1.0, max(0.0, slope))
+    predicted = [gustafson_speedup(serial_fraction, p) for p in workers]
+    return {
+        'serial_fraction': serial_fraction,
+        'r_squared': _r_squared(list(scaled_speedups), predicted)
+    }
+
+
+def useful_workers(serial_fraction, target_efficiency=DEFAULT_TARGET_EFFICIENCY):
+    """
+    Nombre maximal de workers gardant une efficacité suffisante (Amdahl).
+
+    L'efficacité 1 / (s·p + 1 - s) décroît avec p ; on cherche le plus
+    grand p où elle reste au-dessus de la cible.
+
+    Args:
+        serial_fraction: Fraction séquentielle s d'Amdahl
+        target_efficiency: Efficacité minimale (0 à 1)
+
+    Returns:
+        Nombre de workers (au moins 1), ou None si s = 0 (pas de limite)
+    """
+    if serial_fraction <= 0:
+        return None
+    limit = (1 / target_efficiency - 1 + serial_fraction) / serial_fraction
+    return max(1, math.floor(limit))
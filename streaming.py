@@ -0,0 +1,171 @@
+"""
+Simulation Monte Carlo pour calculer Pi - ESTIMATIONS EN FLUX
+
+Au lieu d'un seul flottant rendu à la toute fin du calcul, ce module
+expose un générateur qui produit une estimation courante après chaque lot :
+- Fonctionne avec les trois moteurs (mono, thread, process)
+- Chaque estimation contient (inside, total, estimate, stderr)
+- Mémoire constante quelle que soit la durée du flux : seuls deux
+  compteurs entiers sont conservés entre les lots
+- Idéal pour les tableaux de bord et les courbes de convergence, sans
+  relancer le calcul à plusieurs tailles
+"""
+
+import os
+import time
+import argparse
+from collections import namedtuple
+from mono_thread import iter_batch_counts_mono
+from multi_thread import iter_batch_counts_multi
+from multiprocessing_version import MonteCarloPool
+from monte_carlo_core import (
+    DEFAULT_BATCH_SIZE, DEFAULT_CHUNK_SIZE, KERNELS, positive_int, variance_stats
+)
+
+
+# Moteurs de calcul disponibles en flux
+STREAM_BACKENDS = ('mono', 'thread', 'process')
+
+# Estimation courante produite après chaque lot
+Estimate = namedtuple('Estimate', ['inside', 'total', 'estimate', 'stderr'])
+
+
+def iter_batch_counts(backend='mono', batch_size=DEFAULT_BATCH_SIZE, workers=None,
+                      kernel='python', chunk_size=DEFAULT_CHUNK_SIZE, seed=None,
+                      total_iterations=None):
+    """
+    Génère les lots (inside, points du lot) du moteur demandé.
+
+    Args:
+        backend: Moteur de calcul ('mono', 'thread' ou 'process')
+        batch_size: Nombre de points par lot
+        workers: Nombre de threads ou de processus (ignoré en mono ;
+            défaut: nombre de CPU)
+        kernel: Noyau de calcul (voir KERNELS)
+        chunk_size: Taille des blocs pour les noyaux vectorisés
+        seed: Graine pour un run reproductible (défaut: aléatoire)
+        total_iterations: Nombre total de points (défaut: flux infini)
+
+    Yields:
+        Tuples (points dans le cercle, points du lot, contribution du lot à
+        la variance ; None hors VARIANCE_KERNELS)
+    """
+    if backend == 'mono':
+        yield from iter_batch_counts_mono(batch_size, kernel, chunk_size, seed, total_iterations)
+    elif backend == 'thread':
+        batches = iter_batch_counts_multi(batch_size, workers or os.cpu_count() or 4, kernel,
+                                          chunk_size, seed, total_iterations)
+        try:
+            yield from batches
+        finally:
+            batches.close()
+    elif backend == 'process':
+        # Le pool vit aussi longtemps que le flux et est fermé avec lui
+        with MonteCarloPool(workers, kernel, chunk_size) as pool:
+            yield from pool.iter_batch_counts(batch_size, seed, total_iterations=total_iterations)
+    else:
+        raise ValueError(f"Moteur inconnu : {backend!r} (attendu : {', '.join(STREAM_BACKENDS)})")
+
+
+def iter_estimates(iterations=None, batch_size=DEFAULT_BATCH_SIZE, backend='mono', workers=None,
+                   kernel='python', chunk_size=DEFAULT_CHUNK_SIZE, seed=None):
+    """
+    Génère une estimation courante de Pi après chaque lot.
+
+    Le flux peut être interrompu à tout moment (break, close()) : les
+    threads ou processus du moteur sont alors libérés.
+
+    Args:
+        iterations: Nombre total de points (défaut: flux infini)
+        batch_size: Nombre de points par lot
+        backend: Moteur de calcul ('mono', 'thread' ou 'process')
+        workers: Nombre de threads ou de processus (ignoré en mono ;
+            défaut: nombre de CPU)
+        kernel: Noyau de calcul (voir KERNELS)
+        chunk_size: Taille des blocs pour les noyaux vectorisés
+        seed: Graine pour un run reproductible (défaut: aléatoire)
+
+    Yields:
+        Estimate(inside, total, estimate, stderr) cumulés depuis le début
+    """
+    inside = 0
+    total = 0
+    variance_sum = 0.0
+    batches = iter_batch_counts(backend, batch_size, workers, kernel, chunk_size, seed, iterations)
+    try:
+        for batch_inside, batch_total, batch_variance_sum in batches:
+            inside += batch_inside
+            total += batch_total
+            # Variance du noyau si disponible, binomiale sinon
+            variance_sum = (None if batch_variance_sum is None or variance_sum is None
+                            else variance_sum + batch_variance_sum)
+            stderr = variance_stats(inside, total, variance_sum)['stderr']
+            yield Estimate(inside, total, 4 * inside / total, stderr)
+    finally:
+        batches.close()
+
+
+def main():
+    """Affiche les estimations successives d'un calcul en flux."""
+    parser = argparse.ArgumentParser(description='Simulation Monte Carlo - Estimations en flux')
+    parser.add_argument('--iterations', type=int, default=10_000_000,
+                        help='Nombre total d\'itérations (défaut: 10,000,000)')
+    parser.add_argument('--batch-size', type=positive_int, default=DEFAULT_BATCH_SIZE,
+                        help=f'Nombre de points par lot (défaut: {DEFAULT_BATCH_SIZE:,})')
+    parser.add_argument('--backend', choices=STREAM_BACKENDS, default='mono',
+                        help='Moteur de calcul (défaut: mono)')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Nombre de threads ou de processus (défaut: nombre de CPU)')
+    parser.add_argument('--kernel', choices=KERNELS, default='python',
+                        help='Noyau de calcul (défaut: python)')
+    parser.add_argument('--chunk-size', type=positive_int, default=DEFAULT_CHUNK_SIZE,
+                        help=f'Taille des blocs des noyaux vectorisés (défaut: {DEFAULT_CHUNK_SIZE:,})')
+    parser.add_argument('--seed', type=int, default=None,
+                        help='Graine pour un run reproductible (défaut: aléatoire)')
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("SIMULATION MONTE CARLO - ESTIMATIONS EN FLUX")
+    print("=" * 60)
+    print(f"Nombre d'itérations : {args.iterations:,}")
+    print(f"Points par lot      : {args.batch_size:,}")
+    print(f"Moteur              : {args.backend}")
+    print(f"Noyau               : {args.kernel}")
+    print()
+    print(f"{'Points':>14}  {'Estimation':>12}  {'Erreur std':>12}  {'Temps (s)':>10}")
+
+    start_time = time.perf_counter()
+    last = None
+    for last in iter_estimates(args.iterations, args.batch_size, args.backend, args.workers,
+                               args.kernel, args.chunk_size, args.seed):
+        elapsed = time.perf_counter() - start_time
+        print(f"{last.total:>14,}  {last.estimate:>12.8f}  {last.stderr:>12.8f}  {elapsed:>10.4f}")
+    execution_time = time.perf_counter() - start_time
+
+    if last is None:
+        print("Aucun lot calculé (--iterations ≤ 0).")
+        return None
+
+    print("=" * 60)
+    print("RÉSULTATS")
+    print("=" * 60)
+    print(f"Estimation de Pi     : {last.estimate:.8f}")
+    print(f"Erreur               : {abs(last.estimate - 3.14159265):.8f}")
+    print(f"Temps d'exécution    : {execution_time:.4f} secondes")
+    print(f"Itérations/seconde   : {last.total / execution_time:,.0f}")
+    print("=" * 60)
+
+    return {
+        'pi_estimate': last.estimate,
+        'inside': last.inside,
+        'iterations': last.total,
+        'stderr': last.stderr,
+        'execution_time': execution_time,
+        'backend': args.backend,
+        'kernel': args.kernel,
+        'seed': args.seed
+    }
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,263 @@
+"""
+Simulation Monte Carlo pour calculer Pi - VERSION SOUS-INTERPRÉTEURS (EXPÉRIMENTALE)
+
+Depuis Python 3.12, chaque sous-interpréteur isolé possède son propre GIL :
+- Un sous-interpréteur par worker, tous dans le même processus
+- Vrai parallélisme de la boucle Python pure, comme le multiprocessing,
+  mais sans fork, sans pickle et avec une empreinte mémoire plus faible
+- Les résultats remontent par un simple pipe (une ligne par worker)
+- Mêmes flux aléatoires que le moteur multi-thread : même graine, même
+  résultat
+
+Repli propre ailleurs :
+- Python < 3.12 (GIL partagé entre sous-interpréteurs) ou module absent :
+  moteur multiprocessing
+- Noyaux vectorisés : NumPy ne se charge pas dans un sous-interpréteur ; ces
+  noyaux libérant le GIL, le moteur multi-thread est utilisé
+"""
+
+import os
+import sys
+import time
+import argparse
+import threading
+import multiprocessing as mp
+from monte_carlo_core import KERNELS, python_seed, spawn_seed_sequences, split_iterations
+from multi_thread import monte_carlo_pi_multi
+from multiprocessing_version import monte_carlo_pi_multiprocessing
+
+
+# Modules bas niveau des sous-interpréteurs, du plus récent au plus ancien
+INTERPRETER_MODULES = ('_interpreters', '_xxsubinterpreters')
+
+# Boucle exécutée dans chaque sous-interpréteur. Identique à
+# count_inside_python, mais sans importer monte_carlo_core (qui dépend de
+# NumPy, non chargeable dans un sous-interpréteur).
+WORKER_SCRIPT = """
+import os
+import random
+
+inside_circle = 0
+rand = random.Random({seed}).random
+
+for _ in range({iterations}):
+    x = rand()
+    y = rand()
+
+    if x * x + y * y <= 1:
+        inside_circle += 1
+
+os.write({fd}, b'%d %d\\n' % ({index}, inside_circle))
+"""
+
+
+def load_interpreters_api():
+    """
+    Retourne le module bas niveau des sous-interpréteurs, s'il est utilisable.
+
+    Returns:
+        Module (_interpreters ou _xxsubinterpreters), ou None si les
+        sous-interpréteurs n'ont pas leur propre GIL sur cette version
+    """
+    if sys.version_info < (3, 12):
+        return None
+    for name in INTERPRETER_MODULES:
+        try:
+            return __import__(name)
+        except ImportError:
+            continue
+    return None
+
+
+def subinterpreters_supported():
+    """Indique si ce Python peut exécuter le moteur sous-interpréteurs."""
+    return load_interpreters_api() is not None
+
+
+def engine_for(kernel='python'):
+    """
+    Indique le moteur réellement utilisé pour un noyau.
+
+    Args:
+        kernel: Noyau de calcul
+
+    Returns:
+        'subinterpreters', 'thread' ou 'process'
+    """
+    if kernel != 'python':
+        return 'thread'
+    return 'subinterpreters' if subinterpreters_supported() else 'process'
+
+
+def _run_script(api, interp_id, script, errors):
+    """Exécute le script d'un worker ; conserve l'erreur éventuelle."""
+    try:
+        # _xxsubinterpreters lève une exception, _interpreters la retourne
+        failure = api.run_string(interp_id, script)
+    except Exception as e:
+        failure = e
+    if failure is not None:
+        errors.append(getattr(failure, 'formatted', failure))
+
+
+def run_workers(tasks, seeds):
+    """
+    Exécute un sous-interpréteur par worker et collecte leurs comptes.
+
+    Chaque sous-interpréteur est piloté par un thread du processus
+    principal ; leurs GIL étant distincts, les boucles s'exécutent en
+    parallèle.
+
+    Args:
+        tasks: Nombre de points de chaque worker
+        seeds: Graine entière de random.Random pour chaque worker
+
+    Returns:
+        Liste des points dans le cercle, un compte par worker
+
+    Raises:
+        RuntimeError: Sous-interpréteurs indisponibles ou échec d'un worker
+    """
+    api = load_interpreters_api()
+    if api is None:
+        raise RuntimeError("Sous-interpréteurs à GIL propre indisponibles (Python 3.12+ requis)")
+
+    num_workers = len(tasks)
+    read_fd, write_fd = os.pipe()
+    interp_ids = []
+    errors = []
+    try:
+        interp_ids = [api.create() for _ in range(num_workers)]
+        threads = []
+        for index, (interp_id, iterations, worker_seed) in enumerate(zip(interp_ids, tasks, seeds)):
+            script = WORKER_SCRIPT.format(seed=worker_seed, iterations=iterations,
+                                          fd=write_fd, index=index)
+            t = threading.Thread(target=_run_script, args=(api, interp_id, script, errors))
+            threads.append(t)
+            t.start()
+        for t in threads:
+            t.join()
+    finally:
+        os.close(write_fd)
+        for interp_id in interp_ids:
+            api.destroy(interp_id)
+
+    # Toutes les extrémités d'écriture sont fermées : lire jusqu'à EOF
+    with os.fdopen(read_fd, 'rb') as pipe:
+        lines = pipe.read().split()
+    if errors:
+        raise RuntimeError(f"Échec d'un sous-interpréteur : {errors[0]}")
+
+    results = dict(zip(map(int, lines[0::2]), map(int, lines[1::2])))
+    if len(results) != num_workers:
+        raise RuntimeError(f"{num_workers - len(results)} worker(s) sans résultat")
+    return [results[index] for index in range(num_workers)]
+
+
+def count_inside_subinterpreters(total_iterations, num_workers, seed=None):
+    """
+    Compte les points dans le cercle avec un sous-interpréteur par worker.
+
+    Le découpage et les graines sont ceux du moteur multi-thread avec le
+    noyau 'python' : même graine, même résultat.
+
+    Args:
+        total_iterations: Nombre total de points à générer
+        num_workers: Nombre de sous-interpréteurs
+        seed: Graine globale, un flux indépendant est dérivé par worker
+
+    Returns:
+        Nombre de points dans le cercle
+    """
+    tasks = split_iterations(total_iterations, num_workers)
+    seeds = [python_seed(seq) for seq in spawn_seed_sequences(seed, num_workers)]
+    return sum(run_workers(tasks, seeds))
+
+
+def monte_carlo_pi_subinterpreters(total_iterations, num_workers, seed=None, kernel='python'):
+    """
+    Calcule Pi avec des sous-interpréteurs, ou le meilleur repli disponible.
+
+    Args:
+        total_iterations: Nombre total de points à générer
+        num_workers: Nombre de workers
+        seed: Graine globale (défaut: aléatoire)
+        kernel: Noyau de calcul (seul 'python' s'exécute en sous-interpréteur)
+
+    Returns:
+        Estimation de Pi
+    """
+    engine = engine_for(kernel)
+    if engine == 'thread':
+        return monte_carlo_pi_multi(total_iterations, num_workers, seed, kernel)
+    if engine == 'process':
+        return monte_carlo_pi_multiprocessing(total_iterations, num_workers, seed, kernel=kernel)
+
+    total_inside = count_inside_subinterpreters(total_iterations, num_workers, seed)
+    return 4 * total_inside / total_iterations
+
+
+def main():
+    """Fonction principale pour exécuter la simulation en sous-interpréteurs."""
+    parser = argparse.ArgumentParser(description='Simulation Monte Carlo - Sous-interpréteurs')
+    parser.add_argument('--iterations', type=int, default=10_000_000,
+                        help='Nombre d\'itérations (défaut: 10,000,000)')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Nombre de sous-interpréteurs (défaut: nombre de CPU)')
+    parser.add_argument('--seed', type=int, default=None,
+                        help='Graine pour un run reproductible (défaut: aléatoire)')
+    parser.add_argument('--kernel', choices=KERNELS, default='python',
+                        help='Noyau de calcul (défaut: python)')
+    args = parser.parse_args()
+
+    num_workers = args.workers or os.cpu_count() or 4
+    engine = engine_for(args.kernel)
+    api = load_interpreters_api()
+
+    print("=" * 60)
+    print("SIMULATION MONTE CARLO - SOUS-INTERPRÉTEURS (EXPÉRIMENTAL)")
+    print("=" * 60)
+    print(f"Nombre d'itérations  : {args.iterations:,}")
+    print(f"Nombre de workers    : {num_workers}")
+    print(f"Noyau                : {args.kernel}")
+    if engine == 'subinterpreters':
+        print(f"Moteur               : sous-interpréteurs ({api.__name__}), un GIL par worker")
+    else:
+        reason = ("noyau vectorisé, NumPy indisponible en sous-interpréteur" if engine == 'thread'
+                  else f"Python {sys.version_info.major}.{sys.version_info.minor} sans GIL "
+                       f"par interpréteur")
+        print(f"Moteur               : repli sur {engine} ({reason})")
+    print("Démarrage du calcul...")
+    print()
+
+    start_time = time.perf_counter()
+    pi_estimate = monte_carlo_pi_subinterpreters(args.iterations, num_workers, args.seed,
+                                                 args.kernel)
+    execution_time = time.perf_counter() - start_time
+
+    print("=" * 60)
+    print("RÉSULTATS")
+    print("=" * 60)
+    print(f"Estimation de Pi     : {pi_estimate:.8f}")
+    print(f"Valeur réelle de Pi  : {3.14159265:.8f}")
+    print(f"Erreur               : {abs(pi_estimate - 3.14159265):.8f}")
+    print(f"Temps d'exécution    : {execution_time:.4f} secondes")
+    print(f"Itérations/seconde   : {args.iterations / execution_time:,.0f}")
+    print("=" * 60)
+
+    return {
+        'pi_estimate': pi_estimate,
+        'execution_time': execution_time,
+        'iterations': args.iterations,
+        'num_workers': num_workers,
+        'engine': engine,
+        'kernel': args.kernel,
+        'seed': args.seed,
+        'iterations_per_second': args.iterations / execution_time
+    }
+
+
+if __name__ == "__main__":
+    # Nécessaire pour Windows (repli multiprocessing)
+    mp.freeze_support()
+    main()
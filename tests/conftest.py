@@ -0,0 +1,18 @@
+"""
+Fixtures partagées des tests.
+"""
+import pytest
+
+
+@pytest.fixture
+def backends_results():
+    """
+    Fabrique de résultats au format compare_backends.
+
+    Returns:
+        Fonction (times, workers=2) -> résultats d'une configuration thread [numpy]
+    """
+    def make(times, workers=2):
+        return {'runs': [{'backend': 'thread', 'kernel': 'numpy', 'workers': workers,
+                          'iterations': 1000, 'times': times}]}
+    return make
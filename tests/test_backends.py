@@ -0,0 +1,59 @@
+"""
+Tests de la résolution des moteurs à partir du profil de la machine.
+"""
+import os
+import sys
+import shutil
+import tempfile
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from backends import choose_backend, resolve_backend
+from host_profile import save_profile
+
+
+def _measurements(backend_workers):
+    """Mesures de calibration (workers, débit) à la taille de bloc par défaut."""
+    return [{'workers': w, 'chunk_size': 65_536, 'throughput': t} for w, t in backend_workers]
+
+
+class TestProfileResolution:
+    """Moteurs explicites et mode auto avec un profil calibré au noyau numpy."""
+
+    @pytest.fixture(autouse=True)
+    def profile(self, monkeypatch):
+        """Profil : numpy séquentiel, threads de 1 à 8, processus de 1 à 8."""
+        self.test_dir = tempfile.mkdtemp()
+        path = os.path.join(self.test_dir, 'profiles.json')
+        monkeypatch.setenv('MONTE_CARLO_PROFILE', path)
+        thread = _measurements([(1, 10.0), (2, 19.0), (4, 30.0), (8, 33.0)])
+        process = _measurements([(1, 9.0), (2, 17.0), (4, 32.0), (8, 40.0)])
+        save_profile({'backends': {
+            'numpy:numpy': {'workers': None, 'chunk_size': 65_536, 'throughput': 12.0,
+                            'measurements': _measurements([(None, 12.0)])},
+            'thread:numpy': {'workers': 8, 'chunk_size': 65_536, 'throughput': 33.0,
+                             'measurements': thread},
+            'process:numpy': {'workers': 8, 'chunk_size': 262_144, 'throughput': 40.0,
+                              'measurements': process},
+        }}, path)
+        yield
+        shutil.rmtree(self.test_dir)
+
+    def test_explicit_backend_uses_calibrated_kernel(self):
+        """Sans noyau demandé, le moteur thread prend le noyau et les workers calibrés."""
+        assert resolve_backend(10 ** 8, 'thread') == ('thread', 8, 'numpy')
+        assert resolve_backend(10 ** 8, 'process') == ('process', 8, 'numpy')
+
+    def test_uncalibrated_kernel_keeps_cpu_count(self):
+        """Noyau demandé mais non calibré : nombre de CPU."""
+        assert resolve_backend(10 ** 8, 'thread', kernel='python') == \
+            ('thread', os.cpu_count() or 4, 'python')
+
+    def test_auto_depends_on_size(self):
+        """Le mode auto borne les workers par la taille du calcul."""
+        assert choose_backend(1_000_000, cpu_count=8) == ('numpy', None, 'numpy')
+        assert choose_backend(5_000_000, cpu_count=8) == ('thread', 2, 'numpy')
+        assert choose_backend(10_000_000, cpu_count=8) == ('process', 4, 'numpy')
+        assert choose_backend(10 ** 9, cpu_count=8) == ('process', 8, 'numpy')
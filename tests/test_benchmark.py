@@ -0,0 +1,136 @@
+"""
+Tests des statistiques du harnais de mesure.
+"""
+import os
+import sys
+import math
+import itertools
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from benchmark import (bootstrap_ci, find_outliers, mann_whitney_min_p, mann_whitney_min_runs,
+                       mann_whitney_u, quartiles, speedup_ci, summarize_times)
+
+
+def brute_force_p_value(sample, reference):
+    """
+    p-valeur unilatérale P(U ≤ u) par énumération de toutes les répartitions.
+
+    Sous l'hypothèse nulle, chaque choix des positions de `sample` parmi
+    les valeurs regroupées est équiprobable ; U compte les couples où la
+    valeur de `sample` dépasse celle de `reference` (ex aequo : 0.5).
+    """
+    def u_statistic(first, second):
+        return sum(1.0 if a > b else 0.5 if a == b else 0.0 for a in first for b in second)
+
+    pooled = list(sample) + list(reference)
+    observed = u_statistic(sample, reference)
+    count = 0
+    total = 0
+    for positions in itertools.combinations(range(len(pooled)), len(sample)):
+        chosen = set(positions)
+        first = [pooled[i] for i in positions]
+        second = [pooled[i] for i in range(len(pooled)) if i not in chosen]
+        total += 1
+        count += u_statistic(first, second) <= observed + 1e-9
+    return observed, count / total
+
+
+class TestMannWhitney:
+    """Test de Mann-Whitney : loi exacte et approximation normale."""
+
+    @pytest.mark.parametrize('sample, reference', [
+        ([1.0, 2.0, 3.0], [4.0, 5.0, 6.0]),
+        ([4.0, 1.0, 6.0], [2.0, 5.0, 3.0]),
+        ([0.3, 0.9, 0.1, 0.7], [0.5, 0.2, 0.8, 0.6, 0.4]),
+        ([10.0, 11.0], [1.0, 2.0, 3.0, 4.0]),
+    ])
+    def test_exact_matches_brute_force(self, sample, reference):
+        """Loi exacte (sans ex aequo) : p-valeur identique à l'énumération."""
+        u, p_value = mann_whitney_u(sample, reference)
+        expected_u, expected_p = brute_force_p_value(sample, reference)
+        assert u == expected_u
+        assert p_value == pytest.approx(expected_p)
+
+    def test_normal_approximation_with_ties(self):
+        """Avec des ex aequo, l'approximation normale reste proche de l'énumération."""
+        sample = [1, 2, 2, 3, 3, 3, 4, 5]
+        reference = [2, 3, 4, 4, 5, 5, 6, 6]
+        u, p_value = mann_whitney_u(sample, reference)
+        expected_u, expected_p = brute_force_p_value(sample, reference)
+        assert u == expected_u
+        assert p_value == pytest.approx(expected_p, abs=0.02)
+
+    def test_large_samples_use_normal_approximation(self):
+        """Grandes séries : p-valeur de l'approximation normale, bornée dans [0, 1]."""
+        rng = np.random.default_rng(0)
+        slower = list(rng.normal(0.0, 1.0, 60))
+        faster = list(rng.normal(1.0, 1.0, 60))
+        _, p_value = mann_whitney_u(slower, faster)
+        assert 0.0 <= p_value < 1e-4
+        _, p_value = mann_whitney_u(faster, slower)
+        assert p_value > 0.999
+
+    def test_minimum_p_value(self):
+        """p minimale 1 / C(n1 + n2, n1) : 0.05 pour 3 runs de chaque côté."""
+        assert mann_whitney_min_p(3, 3) == pytest.approx(1 / math.comb(6, 3))
+        assert mann_whitney_min_p(4, 5) == pytest.approx(1 / math.comb(9, 4))
+        assert mann_whitney_min_p(0, 5) == 1.0
+
+    def test_minimum_runs(self):
+        """Nombre minimal de runs par côté pour conclure au seuil donné."""
+        assert mann_whitney_min_runs(0.05) == 4
+        assert mann_whitney_min_runs(0.01) == 5
+        assert mann_whitney_min_runs(0.001) == 7
+        with pytest.raises(ValueError):
+            mann_whitney_min_runs(0.0)
+
+
+class TestRobustStatistics:
+    """Quartiles, valeurs aberrantes et intervalles bootstrap."""
+
+    def test_quartiles(self):
+        """Quartiles inclusifs."""
+        assert quartiles([1.0, 2.0, 3.0, 4.0, 5.0]) == (2.0, 3.0, 4.0)
+        assert quartiles([7.0]) == (7.0, 7.0, 7.0)
+
+    def test_tukey_outliers(self):
+        """Barrières de Tukey : [Q1 - 1.5 IQR, Q3 + 1.5 IQR] = [-1, 7]."""
+        assert find_outliers([1.0, 2.0, 3.0, 4.0, 100.0]) == [4]
+        assert find_outliers([-5.0, 1.0, 2.0, 3.0, 4.0]) == [0]
+        assert find_outliers([1.0, 2.0, 3.0, 4.0, 5.0]) == []
+        # Barrière extrême (k = 3) : 10 n'est plus aberrant
+        assert find_outliers([1.0, 2.0, 3.0, 4.0, 10.0], fence=3) == []
+
+    def test_bootstrap_ci_constant_and_single(self):
+        """Valeurs constantes ou uniques : intervalle réduit à la valeur."""
+        assert bootstrap_ci([2.5] * 10) == (2.5, 2.5)
+        assert bootstrap_ci([4.0]) == (4.0, 4.0)
+
+    def test_bootstrap_ci_width(self):
+        """IC95 de la médiane d'une normale : demi-largeur ≈ 1.96 × 1.2533 σ / √n."""
+        values = np.random.default_rng(1).normal(10.0, 1.0, 400)
+        low, high = bootstrap_ci(values)
+        expected_half_width = 1.96 * 1.2533 / math.sqrt(len(values))
+        assert low < np.median(values) < high
+        assert (high - low) / 2 == pytest.approx(expected_half_width, rel=0.35)
+        # Rééchantillonnage reproductible à graine égale
+        assert bootstrap_ci(values) == (low, high)
+
+    def test_speedup_ci(self):
+        """Speedup = rapport des médianes ; intervalle réduit si les temps sont constants."""
+        assert speedup_ci([2.0] * 5, [1.0] * 5) == (2.0, 2.0, 2.0)
+        speedup, low, high = speedup_ci([2.0, 2.1, 1.9, 2.2, 2.0], [1.0, 1.1, 0.9, 1.0, 1.05])
+        assert speedup == pytest.approx(2.0)
+        assert low <= speedup <= high
+
+    def test_summarize_times(self):
+        """Résumé : médiane, IQR et valeurs aberrantes."""
+        summary = summarize_times([1.0, 2.0, 3.0, 4.0, 100.0])
+        assert summary['median_time'] == 3.0
+        assert summary['iqr_time'] == 2.0
+        assert summary['outliers'] == [4]
+        assert summary['min_time'] == 1.0 and summary['max_time'] == 100.0
@@ -0,0 +1,47 @@
+"""
+Tests du fichier de reprise.
+"""
+import os
+import sys
+import shutil
+import tempfile
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from checkpoint import Checkpoint
+
+
+class TestCheckpoint:
+    """Création, enregistrement et reprise d'un run."""
+
+    def setup_method(self):
+        """Prépare un fichier de reprise avec un bloc terminé sur 16."""
+        self.test_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.test_dir, 'run.ckpt')
+        ckpt = Checkpoint.open(self.path, 1_000, 1234, 'numpy', 16)
+        ckpt.record(3, 50, 62)
+        ckpt.save()
+
+    def teardown_method(self):
+        """Nettoie le dossier temporaire."""
+        shutil.rmtree(self.test_dir)
+
+    def test_resume_reads_chunks_and_entropy(self):
+        """Sans valeur explicite, la reprise relit le nombre de blocs et l'entropie."""
+        ckpt = Checkpoint.open(self.path, 1_000, None, 'numpy', None, resume=True)
+        assert ckpt.num_chunks == 16
+        assert ckpt.entropy == 1234
+        assert ckpt.totals() == (50, 62, 0.0)
+        assert 3 not in ckpt.pending() and len(ckpt.pending()) == 15
+
+    def test_resume_rejects_other_chunk_count(self):
+        """Un nombre de blocs explicite différent de celui du fichier est refusé."""
+        with pytest.raises(ValueError, match='num_chunks'):
+            Checkpoint.open(self.path, 1_000, None, 'numpy', 24, resume=True)
+
+    def test_new_run_requires_chunk_count(self):
+        """Un nouveau run doit fixer son nombre de blocs."""
+        with pytest.raises(ValueError):
+            Checkpoint.open(self.path, 1_000, 1234, 'numpy', None)
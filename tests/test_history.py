@@ -0,0 +1,86 @@
+"""
+Tests de l'historique des benchmarks (JSON Lines).
+"""
+import os
+import sys
+import json
+import shutil
+import tempfile
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from history import (HISTORY_VERSION, append_results, configuration_trend, iter_records,
+                     list_configurations, make_record)
+
+
+class TestHistory:
+    """Ajout, lecture filtrée et suivi d'une configuration."""
+
+    @pytest.fixture(autouse=True)
+    def history_file(self, backends_results):
+        """Écrit un historique de trois runs à des dates, machines et révisions connues."""
+        self.test_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.test_dir, 'history.jsonl')
+        lines = [
+            ('2024-01-01T10:00:00+00:00', 'backends', 'host-a', 'aaaa1111', [1.0, 2.0, 4.0]),
+            ('2024-02-01T10:00:00+00:00', 'backends', 'host-b', 'bbbb2222', [0.5, 0.5, 0.5]),
+            ('2024-03-01T10:00:00+00:00', 'scaling', 'host-a', 'cccc3333', [1.0]),
+        ]
+        with open(self.path, 'w', encoding='utf-8') as f:
+            for timestamp, kind, host, commit, times in lines:
+                record = make_record(kind, backends_results(times))
+                record.update({'timestamp': timestamp, 'host_fingerprint': host,
+                               'git': {'commit': commit, 'dirty': False}})
+                f.write(json.dumps(record) + '\n')
+        yield
+        shutil.rmtree(self.test_dir)
+
+    def test_filters(self):
+        """Filtres par type, machine, date et révision."""
+        assert len(list(iter_records(self.path))) == 3
+        assert len(list(iter_records(self.path, kind='backends'))) == 2
+        assert [r['git']['commit'] for r in iter_records(self.path, host='host-a')] == \
+            ['aaaa1111', 'cccc3333']
+        assert [r['timestamp'][:10] for r in iter_records(self.path, since='2024-02-01',
+                                                          until='2024-03-01')] == ['2024-02-01']
+        assert [r['kind'] for r in iter_records(self.path, commit='bbbb')] == ['backends']
+
+    def test_skips_corrupt_and_foreign_lines(self):
+        """Ligne tronquée ou d'une autre version : ignorée."""
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps({'version': HISTORY_VERSION + 1, 'kind': 'backends'}) + '\n')
+            f.write('{"version": 1, "ki')
+        assert len(list(iter_records(self.path))) == 3
+
+    def test_missing_file(self):
+        """Historique absent : aucun run."""
+        assert list(iter_records(os.path.join(self.test_dir, 'absent.jsonl'))) == []
+
+    def test_configuration_trend(self):
+        """Débit médian par run, dans l'ordre ; les types non suivis sont ignorés."""
+        trend = configuration_trend('thread [numpy] x2', self.path)
+        # Débits des runs : 1000 / t ; médianes 500 puis 2000 (le run 'scaling' est ignoré)
+        assert [point['throughput'] for point in trend] == [pytest.approx(500.0),
+                                                            pytest.approx(2000.0)]
+        assert [point['commit'] for point in trend] == ['aaaa1111', 'bbbb2222']
+        assert [point['num_runs'] for point in trend] == [3, 3]
+        assert configuration_trend('thread [numpy] x2', self.path, host='host-b')[0][
+            'host_fingerprint'] == 'host-b'
+        assert configuration_trend('process [numpy] x2', self.path) == []
+
+    def test_list_configurations(self):
+        """Nombre de runs archivés par configuration suivie."""
+        assert list_configurations(self.path) == {'thread [numpy] x2': 2}
+
+    def test_append_results(self, backends_results):
+        """L'ajout écrit une ligne complète à la fin, sans toucher aux précédentes."""
+        path = os.path.join(self.test_dir, 'sub', 'new.jsonl')
+        append_results('backends', backends_results([1.0, 1.0]), path)
+        append_results('backends', backends_results([2.0, 2.0], workers=4), path)
+        records = list(iter_records(path))
+        assert [r['kind'] for r in records] == ['backends', 'backends']
+        assert records[0]['version'] == HISTORY_VERSION
+        assert records[0]['python']['version'] and records[0]['host_fingerprint']
+        assert list_configurations(path) == {'thread [numpy] x2': 1, 'thread [numpy] x4': 1}
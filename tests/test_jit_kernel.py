@@ -0,0 +1,50 @@
+"""
+Tests du noyau compilé (Numba).
+"""
+import os
+import sys
+import subprocess
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from jit_kernel import JIT_CACHE_DIR, NUMBA_AVAILABLE
+
+ROOT = os.path.join(os.path.dirname(__file__), '..')
+
+requires_numba = pytest.mark.skipif(not NUMBA_AVAILABLE, reason='Numba non installé')
+
+
+def test_import_leaves_environment_untouched():
+    """L'import ne définit pas NUMBA_CACHE_DIR pour le reste du programme."""
+    env = {k: v for k, v in os.environ.items() if k != 'NUMBA_CACHE_DIR'}
+    code = "import os, jit_kernel; print('NUMBA_CACHE_DIR' in os.environ)"
+    output = subprocess.run([sys.executable, '-c', code], cwd=ROOT, env=env,
+                            capture_output=True, text=True, check=True).stdout
+    assert output.strip() == 'False'
+
+
+@requires_numba
+def test_cache_scoped_to_module_kernels():
+    """Les noyaux du module utilisent leur dossier de cache, la config de Numba est restaurée."""
+    import numba
+    import jit_kernel
+    cache_path = jit_kernel._count_serial._cache._impl.locator.get_cache_path()
+    assert cache_path.startswith(JIT_CACHE_DIR)
+    assert numba.config.CACHE_DIR == os.environ.get('NUMBA_CACHE_DIR', '')
+
+
+@requires_numba
+def test_default_threads_restored():
+    """Sans num_threads, le noyau parallèle repasse sur tous les threads."""
+    # Dans un processus séparé : une fois le pool de threads de Numba lancé,
+    # les tests qui forkent un pool de processus bloqueraient la sortie de pytest
+    code = ("import numba, jit_kernel as j; "
+            "j.monte_carlo_pi_jit(10_000, num_threads=1, seed=0); a = numba.get_num_threads(); "
+            "j.monte_carlo_pi_jit(10_000, seed=0); "
+            "print(a, numba.get_num_threads(), j.jit_thread_count())")
+    env = dict(os.environ, NUMBA_NUM_THREADS='2')
+    output = subprocess.run([sys.executable, '-c', code], cwd=ROOT, env=env,
+                            capture_output=True, text=True, check=True).stdout
+    assert output.split() == ['1', '2', '2']
@@ -0,0 +1,138 @@
+"""
+Tests des noyaux de monte_carlo_core.
+"""
+import os
+import sys
+import math
+import time
+import statistics
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from monte_carlo_core import (count_inside, count_until_deadline, iter_batch_sizes, make_rng,
+                              pi_standard_error, run_until_precision, spawn_seed_sequences,
+                              split_iterations, time_budget_result, variance_stats)
+from mono_thread import iter_batch_counts_mono
+
+
+# N volontairement non multiple de 64² : le dernier balayage est incomplet
+ITERATIONS = 200_000
+NUM_SEEDS = 40
+
+
+def _stratified_estimate(seed, num_workers):
+    """Estimation de Pi et erreur standard annoncée, un échantillonneur par worker."""
+    inside = 0
+    variance_sum = 0.0
+    for seed_sequence, n in zip(spawn_seed_sequences(seed, num_workers),
+                                split_iterations(ITERATIONS, num_workers)):
+        sampler = make_rng('stratified', seed_sequence)
+        inside += count_inside('stratified', n, sampler, chunk_size=30_000)
+        variance_sum += sampler.variance_sum()
+    stats = variance_stats(inside, ITERATIONS, variance_sum)
+    return 4 * inside / ITERATIONS, stats['stderr']
+
+
+class TestStratifiedSampler:
+    """Biais et erreur standard du noyau stratifié."""
+
+    def _check(self, num_workers):
+        runs = [_stratified_estimate(seed, num_workers) for seed in range(NUM_SEEDS)]
+        errors = [estimate - math.pi for estimate, _ in runs]
+        spread = statistics.stdev(errors)
+
+        # Sans biais : l'erreur moyenne reste dans ±4 erreurs standard de la moyenne
+        assert abs(statistics.mean(errors)) < 4 * spread / math.sqrt(NUM_SEEDS)
+        # L'erreur standard annoncée correspond à la dispersion observée
+        assert 0.6 < statistics.mean(stderr for _, stderr in runs) / spread < 1.6
+
+    def test_unbiased_single_worker(self):
+        """Un seul échantillonneur, balayage final incomplet."""
+        self._check(1)
+
+    def test_unbiased_split_workers(self):
+        """Un échantillonneur par worker, chacun finit sur un balayage incomplet."""
+        self._check(4)
+
+    def test_counts_cover_strata_evenly(self):
+        """Chaque strate reçoit le même nombre de points, à un près."""
+        sampler = make_rng('stratified', spawn_seed_sequences(0, 1)[0])
+        count_inside('stratified', ITERATIONS, sampler, chunk_size=7_777)
+        assert sampler.counts.sum() == ITERATIONS
+        assert sampler.counts.max() - sampler.counts.min() <= 1
+
+
+class TestRunUntilPrecision:
+    """Règle d'arrêt de la précision adaptative."""
+
+    def test_binomial_without_kernel_variance(self):
+        """Sans variance propre au noyau, l'erreur standard est binomiale."""
+        result = run_until_precision([(785, 1000, None)], target_error=1.0)
+        assert result['stderr'] == pytest.approx(4 * math.sqrt(0.785 * 0.215 / 1000))
+
+    def test_sums_kernel_variance_contributions(self):
+        """Les contributions des lots s'additionnent : Var(Pi) = 16 ΣV / N²."""
+        result = run_until_precision([(780, 1000, 10.0), (790, 1000, 6.0)], target_error=1e-9)
+        assert result['stderr'] == pytest.approx(4 * math.sqrt(16.0) / 2000)
+
+    def test_stratified_stops_earlier(self):
+        """Le noyau stratifié atteint la cible avec bien moins de points que numpy."""
+        used = {}
+        for kernel in ('numpy', 'stratified'):
+            batches = iter_batch_counts_mono(100_000, kernel, seed=3)
+            result = run_until_precision(batches, target_error=0.002)
+            assert result['target_reached']
+            used[kernel] = result['iterations']
+        assert used['stratified'] * 5 < used['numpy']
+
+
+class TestChunkSize:
+    """Taille de bloc des noyaux découpés en blocs."""
+
+    @pytest.mark.parametrize('kernel', ['numpy', 'integer', 'halton', 'stratified', 'antithetic'])
+    @pytest.mark.parametrize('chunk_size', [0, -1])
+    def test_rejects_non_positive(self, kernel, chunk_size):
+        """Un bloc vide ou négatif est refusé au lieu de boucler sans fin."""
+        with pytest.raises(ValueError):
+            count_inside(kernel, 1000, make_rng(kernel), chunk_size)
+
+    def test_deadline_rejects_non_positive(self):
+        """Le mode budget de temps refuse aussi un bloc vide."""
+        with pytest.raises(ValueError):
+            count_until_deadline('numpy', make_rng('numpy'), time.monotonic() + 1.0, 0)
+
+
+class TestTimeBudget:
+    """Erreur standard du mode budget de temps."""
+
+    def test_binomial_without_kernel_variance(self):
+        """Sans variance propre au noyau : erreur binomiale, pas de rapport de variance."""
+        result = time_budget_result(785, 1000, 1.0, 1.0)
+        assert result['stderr'] == pytest.approx(4 * math.sqrt(0.785 * 0.215 / 1000))
+        assert result['variance_stats'] is None
+
+    def test_stratified_uses_sampler_variance(self):
+        """Noyau stratifié : l'erreur annoncée tient compte de la réduction de variance."""
+        sampler = make_rng('stratified', spawn_seed_sequences(0, 1)[0])
+        inside, iterations, variance_sum = count_until_deadline(
+            'stratified', sampler, time.monotonic() + 0.2)
+        result = time_budget_result(inside, iterations, 0.2, 0.2, variance_sum)
+        assert result['variance_stats']['variance_reduction'] > 5
+        assert result['stderr'] < pi_standard_error(inside, iterations) / 2
+
+
+class TestBatchSizes:
+    """Découpage d'un calcul en flux."""
+
+    def test_truncates_last_batch(self):
+        """Le dernier lot est tronqué au total demandé."""
+        assert list(iter_batch_sizes(4, 10)) == [4, 4, 2]
+        assert list(iter_batch_sizes(4, 0)) == []
+
+    @pytest.mark.parametrize('total', [None, 10])
+    def test_rejects_non_positive(self, total):
+        """Un lot vide est refusé, avec ou sans total."""
+        with pytest.raises(ValueError):
+            next(iter_batch_sizes(0, total))
@@ -0,0 +1,36 @@
+"""
+Tests du pool persistant de multiprocessing_version.
+"""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from multiprocessing_version import MonteCarloPool
+
+
+@pytest.mark.parametrize('kernel', ['numpy', 'stratified', 'antithetic'])
+def test_shared_memory_matches_dynamic(kernel):
+    """Compteurs partagés et mode dynamique : même estimation, même variance."""
+    with MonteCarloPool(2, kernel=kernel) as pool:
+        dynamic = pool.estimate(300_000, seed=7, schedule='dynamic')
+        dynamic_stats = pool.last_stats
+        shared = pool.estimate_shared(300_000, seed=7)
+        shared_stats = pool.last_stats
+
+    assert shared == dynamic
+    assert shared_stats['variance'] == pytest.approx(dynamic_stats['variance'])
+    if kernel != 'numpy':
+        assert shared_stats['variance_reduction'] > 1.1
+
+
+def test_time_budget_starts_pool():
+    """Le mode budget de temps démarre le pool s'il ne l'est pas encore."""
+    pool = MonteCarloPool(1, kernel='numpy')
+    try:
+        result = pool.estimate_time_budget(0.2, seed=1)
+    finally:
+        pool.close()
+    assert result['iterations'] > 0
@@ -0,0 +1,60 @@
+"""
+Tests du contrôle de régression.
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from regression import compare_results, extract_configurations
+
+
+class TestExtractConfigurations:
+    """Lecture des différents formats de résultats."""
+
+    def test_benchmark_format(self):
+        """compare_performance : mono, threads et processus par noyau."""
+        results = {'by_kernel': {'numpy': {
+            'mono_thread': {'iterations': 10, 'times': [1.0]},
+            'multi_thread': [{'num_threads': 2, 'iterations': 10, 'times': [0.6]}],
+            'multiprocessing': [{'num_processes': 2, 'iterations': 10, 'times': [0.5]}],
+        }}}
+        assert sorted(extract_configurations(results)) == \
+            ['mono [numpy]', 'process [numpy] x2', 'thread [numpy] x2']
+
+    def test_sweep_format(self):
+        """Balayage : une série par moteur, workers et taille."""
+        results = {'schema': 'monte_carlo_pi.sweep', 'runs': [
+            {'backend': 'thread', 'kernel': 'numpy', 'workers': 2, 'iterations': 1000,
+             'wall_time': t} for t in (1.0, 1.1)]}
+        assert extract_configurations(results) == {
+            'thread [numpy] x2 N=1,000': {'iterations': 1000, 'times': [1.0, 1.1]}}
+
+
+class TestCompareResults:
+    """Seuil, significativité et nombre de runs."""
+
+    def test_detects_regression(self, backends_results):
+        """Débit en baisse de 33 % sur 5 runs : régression."""
+        baseline = backends_results([1.0, 1.01, 1.02, 1.03, 1.04])
+        new = backends_results([1.5, 1.51, 1.52, 1.53, 1.54])
+        [comparison] = compare_results(baseline, new)
+        assert comparison['testable']
+        assert comparison['regression']
+        assert comparison['delta'] < -0.3
+
+    def test_too_few_runs_is_untestable(self, backends_results):
+        """3 runs par côté : p ≥ 0.05, la configuration est non testable."""
+        baseline = backends_results([1.0, 1.01, 1.02])
+        new = backends_results([1.5, 1.51, 1.52])
+        [comparison] = compare_results(baseline, new)
+        assert comparison['min_p_value'] == 0.05
+        assert not comparison['testable']
+        assert not comparison['regression']
+
+    def test_small_drop_within_threshold(self, backends_results):
+        """Baisse de 2 % sous le seuil de 5 % : pas de régression."""
+        baseline = backends_results([1.0, 1.001, 1.002, 1.003, 1.004])
+        new = backends_results([t * 1.02 for t in [1.0, 1.001, 1.002, 1.003, 1.004]])
+        [comparison] = compare_results(baseline, new)
+        assert not comparison['regression']
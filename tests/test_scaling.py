@@ -0,0 +1,84 @@
+"""
+Tests des lois d'Amdahl et de Gustafson.
+"""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from scaling import (amdahl_speedup, fit_amdahl, fit_gustafson, gustafson_speedup,
+                     useful_workers)
+
+
+WORKERS = [1, 2, 4, 8, 16]
+
+
+class TestAmdahl:
+    """Ajustement de la fraction séquentielle d'Amdahl."""
+
+    def test_recovers_known_serial_fraction(self):
+        """Speedups exacts pour s = 0.1 : s, plafond 10x et R² = 1 retrouvés."""
+        speedups = [amdahl_speedup(0.1, p) for p in WORKERS]
+        fit = fit_amdahl(WORKERS, speedups)
+        assert fit['serial_fraction'] == pytest.approx(0.1)
+        assert fit['max_speedup'] == pytest.approx(10.0)
+        assert fit['r_squared'] == pytest.approx(1.0)
+
+    def test_noisy_measurements(self):
+        """Mesures bruitées (±2 %) : s reste proche de la vraie valeur."""
+        noise = [1.0, 1.02, 0.98, 1.01, 0.99]
+        speedups = [amdahl_speedup(0.05, p) * e for p, e in zip(WORKERS, noise)]
+        fit = fit_amdahl(WORKERS, speedups)
+        assert fit['serial_fraction'] == pytest.approx(0.05, abs=0.01)
+        assert fit['r_squared'] > 0.95
+
+    def test_perfect_scaling(self):
+        """Speedup linéaire : s = 0, pas de plafond."""
+        fit = fit_amdahl(WORKERS, [float(p) for p in WORKERS])
+        assert fit['serial_fraction'] == 0.0
+        assert fit['max_speedup'] is None
+
+    def test_superlinear_is_clamped(self):
+        """Speedup super-linéaire : s ramené à 0 au lieu d'une valeur négative."""
+        assert fit_amdahl([1, 2, 4], [1.0, 2.2, 4.5])['serial_fraction'] == 0.0
+
+    def test_needs_more_than_one_worker(self):
+        """Aucune mesure à plus d'un worker : pas d'ajustement."""
+        assert fit_amdahl([1], [1.0]) is None
+
+
+class TestGustafson:
+    """Ajustement de la fraction séquentielle de Gustafson."""
+
+    def test_recovers_known_serial_fraction(self):
+        """Speedups à l'échelle exacts pour α = 0.2."""
+        scaled = [gustafson_speedup(0.2, p) for p in WORKERS]
+        fit = fit_gustafson(WORKERS, scaled)
+        assert fit['serial_fraction'] == pytest.approx(0.2)
+        assert fit['r_squared'] == pytest.approx(1.0)
+
+    def test_needs_more_than_one_worker(self):
+        """Aucune mesure à plus d'un worker : pas d'ajustement."""
+        assert fit_gustafson([1], [1.0]) is None
+
+
+class TestUsefulWorkers:
+    """Nombre de cœurs gardant une efficacité suffisante."""
+
+    def test_efficiency_threshold(self):
+        """s = 0.1, cible 50 % : 11 workers (efficacité 0.5), pas 12."""
+        workers = useful_workers(0.1, 0.5)
+        assert workers == 11
+        assert amdahl_speedup(0.1, workers) / workers >= 0.5 - 1e-12
+        assert amdahl_speedup(0.1, workers + 1) / (workers + 1) < 0.5
+
+    def test_unbounded_without_serial_part(self):
+        """s = 0 : aucune limite."""
+        assert useful_workers(0.0) is None
+
+    def test_fully_serial(self):
+        """s = 1 : efficacité 1 / p, un seul worker utile au-delà de 50 %."""
+        assert useful_workers(1.0, 0.6) == 1
+        assert useful_workers(1.0, 0.5) == 2
@@ -181,6 +181,142 @@ def plot_detailed_comparison(results, output_dir='graphs'):
     plt.close()
 
 
+def plot_error_vs_n(results, output_dir='graphs'):
+    """
+    Graphique 5 : Erreur (RMSE) en fonction du nombre de points, échelle log-log.
+    """
+    sizes = results['sizes']
+    
+    plt.figure(figsize=(10, 6))
+    for kernel, data in results['by_kernel'].items():
+        order = data['convergence_order']
+        label = f"{kernel} (pente {order:.2f})" if order is not None else kernel
+        plt.loglog(sizes, data['rmse'], 'o-', linewidth=2, markersize=8, label=label)
+    
+    # Référence O(1/√N) calée sur le premier point du premier noyau
+    first = next(iter(results['by_kernel'].values()))['rmse'][0]
+    reference = [first * (sizes[0] / n) ** 0.5 for n in sizes]
+    plt.loglog(sizes, reference, '--', linewidth=2, color='gray', alpha=0.7,
+               label='Référence O(1/√N)')
+    
+    plt.xlabel('Nombre de points N', fontsize=12)
+    plt.ylabel('Erreur quadratique moyenne', fontsize=12)
+    plt.title('Convergence : Pseudo-Aléatoire vs Quasi-Monte Carlo', fontsize=14, fontweight='bold')
+    plt.legend(fontsize=11)
+    plt.grid(True, which='both', alpha=0.3)
+    
+    plt.tight_layout()
+    os.makedirs(output_dir, exist_ok=True)
+    plt.savefig(f'{output_dir}/error_vs_n.png', dpi=300)
+    print(f"  ✅ Graphique sauvegardé : {output_dir}/error_vs_n.png")
+    plt.close()
+
+
+def plot_sweep(results, output_dir='graphs'):
+    """
+    Graphique 6 : Débit en fonction du nombre de workers, un panneau par taille.
+    
+    Lit la synthèse au format long de comparison.run_sweep : chaque couple
+    (moteur, noyau) présent dans les lignes devient une courbe, sans liste
+    de moteurs codée en dur.
+    """
+    if results.get('schema_version') != 1:
+        raise ValueError(f"Version de schéma non supportée : {results.get('schema_version')!r}")
+    
+    rows = results['summaries']
+    sizes = sorted({row['iterations'] for row in rows})
+    logical_cpus = results['host']['logical_cpus']
+    
+    fig, axes = plt.subplots(1, len(sizes), figsize=(7 * len(sizes), 6), squeeze=False)
+    for ax, size in zip(axes[0], sizes):
+        series = {}
+        for row in rows:
+            if row['iterations'] == size:
+                series.setdefault(f"{row['backend']} [{row['kernel']}]", []).append(row)
+        
+        for label, points in series.items():
+            points.sort(key=lambda row: row['workers'])
+            workers = [row['workers'] for row in points]
+            throughput = np.array([row['throughput'] for row in points])
+            # Barres d'erreur : intervalle de confiance de la médiane, en débit
+            low = np.array([size / row['ci_high'] for row in points])
+            high = np.array([size / row['ci_low'] for row in points])
+            ax.errorbar(workers, throughput, yerr=[throughput - low, high - throughput],
+                        fmt='o-', linewidth=2, markersize=7, capsize=4, label=label)
+        
+        ax.axvline(logical_cpus, color='gray', linestyle='--', alpha=0.7,
+                   label=f'{logical_cpus} cœurs logiques')
+        ax.set_xscale('log', base=2)
+        ax.set_yscale('log')
+        ax.set_xlabel('Nombre de workers', fontsize=12)
+        ax.set_ylabel('Débit (points/s)', fontsize=12)
+        ax.set_title(f'N = {size:,}', fontsize=13, fontweight='bold')
+        ax.grid(True, which='both', alpha=0.3)
+        ax.legend(fontsize=10)
+    
+    fig.suptitle('Balayage moteurs × workers × tailles', fontsize=14, fontweight='bold')
+    plt.tight_layout()
+    os.makedirs(output_dir, exist_ok=True)
+    plt.savefig(f'{output_dir}/sweep_throughput.png', dpi=300)
+    print(f"  ✅ Graphique sauvegardé : {output_dir}/sweep_throughput.png")
+    plt.close()
+
+
+def plot_scaling(results, output_dir='graphs'):
+    """
+    Graphique 7 : Scaling fort (Amdahl) et faible (Gustafson), mesures et ajustements.
+    """
+    if results.get('schema_version') != 1:
+        raise ValueError(f"Version de schéma non supportée : {results.get('schema_version')!r}")
+    
+    fig, (ax_strong, ax_weak) = plt.subplots(1, 2, figsize=(15, 6))
+    max_workers = max(results['parameters']['worker_counts'])
+    fitted = np.linspace(1, max_workers, 200)
+    
+    # Anciens fichiers : toutes les mesures étaient ajustées
+    fit_max_workers = results['parameters'].get('fit_max_workers', max_workers)
+    
+    for study in results['studies']:
+        label = f"{study['backend']} [{study['kernel']}]"
+        for ax, rows, key in ((ax_strong, study['strong'], 'speedup'),
+                              (ax_weak, study['weak'], 'scaled_speedup')):
+            # Points pleins : ajustés ; points creux : hors ajustement
+            fitted_rows = [row for row in rows if row.get('fitted', True)]
+            other_rows = [row for row in rows if not row.get('fitted', True)]
+            line = ax.plot([row['workers'] for row in fitted_rows],
+                           [row[key] for row in fitted_rows], 'o', markersize=8, label=label)[0]
+            if other_rows:
+                ax.plot([row['workers'] for row in other_rows], [row[key] for row in other_rows],
+                        'o', markersize=8, markerfacecolor='none', color=line.get_color())
+            if ax is ax_strong and study['amdahl'] is not None:
+                s = study['amdahl']['serial_fraction']
+                ax.plot(fitted, 1 / (s + (1 - s) / fitted), '-', color=line.get_color(),
+                        alpha=0.7, label=f"Amdahl s = {s:.3f}")
+            if ax is ax_weak and study['gustafson'] is not None:
+                alpha = study['gustafson']['serial_fraction']
+                ax.plot(fitted, fitted - alpha * (fitted - 1), '-', color=line.get_color(),
+                        alpha=0.7, label=f"Gustafson α = {alpha:.3f}")
+    
+    for ax, title, ylabel in ((ax_strong, 'Scaling fort (travail total fixe)', 'Speedup'),
+                              (ax_weak, 'Scaling faible (travail par worker fixe)',
+                               'Speedup à l\'échelle')):
+        ax.plot(fitted, fitted, '--', color='gray', alpha=0.7, label='Idéal')
+        if fit_max_workers < max_workers:
+            ax.axvline(fit_max_workers, color='gray', linestyle=':', alpha=0.7,
+                       label=f'Limite d\'ajustement ({fit_max_workers} workers)')
+        ax.set_xlabel('Nombre de workers', fontsize=12)
+        ax.set_ylabel(ylabel, fontsize=12)
+        ax.set_title(title, fontsize=13, fontweight='bold')
+        ax.grid(True, alpha=0.3)
+        ax.legend(fontsize=10)
+    
+    plt.tight_layout()
+    os.makedirs(output_dir, exist_ok=True)
+    plt.savefig(f'{output_dir}/scaling_study.png', dpi=300)
+    print(f"  ✅ Graphique sauvegardé : {output_dir}/scaling_study.png")
+    plt.close()
+
+
 def generate_all_graphs(results_file='results/benchmark_results.json', output_dir='graphs'):
     """
     Génère tous les graphiques.